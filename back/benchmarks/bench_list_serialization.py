@@ -0,0 +1,135 @@
+"""
+Benchmark da serialização de `GET /produtos/` com 10 mil produtos.
+
+Compara duas formas de responder com a mesma lista de DTOs:
+- **padrão**: devolve os DTOs e deixa o FastAPI validá-los novamente
+  contra o `response_model` e serializá-los com `JSONResponse`;
+- **DTOResponse**: devolve os DTOs já construídos como `DTOResponse`,
+  serializados diretamente para bytes, sem nova validação.
+
+São medidos dois cenários: a requisição completa (consulta + DTOs +
+resposta) e apenas a camada de resposta, com a lista de DTOs já pronta.
+
+Uso (a partir de `back/`):
+```bash
+python -m benchmarks.bench_list_serialization
+```
+"""
+
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import src.main  # noqa: F401  (registra todos os modelos)
+from src.api.endpoints.produto import get_produto_service
+from src.api.responses import DTOResponse
+from src.core.database import Base, get_db
+from src.dto.produto_dto import ProdutoRead
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+from src.services.produto_service import ProdutoService
+
+ROWS = 10_000
+REPEAT = 10
+
+
+def _seed(db) -> None:
+    supplier = UserRepository(db).create_user("F", "bench@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua", city="C", state="UF", zip_code="0"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca"
+    )
+    ProdutoRepository(db).bulk_create_produtos(
+        [
+            {"banca_id": banca.id, "nome": f"Produto {i}", "preco": i / 100}
+            for i in range(ROWS)
+        ]
+    )
+    db.commit()
+
+
+def _build_app(session_factory, items) -> FastAPI:
+    app = FastAPI()
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    @app.get("/padrao", response_model=list[ProdutoRead], response_class=JSONResponse)
+    def padrao(service: ProdutoService = Depends(get_produto_service)):
+        return service.list_produtos()
+
+    @app.get("/dto", response_model=list[ProdutoRead])
+    def dto(service: ProdutoService = Depends(get_produto_service)):
+        return DTOResponse(service.list_produtos())
+
+    @app.get(
+        "/padrao/resposta",
+        response_model=list[ProdutoRead],
+        response_class=JSONResponse,
+    )
+    def padrao_resposta():
+        return items
+
+    @app.get("/dto/resposta", response_model=list[ProdutoRead])
+    def dto_resposta():
+        return DTOResponse(items)
+
+    return app
+
+
+def _best_ms(client: TestClient, path: str) -> float:
+    client.get(path)
+    tempos = []
+    for _ in range(REPEAT):
+        inicio = time.perf_counter()
+        response = client.get(path)
+        tempos.append(time.perf_counter() - inicio)
+        assert response.status_code == 200
+    return min(tempos) * 1000
+
+
+def main() -> None:
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    with factory() as db:
+        _seed(db)
+        items = ProdutoService(
+            ProdutoRepository(db), BancaRepository(db)
+        ).list_produtos()
+
+    client = TestClient(_build_app(factory, items))
+    assert client.get("/padrao").json() == client.get("/dto").json()
+
+    print(f"GET /produtos/ com {ROWS} linhas (melhor de {REPEAT}):")
+    for titulo, sufixo in (
+        ("requisição completa", ""),
+        ("camada de resposta", "/resposta"),
+    ):
+        padrao = _best_ms(client, "/padrao" + sufixo)
+        dto = _best_ms(client, "/dto" + sufixo)
+        print(f"  {titulo}:")
+        print(f"    padrão (revalida + json): {padrao:8.1f} ms")
+        print(f"    DTOResponse:              {dto:8.1f} ms")
+        print(f"    economia:                 {padrao - dto:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
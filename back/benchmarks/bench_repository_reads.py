@@ -0,0 +1,90 @@
+"""
+Microbenchmark das leituras frequentes dos repositórios.
+
+Compara, por chamada, a forma anterior (`db.query(Model).filter_by(...)`,
+reconstruída a cada chamada) com as consultas pré-construídas dos
+repositórios (`select()` em nível de módulo com `bindparam`).
+
+Uso (a partir de `back/`):
+```bash
+python -m benchmarks.bench_repository_reads
+```
+"""
+
+import timeit
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import src.main  # noqa: F401  (registra todos os modelos)
+from src.core.database import Base
+from src.models.produto_model import Produto
+from src.models.user import User
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+CALLS = 5000
+REPEAT = 5
+
+
+def _seed(db):
+    users = UserRepository(db)
+    supplier = users.create_user("F", "bench@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua", city="C", state="UF", zip_code="0"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca"
+    )
+    ProdutoRepository(db).bulk_create_produtos(
+        [{"banca_id": banca.id, "nome": f"P{i}", "preco": 1.0} for i in range(20)]
+    )
+    db.commit()
+    return banca.id
+
+
+def _best_us(fn) -> float:
+    best = min(timeit.repeat(fn, number=CALLS, repeat=REPEAT))
+    return best / CALLS * 1e6
+
+
+def main() -> None:
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    banca_id = _seed(db)
+
+    produtos = ProdutoRepository(db)
+    users = UserRepository(db)
+    produto_id = db.query(Produto.id).first()[0]
+
+    cases = {
+        "produto get_by_id": (
+            lambda: db.query(Produto).filter_by(id=produto_id).first(),
+            lambda: produtos.get_by_id(produto_id),
+        ),
+        "produto get_by_banca": (
+            lambda: db.query(Produto).filter_by(banca_id=banca_id).all(),
+            lambda: produtos.get_by_banca(banca_id),
+        ),
+        "user get_by_email": (
+            lambda: db.query(User).filter_by(email="bench@test.com").first(),
+            lambda: users.get_by_email("bench@test.com"),
+        ),
+    }
+
+    print(f"{'consulta':<22} {'query()':>10} {'select':>10} {'ganho':>7}")
+    for name, (legacy, cached) in cases.items():
+        antes = _best_us(legacy)
+        depois = _best_us(cached)
+        ganho = (1 - depois / antes) * 100
+        print(f"{name:<22} {antes:>8.1f}us {depois:>8.1f}us {ganho:>6.1f}%")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
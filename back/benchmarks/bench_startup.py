@@ -0,0 +1,108 @@
+"""
+Perfil de inicialização da aplicação.
+
+Executa, em processos novos (sem módulos já importados):
+- `python -X importtime -c "import src.main"`, somando o tempo próprio
+  de cada módulo por pacote de primeiro nível (`fastapi`, `sqlalchemy`,
+  `src`, ...) e listando os módulos mais caros;
+- a subida completa da aplicação (import, `lifespan` e a primeira
+  requisição), com as etapas medidas por `src.core.startup`.
+
+O banco usado é temporário, para que a criação das tabelas também seja
+medida.
+
+Uso (a partir de `back/`):
+```bash
+python -m benchmarks.bench_startup
+```
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+RUNS = 5
+TOP = 15
+
+_FIRST_REQUEST = """
+import json, time
+start = time.perf_counter()
+import src.main
+from fastapi.testclient import TestClient
+with TestClient(src.main.app) as client:
+    client.get("/produtos/")
+    elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, **src.main.profile.summary()}))
+"""
+
+
+def _run(args: List[str], database: Path) -> subprocess.CompletedProcess:
+    env = {**os.environ, "APP_DATABASE_URL": f"sqlite:///{database}"}
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _import_times(database: Path) -> List[Tuple[str, int]]:
+    """
+    Tempo próprio (µs) de cada módulo importado por `src.main`.
+    """
+    stderr = _run(["-X", "importtime", "-c", "import src.main"], database).stderr
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, _, name = line[len("import time:") :].split("|")
+        times.append((name.strip(), int(own)))
+    return times
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Uma execução descartada para gerar os arquivos .pyc.
+        _run(["-c", "import src.main"], Path(tmp) / "warmup.db")
+
+        by_package: Dict[str, List[int]] = defaultdict(list)
+        by_module: Dict[str, List[int]] = defaultdict(list)
+        for run in range(RUNS):
+            totals: Dict[str, int] = defaultdict(int)
+            for name, own in _import_times(Path(tmp) / f"import-{run}.db"):
+                totals[name.split(".")[0]] += own
+                by_module[name].append(own)
+            for package, own in totals.items():
+                by_package[package].append(own)
+
+        first_request = [
+            json.loads(_run(["-c", _FIRST_REQUEST], Path(tmp) / f"req-{run}.db").stdout)
+            for run in range(RUNS)
+        ]
+
+    def best_ms(values: List[int]) -> float:
+        return min(values) / 1000.0
+
+    print(f"Import de src.main (melhor de {RUNS}), por pacote:")
+    packages = sorted(by_package.items(), key=lambda item: -best_ms(item[1]))
+    for package, values in packages[:TOP]:
+        print(f"  {package:<28} {best_ms(values):>8.1f} ms")
+
+    print("\nMódulos com maior tempo próprio de import:")
+    modules = sorted(by_module.items(), key=lambda item: -best_ms(item[1]))
+    for name, values in modules[:TOP]:
+        print(f"  {name:<48} {best_ms(values):>8.1f} ms")
+
+    best = min(first_request, key=lambda item: item["elapsed"])
+    print(
+        f"\nAté a primeira requisição (melhor de {RUNS}): {best['elapsed'] * 1000:.0f} ms"
+    )
+    for phase, ms in best.items():
+        if phase != "elapsed":
+            print(f"  {phase:<10} {ms:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
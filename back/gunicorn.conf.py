@@ -0,0 +1,130 @@
+"""
+Configuração do servidor de produção (Gunicorn + workers Uvicorn).
+
+Uso (a partir de `back/`):
+```bash
+gunicorn -c gunicorn.conf.py src.main:app
+```
+
+Para desenvolvimento com recarga automática, utilize `make run`
+(`uvicorn --reload`).
+
+Parâmetros ajustáveis por variáveis de ambiente:
+- `PORT`: porta de escuta (padrão 80).
+- `WEB_CONCURRENCY`: número de processos (padrão: um por CPU).
+- `GUNICORN_TIMEOUT`, `GUNICORN_GRACEFUL_TIMEOUT`, `GUNICORN_KEEPALIVE`,
+  `GUNICORN_BACKLOG`, `GUNICORN_MAX_REQUESTS`.
+- `APP_METRICS_DIR`: diretório dos retratos de métricas dos workers
+  (padrão: `<tmp>/app-metrics-<PORT>`; vazio expõe só o worker que
+  atende a coleta).
+"""
+
+import multiprocessing
+import os
+import tempfile
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.environ.get(name, default))
+
+
+# ============================================================
+# PROCESSOS
+# ============================================================
+# Cada worker Uvicorn executa o próprio event loop; um processo por CPU
+# já ocupa todos os núcleos sem disputa excessiva pelo lock de escrita
+# do SQLite.
+workers = _env_int("WEB_CONCURRENCY", multiprocessing.cpu_count())
+worker_class = "uvicorn_worker.UvicornWorker"
+
+# A aplicação é importada uma única vez no processo mestre e
+# compartilhada com os workers (copy-on-write), reduzindo memória e o
+# tempo de subida de cada worker.
+preload_app = True
+
+# ============================================================
+# MÉTRICAS
+# ============================================================
+# Com vários workers, `/metrics` soma os retratos gravados por todos eles
+# neste diretório (ver `src.core.prometheus`). Definido antes do import
+# da aplicação, que lê as configurações uma única vez.
+os.environ.setdefault(
+    "APP_METRICS_DIR",
+    os.path.join(tempfile.gettempdir(), f"app-metrics-{_env_int('PORT', 80)}"),
+)
+
+# ============================================================
+# REDE
+# ============================================================
+bind = f"0.0.0.0:{_env_int('PORT', 80)}"
+backlog = _env_int("GUNICORN_BACKLOG", 2048)
+keepalive = _env_int("GUNICORN_KEEPALIVE", 5)
+
+# ============================================================
+# REINÍCIOS
+# ============================================================
+timeout = _env_int("GUNICORN_TIMEOUT", 60)
+graceful_timeout = _env_int("GUNICORN_GRACEFUL_TIMEOUT", 30)
+
+# Recicla os workers periodicamente; o jitter evita que todos reiniciem
+# ao mesmo tempo.
+max_requests = _env_int("GUNICORN_MAX_REQUESTS", 10000)
+max_requests_jitter = max_requests // 10
+
+# ============================================================
+# LOGS
+# ============================================================
+accesslog = "-"
+errorlog = "-"
+loglevel = os.environ.get("GUNICORN_LOGLEVEL", "info")
+
+
+# ============================================================
+# HOOKS
+# ============================================================
+def on_starting(server):
+    """
+    Prepara, uma única vez e no processo mestre, o banco e o diretório de
+    métricas.
+
+    - Cria as tabelas ausentes. Os workers herdam a marcação de banco
+      inicializado (com `preload_app`) ou encontram as tabelas já
+      criadas, de modo que não disputam a criação do esquema ao subir
+      juntos.
+    - Esvazia o diretório de métricas: retratos de uma execução anterior
+      não devem entrar na soma.
+    """
+    from src.core import prometheus
+    from src.core.database import init_db
+
+    if os.environ["APP_METRICS_DIR"]:
+        prometheus.clear_directory(os.environ["APP_METRICS_DIR"])
+    init_db()
+
+
+def post_fork(server, worker):
+    """
+    Descarta, no worker recém-criado, as conexões herdadas do mestre.
+
+    Com `preload_app`, o engine é criado antes do `fork`. Conexões SQLite
+    não podem ser compartilhadas entre processos: `dispose(close=False)`
+    substitui o pool por um novo, sem fechar as conexões que ainda
+    pertencem ao processo mestre.
+    """
+    from src.core.database import engine
+
+    engine.dispose(close=False)
+
+
+def child_exit(server, worker):
+    """
+    Incorpora as métricas do worker encerrado ao acumulado dos processos
+    encerrados e remove o seu arquivo.
+
+    Sem isso, cada worker reciclado por `max_requests` deixaria um
+    arquivo relido em toda coleta.
+    """
+    from src.core import prometheus
+
+    if os.environ["APP_METRICS_DIR"]:
+        prometheus.archive_process(os.environ["APP_METRICS_DIR"], worker.pid)
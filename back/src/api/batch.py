@@ -0,0 +1,82 @@
+"""
+Parâmetro `ids` e resposta HTTP das leituras em lote.
+
+Com `?ids=3,1,7` a listagem devolve apenas os itens pedidos, na ordem
+pedida; os ids inexistentes seguem no cabeçalho `X-Missing-Ids`. O
+corpo continua sendo a lista de itens.
+
+Exemplo:
+```http
+GET /produtos/?ids=12,4,30
+```
+"""
+
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Query, status
+
+from src.api.responses import DTOResponse
+from src.core.batch import MAX_BATCH_IDS, Batch
+
+MISSING_IDS_HEADER = "X-Missing-Ids"
+
+
+def ids_param(
+    ids: Optional[str] = Query(
+        None,
+        description=(
+            "Ids separados por vírgula. Quando informado, devolve apenas "
+            f"esses itens, na ordem pedida (máximo de {MAX_BATCH_IDS})."
+        ),
+    ),
+) -> Optional[Tuple[int, ...]]:
+    """
+    Dependência que lê a lista de ids da query string.
+
+    Ids repetidos são considerados uma única vez. Valores não inteiros ou
+    acima do limite resultam em 400.
+    """
+    if ids is None:
+        return None
+
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`ids` deve conter inteiros separados por vírgula.",
+        ) from exc
+
+    unique = tuple(dict.fromkeys(parsed))
+    if not unique:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="`ids` não pode ser vazio.",
+        )
+    if len(unique) > MAX_BATCH_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"No máximo {MAX_BATCH_IDS} ids por requisição.",
+        )
+    return unique
+
+
+def batch_response(batch: Batch) -> DTOResponse:
+    """
+    Monta a resposta de uma leitura em lote: itens no corpo e ids
+    ausentes no cabeçalho `X-Missing-Ids`.
+
+    Parâmetros
+    ----------
+    batch : Batch
+        Resultado retornado pelo serviço.
+
+    Retorno
+    -------
+    DTOResponse
+        Resposta com a lista de itens.
+    """
+    headers = {}
+    if batch.missing:
+        headers[MISSING_IDS_HEADER] = ",".join(map(str, batch.missing))
+    return DTOResponse(batch.items, headers=headers)
@@ -0,0 +1,187 @@
+"""
+Requisições condicionais (`ETag` / `Last-Modified`).
+
+As leituras do catálogo enviam validadores que permitem ao cliente
+revalidar sua cópia com `If-None-Match` ou `If-Modified-Since`. Quando
+nada mudou, a resposta é `304 Not Modified`, sem ler as linhas, montar
+DTOs ou serializar JSON.
+
+- Listagens: validadores derivados da versão das tabelas envolvidas
+  (ver `src.core.versioning`), consultada pela chave primária de
+  `table_versions`.
+- Itens: validadores derivados do `updated_at` da linha (e da versão
+  das tabelas dos relacionamentos incorporados, quando há `include=`).
+
+Em ambos os casos a URL completa (caminho e query string) compõe o
+`ETag`, pois parâmetros como `fields`, `limit` e `cursor` mudam a
+representação. Os `ETag`s são fracos (`W/`): a mesma representação pode
+ser enviada com ou sem compressão.
+
+As respostas levam `Cache-Control: no-cache`, para que navegadores sempre
+revalidem antes de reutilizar a cópia local.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from fastapi import Depends, Request, Response, status
+from sqlalchemy.orm import Session
+
+from src.core.database import get_db
+from src.core.versioning import get_version_stamps
+
+
+@dataclass(frozen=True)
+class Validators:
+    """
+    Validadores de cache de uma representação.
+
+    ## Atributos
+    - **etag** (*str*): `ETag` fraco da representação.
+    - **last_modified** (*datetime | None*): Instante da última alteração.
+    """
+
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def build(
+        cls, request: Request, *parts: Any, last_modified: Optional[datetime] = None
+    ) -> "Validators":
+        """
+        Gera os validadores a partir da URL e das partes que identificam
+        o estado dos dados (versões, instantes de alteração).
+        """
+        digest = hashlib.blake2b(digest_size=12)
+        digest.update(request.url.path.encode())
+        digest.update(b"?" + request.url.query.encode())
+        for part in parts:
+            digest.update(b"\0" + str(part).encode())
+        return cls(etag=f'W/"{digest.hexdigest()}"', last_modified=last_modified)
+
+    def headers(self) -> Dict[str, str]:
+        """
+        Cabeçalhos de validação a enviar na resposta.
+        """
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache"}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.astimezone(timezone.utc), usegmt=True
+            )
+        return headers
+
+    def is_fresh(self, request: Request) -> bool:
+        """
+        Indica se a cópia do cliente ainda é válida.
+
+        `If-None-Match` tem precedência; `If-Modified-Since` só é avaliado
+        na ausência dele (RFC 9110, seção 13.2.2).
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, self.etag)
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # O cabeçalho HTTP tem resolução de segundos.
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def not_modified(self) -> Response:
+        """
+        Resposta `304 Not Modified` com os validadores atuais.
+        """
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=self.headers()
+        )
+
+    def apply(self, response: Response) -> Response:
+        """
+        Adiciona os validadores a uma resposta completa.
+        """
+        response.headers.update(self.headers())
+        return response
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """
+    Comparação fraca entre `If-None-Match` e o `ETag` atual.
+    """
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in header.split(",")
+    )
+
+
+def version_validators(
+    request: Request,
+    db: Session,
+    tables: Iterable[str],
+    *parts: Any,
+    last_modified: Optional[datetime] = None,
+) -> Validators:
+    """
+    Calcula os validadores a partir da versão das tabelas informadas e de
+    outras partes que identificam a representação.
+
+    Parâmetros
+    ----------
+    request : Request
+        Requisição atual.
+    db : Session
+        Sessão usada para ler `table_versions`.
+    tables : Iterable[str]
+        Tabelas cujas alterações mudam a representação.
+    *parts : Any
+        Outras partes do estado (por exemplo, o `updated_at` da linha).
+    last_modified : datetime | None
+        Instante de alteração conhecido além das tabelas.
+
+    Retorno
+    -------
+    Validators
+        Validadores da representação.
+    """
+    tables = tuple(tables)
+    stamps = get_version_stamps(db, tables) if tables else {}
+    versions = [stamps[table][0] for table in tables]
+    changes = [at for _, at in stamps.values() if at is not None]
+    if last_modified is not None:
+        changes.append(last_modified)
+    return Validators.build(
+        request, *parts, *versions, last_modified=max(changes, default=None)
+    )
+
+
+def table_validators(*tables: str) -> Callable[..., Validators]:
+    """
+    Cria a dependência que calcula os validadores de uma listagem a
+    partir da versão das tabelas informadas.
+
+    Parâmetros
+    ----------
+    *tables : str
+        Tabelas cujas alterações mudam a listagem.
+
+    Retorno
+    -------
+    Callable
+        Dependência que retorna os `Validators` da requisição atual.
+    """
+
+    def dependency(request: Request, db: Session = Depends(get_db)) -> Validators:
+        return version_validators(request, db, tables)
+
+    return dependency
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from src.core.database import SessionLocal
+from src.core.database import get_db
+from src.api.responses import DTOResponse
 from src.repositories.user_repository import UserRepository
 from src.services.auth_service import AuthService
 from src.dto.user_dto import LoginDTO, UserResponseDTO
@@ -10,14 +11,6 @@ from src.dto.user_dto import LoginDTO, UserResponseDTO
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_auth_service(db: Session = Depends(get_db)) -> AuthService:
     repo = UserRepository(db)
     return AuthService(repo)
@@ -45,7 +38,7 @@ def login(dto: LoginDTO, service: AuthService = Depends(get_auth_service)):
     """
     try:
         user = service.login_user(dto)
-        return user
+        return DTOResponse(user)
     except ValueError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
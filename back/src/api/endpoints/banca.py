@@ -1,13 +1,25 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
-from src.core.database import SessionLocal
+from src.core.database import get_db
+from src.api.batch import batch_response, ids_param
+from src.api.conditional import Validators, version_validators
+from src.api.fieldsets import Fields, Includes, fieldset, includes
+from src.api.pagination import page_params, page_response
+from src.api.response_cache import cached_response
+from src.api.responses import DTOResponse
+from src.core.pagination import PageParams
 from src.services.banca_service import BancaService
 from src.repositories.banca_repository import BancaRepository
 from src.repositories.address_repository import AddressRepository
+from src.repositories.user_repository import UserRepository
 
 from src.dto.banca_dto import (
+    BANCA_INCLUDES,
     BancaCreate,
+    BancaDetail,
     BancaUpdate,
     BancaRead,
 )
@@ -15,27 +27,38 @@ from src.dto.banca_dto import (
 
 router = APIRouter(prefix="/bancas", tags=["Bancas"])
 
+banca_fields = fieldset(BancaRead)
+banca_includes = includes(BANCA_INCLUDES)
+
+# Tabelas cujas alterações mudam cada relacionamento incorporado.
+INCLUDE_TABLES = {"address": "addresses", "produtos": "produtos", "supplier": "users"}
+
 
 # ============================================================
 #  DEPENDÊNCIAS
 # ============================================================
 
 
-def get_db():
-    """
-    Gera uma sessão de banco de dados por requisição.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_banca_service(db: Session = Depends(get_db)) -> BancaService:
     banca_repo = BancaRepository(db)
     address_repo = AddressRepository(db)
-    return BancaService(banca_repo, address_repo)
+    return BancaService(banca_repo, address_repo, UserRepository(db))
+
+
+def _related_tables(include: Includes) -> tuple:
+    return tuple(INCLUDE_TABLES[name] for name in sorted(include))
+
+
+def list_validators(
+    request: Request,
+    include: Includes = Depends(banca_includes),
+    db: Session = Depends(get_db),
+) -> Validators:
+    """
+    Validadores da listagem: versão de `bancas` e das tabelas dos
+    relacionamentos incorporados.
+    """
+    return version_validators(request, db, ("bancas", *_related_tables(include)))
 
 
 # ============================================================
@@ -61,7 +84,9 @@ def create_banca(
     Endpoint responsável pela criação de uma banca e seu endereço associado.
     """
     try:
-        return service.create_banca(dto)
+        return DTOResponse(
+            service.create_banca(dto), status_code=status.HTTP_201_CREATED
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -73,21 +98,47 @@ def create_banca(
 
 @router.get(
     "/{banca_id}",
-    response_model=BancaRead,
+    response_model=BancaDetail,
     summary="Obter banca",
-    description="Retorna os dados de uma banca pelo seu identificador.",
+    description=(
+        "Retorna os dados de uma banca pelo seu identificador. "
+        "Com `include=address,produtos,supplier`, incorpora os "
+        "relacionamentos pedidos à resposta."
+    ),
 )
 def get_banca(
     banca_id: int,
+    request: Request,
+    fields: Fields = Depends(banca_fields),
+    include: Includes = Depends(banca_includes),
+    db: Session = Depends(get_db),
     service: BancaService = Depends(get_banca_service),
 ):
     """
     Consulta uma banca pelo ID.
+
+    Responde 304 quando a cópia do cliente (`If-None-Match` /
+    `If-Modified-Since`) corresponde ao `updated_at` atual da banca e,
+    com `include`, à versão das tabelas incorporadas.
     """
-    banca = service.get_banca(banca_id)
+    updated_at = service.get_updated_at(banca_id)
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Banca não encontrada.")
+
+    validators = version_validators(
+        request,
+        db,
+        _related_tables(include),
+        updated_at.isoformat(),
+        last_modified=updated_at,
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    banca = service.get_banca(banca_id, fields, include)
     if not banca:
         raise HTTPException(status_code=404, detail="Banca não encontrada.")
-    return banca
+    return validators.apply(DTOResponse(banca))
 
 
 # ============================================================
@@ -97,17 +148,48 @@ def get_banca(
 
 @router.get(
     "/",
-    response_model=list[BancaRead],
+    response_model=list[BancaDetail],
     summary="Listar bancas",
-    description="Retorna todas as bancas cadastradas no sistema.",
+    description=(
+        "Retorna as bancas cadastradas no sistema, página a página. "
+        "Suporta paginação por cursor: `limit`, `cursor`, `order_by` (`id` ou `updated_at`) e `include_total`. O cursor da próxima página é enviado em `X-Next-Cursor`."
+        "\n\n"
+        "Com `ids=3,1,7`, retorna apenas esses itens, na ordem pedida, com "
+        "uma única consulta; os ids inexistentes seguem em `X-Missing-Ids`."
+        "\n\n"
+        "Com `include=address,produtos,supplier`, incorpora os relacionamentos "
+        "a cada banca, com uma consulta adicional por relacionamento, "
+        "qualquer que seja o tamanho da página."
+    ),
 )
 def list_bancas(
+    request: Request,
+    ids: Optional[Tuple[int, ...]] = Depends(ids_param),
+    params: PageParams = Depends(page_params),
+    fields: Fields = Depends(banca_fields),
+    include: Includes = Depends(banca_includes),
+    validators: Validators = Depends(list_validators),
     service: BancaService = Depends(get_banca_service),
 ):
     """
-    Lista todas as bancas registradas.
+    Lista uma página das bancas registradas ou, com `ids`, as bancas
+    pedidas.
+
+    A resposta serializada fica em cache até a próxima escrita em
+    `bancas` (ver `src.api.response_cache`).
     """
-    return service.list_bancas()
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    def build():
+        if ids is not None:
+            return validators.apply(
+                batch_response(service.get_bancas_by_ids(ids, fields, include))
+            )
+        page = service.list_bancas_page(params, fields, include)
+        return validators.apply(page_response(page, request))
+
+    return cached_response(request, validators.etag, build)
 
 
 # ============================================================
@@ -132,10 +214,13 @@ def update_banca(
     """
     Atualiza os dados de uma banca existente.
     """
-    updated = service.update_banca(banca_id, dto)
+    try:
+        updated = service.update_banca(banca_id, dto)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
     if not updated:
         raise HTTPException(status_code=404, detail="Banca não encontrada.")
-    return updated
+    return DTOResponse(updated)
 
 
 # ============================================================
@@ -0,0 +1,30 @@
+"""
+Endpoints de depuração da camada de banco de dados.
+
+Disponíveis apenas com `APP_SQL_DEBUG=true`; caso contrário respondem 404,
+para não expor comandos SQL em produção.
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from src.core.config import get_settings
+from src.core.middleware import recent_query_reports
+
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+
+@router.get(
+    "/queries",
+    summary="Consultas das últimas requisições",
+    description=(
+        "Lista, para as requisições mais recentes, a quantidade de consultas, "
+        "o tempo de banco, os comandos executados e os possíveis padrões N+1."
+    ),
+)
+def debug_queries():
+    """
+    Retorna os relatórios de consultas coletados pelo middleware.
+    """
+    if not get_settings().sql_debug:
+        raise HTTPException(status_code=404, detail="Not Found")
+    return recent_query_reports()
@@ -5,9 +5,17 @@ Este módulo contém rotas utilizadas em monitoramento, verificação de
 disponibilidade e integração com serviços de observabilidade.
 """
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from datetime import datetime, UTC
 
+from src.api.responses import ORJSONResponse
+
+from src.core import health, prometheus
+from src.core.config import get_settings
+from src.core.database import engine
+from src.core.metrics import pool_stats, threadpool_stats
+from src.services.search_log import search_log
+
 router = APIRouter()
 
 
@@ -36,3 +44,128 @@ def health_check():
         "timestamp": datetime.now(UTC).isoformat(),
         "version": "1.0.0",
     }
+
+
+@router.get(
+    "/health/live",
+    summary="Verificação de vida do processo",
+    description=(
+        "Indica apenas que o processo responde. Não consulta o banco nem "
+        "outras dependências: uma falha aqui significa que o processo deve "
+        "ser reiniciado."
+    ),
+)
+async def liveness():
+    """
+    Responde sem acessar dependências nem o threadpool.
+
+    O endpoint é assíncrono: um threadpool esgotado deixa o processo
+    lento, mas não morto, e não deve provocar reinícios.
+    """
+    return {"status": "ok"}
+
+
+@router.get(
+    "/health/ready",
+    summary="Verificação de prontidão para receber tráfego",
+    description=(
+        "Verifica a conectividade com o banco (com tempo limite), a ocupação "
+        "do pool de conexões, a fila de registros de pesquisa e o atraso do "
+        "event loop. Responde 503 se o banco estiver inacessível ou se a "
+        "sobrecarga persistir por `APP_READINESS_OVERLOAD_SECONDS`."
+    ),
+    responses={503: {"description": "Processo não está pronto"}},
+)
+async def readiness():
+    """
+    Executa as verificações de prontidão do processo atual.
+
+    **Retorno**
+    - `status`: `ready`, `degraded` (sobrecarga ainda não sustentada) ou
+      `unready` (HTTP 503).
+    - `overloaded_seconds`: há quanto tempo a sobrecarga persiste.
+    - `checks`: resultado e valores medidos de cada verificação.
+    """
+    settings = get_settings()
+    checks = {
+        "database": await health.check_database(engine, settings.readiness_db_timeout),
+        "pool": health.check_pool(engine, settings.readiness_pool_saturation),
+        "search_log": health.check_queue(
+            search_log.pending(),
+            search_log.max_pending,
+            settings.readiness_queue_saturation,
+        ),
+        "event_loop": health.check_loop_lag(
+            health.loop_lag, settings.readiness_max_loop_lag_ms
+        ),
+    }
+
+    overloaded = not all(
+        checks[name].ok for name in ("pool", "search_log", "event_loop")
+    )
+    overloaded_seconds = health.overload.update(overloaded)
+
+    if not checks["database"].ok or (
+        overloaded and overloaded_seconds >= settings.readiness_overload_seconds
+    ):
+        status, status_code = "unready", 503
+    elif overloaded:
+        status, status_code = "degraded", 200
+    else:
+        status, status_code = "ready", 200
+
+    return ORJSONResponse(
+        {
+            "status": status,
+            "overloaded_seconds": round(overloaded_seconds, 3),
+            "checks": {name: check.to_dict() for name, check in checks.items()},
+        },
+        status_code=status_code,
+    )
+
+
+@router.get(
+    "/metrics/pool",
+    summary="Métricas do pool de conexões",
+    description=(
+        "Retorna o estado do pool de conexões do banco (conexões em uso, "
+        "overflow, histograma do tempo de espera e checkouts expirados) e a "
+        "ocupação do threadpool que executa os endpoints síncronos."
+    ),
+)
+async def pool_metrics():
+    """
+    Expõe as métricas de pool e threadpool do processo atual.
+
+    O endpoint é assíncrono para ler o limitador do threadpool dentro do
+    event loop, sem ocupar uma das threads que está medindo.
+
+    **Retorno**
+    - `database_pool`: estado do pool de conexões.
+    - `threadpool`: tokens totais, em uso e tarefas aguardando.
+    """
+    return {
+        "database_pool": pool_stats(engine),
+        "threadpool": threadpool_stats(),
+    }
+
+
+@router.get(
+    "/metrics",
+    summary="Métricas no formato Prometheus",
+    description=(
+        "Expõe, no formato texto do Prometheus, contagem de requisições por "
+        "rota e status, histogramas de latência por rota, requisições em "
+        "andamento e contadores de consultas ao banco. Com `APP_METRICS_DIR`, "
+        "soma os valores de todos os processos do servidor."
+    ),
+    response_class=Response,
+)
+def metrics():
+    """
+    Retorna as métricas de todos os processos, somadas.
+
+    O endpoint é síncrono: com `APP_METRICS_DIR`, a leitura dos retratos
+    dos processos acontece no threadpool, fora do event loop.
+    """
+    return Response(content=prometheus.exposition(), media_type=prometheus.CONTENT_TYPE)
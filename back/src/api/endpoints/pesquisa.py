@@ -1,29 +1,28 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
 from sqlalchemy.orm import Session
 
-from src.core.database import SessionLocal
+from src.core.database import get_db
+from src.api.fieldsets import Fields, fieldset
+from src.api.responses import DTOResponse
 from src.services.pesquisa_service import PesquisaService
+from src.services.search_log import search_log
+from src.dto.banca_dto import BancaRead
 from src.dto.pesquisa_dto import SearchResponse
+from src.dto.produto_dto import ProdutoRead
 
 
 router = APIRouter(prefix="/pesquisa", tags=["Pesquisa"])
 
+search_fields = fieldset(ProdutoRead, BancaRead)
+
 
 # ============================================================
 #  DEPENDÊNCIAS
 # ============================================================
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_pesquisa_service(db: Session = Depends(get_db)) -> PesquisaService:
-    return PesquisaService(db)
+    return PesquisaService(db, search_log=search_log)
 
 
 # ============================================================
@@ -46,13 +45,14 @@ def get_pesquisa_service(db: Session = Depends(get_db)) -> PesquisaService:
         "- `lat_user`, `lon_user`: localização do usuário para registrar a pesquisa\n"
         "- `lat_ref`, `lon_ref`: localização alternativa para cálculo de distância\n"
         "- `order_by`: preco | distancia\n"
+        "- `fields`: campos retornados em cada produto/banca (ex: id,nome,preco)\n"
     ),
 )
 def pesquisar(
     termo: str = Query(..., description="Termo a ser pesquisado (ex: tomate)"),
     tipo: str = Query(
         ...,
-        regex="^(produto|banca|all)$",
+        pattern="^(produto|banca|all)$",
         description="Tipo da busca: produto, banca ou all",
     ),
     preco_max: float | None = Query(
@@ -64,7 +64,7 @@ def pesquisar(
     ),
     order_by: str | None = Query(
         None,
-        regex="^(preco|distancia)$",
+        pattern="^(preco|distancia)$",
         description="Critério de ordenação: preco ou distancia",
     ),
     lat_user: float | None = Query(
@@ -79,6 +79,7 @@ def pesquisar(
     lon_ref: float | None = Query(
         None, description="Longitude alternativa para cálculo de distância"
     ),
+    fields: Fields = Depends(search_fields),
     service: PesquisaService = Depends(get_pesquisa_service),
 ):
     """
@@ -86,7 +87,7 @@ def pesquisar(
     """
 
     try:
-        return service.buscar(
+        resultado = service.buscar(
             termo=termo,
             tipo=tipo,
             lat_user=lat_user,
@@ -96,7 +97,10 @@ def pesquisar(
             order_by=order_by,
             lat_ref=lat_ref,
             lon_ref=lon_ref,
+            fields=fields,
         )
 
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    return DTOResponse(resultado)
@@ -1,37 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from src.core.database import SessionLocal
+from src.core.database import get_db
+from src.api.batch import batch_response, ids_param
+from src.api.conditional import Validators, table_validators
+from src.api.fieldsets import Fields, fieldset
+from src.api.pagination import page_params, page_response
+from src.api.response_cache import cached_response
+from src.api.responses import DTOResponse
+from src.core.pagination import PageParams
 from src.repositories.produto_repository import ProdutoRepository
 from src.repositories.banca_repository import BancaRepository
 from src.services.produto_service import ProdutoService
+from src.services.produto_import_service import (
+    CsvParser,
+    NdjsonParser,
+    ProdutoImportService,
+)
 
 from src.dto.produto_dto import (
     ProdutoCreate,
     ProdutoUpdate,
     ProdutoRead,
+    ProdutoBulkResult,
+    ProdutoPrecoBulkUpdate,
+    ProdutoPrecoBulkResult,
 )
 
 
 router = APIRouter(prefix="/produtos", tags=["Produtos"])
 
+produto_fields = fieldset(ProdutoRead)
+
 
 # ============================================================
 #  DEPENDÊNCIAS
 # ============================================================
 
 
-def get_db():
-    """
-    Fornece uma sessão de banco por requisição.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_produto_service(db: Session = Depends(get_db)) -> ProdutoService:
     """
     Instancia o serviço de produtos utilizando os repositórios associados.
@@ -41,6 +50,53 @@ def get_produto_service(db: Session = Depends(get_db)) -> ProdutoService:
     return ProdutoService(produto_repo, banca_repo)
 
 
+def get_produto_import_service(
+    db: Session = Depends(get_db),
+) -> ProdutoImportService:
+    """
+    Instancia o serviço de importação em lote de produtos.
+    """
+    return ProdutoImportService(ProdutoRepository(db), BancaRepository(db))
+
+
+async def _iter_linhas(request: Request) -> AsyncIterator[Tuple[int, bytes]]:
+    """
+    Percorre o corpo da requisição linha a linha, à medida que chega.
+
+    Retorna pares (número da linha, bytes da linha), ignorando linhas
+    vazias. A decodificação é feita por linha (ver `_decodificar`): em
+    UTF-8 o byte de quebra de linha nunca aparece dentro de um caractere
+    multibyte, então a divisão em bytes é segura.
+    """
+    buffer = b""
+    numero = 0
+
+    async for chunk in request.stream():
+        buffer += chunk
+        *linhas, buffer = buffer.split(b"\n")
+        for linha in linhas:
+            numero += 1
+            if linha.strip():
+                yield numero, linha.rstrip(b"\r")
+
+    if buffer.strip():
+        yield numero + 1, buffer.rstrip(b"\r")
+
+
+def _decodificar(linha: bytes) -> str:
+    """
+    Decodifica uma linha em UTF-8.
+
+    Uma linha com bytes inválidos é rejeitada com `ValueError` e
+    reportada como as demais linhas inválidas, sem interromper a
+    importação.
+    """
+    try:
+        return linha.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        raise ValueError("A linha não está codificada em UTF-8.") from exc
+
+
 # ============================================================
 #  CREATE
 # ============================================================
@@ -61,11 +117,63 @@ def create_produto(
     Endpoint responsável pela criação de produtos.
     """
     try:
-        return service.create_produto(dto)
+        return DTOResponse(
+            service.create_produto(dto), status_code=status.HTTP_201_CREATED
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+@router.post(
+    "/bulk",
+    response_model=ProdutoBulkResult,
+    summary="Importar produtos em lote",
+    description=(
+        "Importa uma lista de produtos enviada em fluxo, no formato NDJSON "
+        "(`application/x-ndjson`, um objeto por linha) ou CSV com cabeçalho "
+        "(`text/csv`). Linhas inválidas são devolvidas em `erros` com o "
+        "número da linha; as demais são gravadas em blocos."
+    ),
+)
+async def bulk_import_produtos(
+    request: Request,
+    service: ProdutoImportService = Depends(get_produto_import_service),
+):
+    """
+    Endpoint de importação em lote de produtos.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip()
+    if content_type in ("application/x-ndjson", "application/ndjson"):
+        parser = NdjsonParser()
+    elif content_type == "text/csv":
+        parser = CsvParser()
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Envie o corpo como application/x-ndjson ou text/csv.",
+        )
+
+    bloco = []
+    async for numero, linha in _iter_linhas(request):
+        try:
+            dto = parser.parse(_decodificar(linha))
+        except ValueError as exc:
+            service.registrar_erro(numero, exc)
+            continue
+
+        if dto is not None:
+            bloco.append((numero, dto))
+
+        if len(bloco) >= service.chunk_size:
+            await run_in_threadpool(service.importar_bloco, bloco)
+            bloco = []
+
+    if bloco:
+        await run_in_threadpool(service.importar_bloco, bloco)
+
+    return DTOResponse(service.resultado())
+
+
 # ============================================================
 #  READ
 # ============================================================
@@ -79,15 +187,30 @@ def create_produto(
 )
 def get_produto(
     produto_id: int,
+    request: Request,
+    fields: Fields = Depends(produto_fields),
     service: ProdutoService = Depends(get_produto_service),
 ):
     """
     Consulta um produto pelo ID.
+
+    Responde 304 quando a cópia do cliente (`If-None-Match` /
+    `If-Modified-Since`) corresponde ao `updated_at` atual do produto.
     """
-    produto = service.get_produto(produto_id)
+    updated_at = service.get_updated_at(produto_id)
+    if updated_at is None:
+        raise HTTPException(status_code=404, detail="Produto não encontrado.")
+
+    validators = Validators.build(
+        request, updated_at.isoformat(), last_modified=updated_at
+    )
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    produto = service.get_produto(produto_id, fields)
     if not produto:
         raise HTTPException(status_code=404, detail="Produto não encontrado.")
-    return produto
+    return validators.apply(DTOResponse(produto))
 
 
 # ============================================================
@@ -99,31 +222,67 @@ def get_produto(
     "/",
     response_model=list[ProdutoRead],
     summary="Listar produtos",
-    description="Retorna todos os produtos cadastrados no sistema.",
+    description=(
+        "Retorna os produtos cadastrados no sistema, página a página. "
+        "Suporta paginação por cursor: `limit`, `cursor`, `order_by` (`id` ou `updated_at`) e `include_total`. O cursor da próxima página é enviado em `X-Next-Cursor`."
+        "\n\n"
+        "Com `ids=3,1,7`, retorna apenas esses itens, na ordem pedida, com "
+        "uma única consulta; os ids inexistentes seguem em `X-Missing-Ids`."
+    ),
 )
 def list_produtos(
+    request: Request,
+    ids: Optional[Tuple[int, ...]] = Depends(ids_param),
+    params: PageParams = Depends(page_params),
+    fields: Fields = Depends(produto_fields),
+    validators: Validators = Depends(table_validators("produtos")),
     service: ProdutoService = Depends(get_produto_service),
 ):
     """
-    Lista todos os produtos.
+    Lista uma página de produtos ou, com `ids`, os produtos pedidos.
     """
-    return service.list_produtos()
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    if ids is not None:
+        batch = service.get_produtos_by_ids(ids, fields)
+        return validators.apply(batch_response(batch))
+
+    page = service.list_produtos_page(params, fields)
+    return validators.apply(page_response(page, request))
 
 
 @router.get(
     "/banca/{banca_id}",
     response_model=list[ProdutoRead],
     summary="Listar produtos por banca",
-    description="Retorna todos os produtos vinculados a uma banca.",
+    description=(
+        "Retorna os produtos vinculados a uma banca, página a página. "
+        "Suporta paginação por cursor: `limit`, `cursor`, `order_by` (`id` ou `updated_at`) e `include_total`. O cursor da próxima página é enviado em `X-Next-Cursor`."
+    ),
 )
 def list_produtos_por_banca(
     banca_id: int,
+    request: Request,
+    params: PageParams = Depends(page_params),
+    fields: Fields = Depends(produto_fields),
+    validators: Validators = Depends(table_validators("produtos")),
     service: ProdutoService = Depends(get_produto_service),
 ):
     """
-    Lista produtos pertencentes à banca informada.
+    Lista uma página dos produtos pertencentes à banca informada.
+
+    A resposta serializada fica em cache até a próxima escrita em
+    `produtos` (ver `src.api.response_cache`).
     """
-    return service.list_by_banca(banca_id)
+    if validators.is_fresh(request):
+        return validators.not_modified()
+
+    def build():
+        page = service.list_by_banca_page(banca_id, params, fields)
+        return validators.apply(page_response(page, request))
+
+    return cached_response(request, validators.etag, build)
 
 
 # ============================================================
@@ -156,7 +315,31 @@ def update_produto(
     if not updated:
         raise HTTPException(status_code=404, detail="Produto não encontrado.")
 
-    return updated
+    return DTOResponse(updated)
+
+
+@router.patch(
+    "/banca/{banca_id}/precos",
+    response_model=ProdutoPrecoBulkResult,
+    summary="Atualizar preços em lote",
+    description=(
+        "Aplica novos preços a vários produtos de uma banca em uma única "
+        "transação. Se algum produto não pertencer à banca, nenhum preço "
+        "é alterado."
+    ),
+)
+def update_precos_banca(
+    banca_id: int,
+    dto: ProdutoPrecoBulkUpdate,
+    service: ProdutoService = Depends(get_produto_service),
+):
+    """
+    Atualiza os preços dos produtos de uma banca em lote.
+    """
+    try:
+        return DTOResponse(service.update_precos(banca_id, dto))
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
 
 
 # ============================================================
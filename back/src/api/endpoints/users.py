@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 
-from src.core.database import SessionLocal
+from src.core.database import get_db
+from src.api.pagination import page_response, uuid_page_params
+from src.api.responses import DTOResponse
+from src.core.pagination import PageParams
 from src.repositories.user_repository import UserRepository
 from src.services.user_service import UserService
 from src.dto.user_dto import (
@@ -19,17 +24,6 @@ router = APIRouter(prefix="/users", tags=["Users"])
 # ============================================================
 
 
-def get_db():
-    """
-    Fornece uma sessão de banco por requisição.
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     """
     Instancia o serviço de usuários utilizando o repositório associado.
@@ -57,7 +51,9 @@ def create_user(
     Endpoint responsável pela criação de usuários.
     """
     try:
-        return service.create_user(dto)
+        return DTOResponse(
+            service.create_user(dto), status_code=status.HTTP_201_CREATED
+        )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -74,16 +70,16 @@ def create_user(
     description="Retorna os dados de um usuário pelo seu identificador.",
 )
 def get_user(
-    user_id: str,
+    user_id: uuid.UUID,
     service: UserService = Depends(get_user_service),
 ):
     """
     Consulta um usuário pelo ID.
     """
-    user = service.get_user(user_id)
+    user = service.get_user(str(user_id))
     if not user:
         raise HTTPException(status_code=404, detail="Usuário não encontrado.")
-    return user
+    return DTOResponse(user)
 
 
 # ============================================================
@@ -95,15 +91,20 @@ def get_user(
     "/",
     response_model=list[UserResponseDTO],
     summary="Listar usuários",
-    description="Retorna todos os usuários cadastrados no sistema.",
+    description=(
+        "Retorna os usuários cadastrados no sistema, página a página. "
+        "Suporta paginação por cursor: `limit`, `cursor`, `order_by` (`id` ou `updated_at`) e `include_total`. O cursor da próxima página é enviado em `X-Next-Cursor`."
+    ),
 )
 def list_users(
+    request: Request,
+    params: PageParams = Depends(uuid_page_params),
     service: UserService = Depends(get_user_service),
 ):
     """
-    Lista todos os usuários.
+    Lista uma página de usuários.
     """
-    return service.list_users()
+    return page_response(service.list_users_page(params), request)
 
 
 # ============================================================
@@ -121,17 +122,17 @@ def list_users(
     ),
 )
 def update_user(
-    user_id: str,
+    user_id: uuid.UUID,
     dto: UserUpdateDTO,
     service: UserService = Depends(get_user_service),
 ):
     """
     Atualiza os dados de um usuário existente.
     """
-    updated = service.update_user(user_id, dto)
+    updated = service.update_user(str(user_id), dto)
     if not updated:
         raise HTTPException(status_code=404, detail="Usuário não encontrado.")
-    return updated
+    return DTOResponse(updated)
 
 
 # ============================================================
@@ -146,16 +147,12 @@ def update_user(
     description="Remove um usuário do sistema pelo seu identificador.",
 )
 def delete_user(
-    user_id: str,
+    user_id: uuid.UUID,
     service: UserService = Depends(get_user_service),
 ):
     """
     Remove um usuário do banco de dados.
     """
-    # Verifica antes de deletar
-    user = service.get_user(user_id)
-    if not user:
+    if not service.delete_user(str(user_id)):
         raise HTTPException(status_code=404, detail="Usuário não encontrado.")
-
-    service.delete_user(user_id)
     return None
@@ -0,0 +1,109 @@
+"""
+Parâmetro `fields=` das leituras com campos esparsos (sparse fieldsets).
+
+O cliente informa, separados por vírgula, os campos desejados:
+
+```http
+GET /produtos/?fields=id,nome,preco
+```
+
+Somente as colunas correspondentes são lidas do banco (`load_only`) e
+serializadas (DTO parcial de `fieldset_model`), reduzindo tanto a
+largura das linhas no SQL quanto o tamanho do JSON. Campos
+desconhecidos resultam em 400.
+
+De forma análoga, `include=` incorpora relacionamentos à resposta, em
+vez de exigir uma requisição por relacionamento:
+
+```http
+GET /bancas/7?include=address,produtos
+```
+"""
+
+from typing import Callable, FrozenSet, Iterable, Optional, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+Fields = Optional[FrozenSet[str]]
+Includes = FrozenSet[str]
+
+
+def fieldset(*models: Type[BaseModel]) -> Callable[..., Fields]:
+    """
+    Cria a dependência que lê e valida `fields=` contra os DTOs
+    informados.
+
+    Parâmetros
+    ----------
+    *models : type[BaseModel]
+        DTOs cujos campos podem ser solicitados.
+
+    Retorno
+    -------
+    Callable
+        Dependência que retorna o conjunto de campos, ou None quando o
+        parâmetro não é enviado.
+    """
+    allowed = frozenset().union(*(model.model_fields for model in models))
+    description = "Campos retornados, separados por vírgula. Disponíveis: " + (
+        ", ".join(f"`{name}`" for name in sorted(allowed))
+    )
+
+    def dependency(
+        fields: Optional[str] = Query(None, description=description),
+    ) -> Fields:
+        if fields is None:
+            return None
+
+        names = frozenset(name.strip() for name in fields.split(",") if name.strip())
+        unknown = sorted(names - allowed)
+        if not names or unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Campos inválidos em 'fields': {', '.join(unknown) or fields}",
+            )
+        return names
+
+    return dependency
+
+
+def includes(names: Iterable[str]) -> Callable[..., Includes]:
+    """
+    Cria a dependência que lê e valida `include=` contra os
+    relacionamentos disponíveis.
+
+    Parâmetros
+    ----------
+    names : Iterable[str]
+        Relacionamentos que podem ser incorporados.
+
+    Retorno
+    -------
+    Callable
+        Dependência que retorna o conjunto de relacionamentos (vazio
+        quando o parâmetro não é enviado).
+    """
+    allowed = frozenset(names)
+    description = "Relacionamentos incorporados, separados por vírgula: " + (
+        ", ".join(f"`{name}`" for name in sorted(allowed))
+    )
+
+    def dependency(
+        include: Optional[str] = Query(None, description=description),
+    ) -> Includes:
+        if include is None:
+            return frozenset()
+
+        requested = frozenset(
+            name.strip() for name in include.split(",") if name.strip()
+        )
+        unknown = sorted(requested - allowed)
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Relacionamentos inválidos em 'include': {', '.join(unknown)}",
+            )
+        return requested
+
+    return dependency
@@ -0,0 +1,113 @@
+"""
+Parâmetros e resposta HTTP das listagens paginadas por cursor.
+
+O corpo da resposta continua sendo a lista de itens; os metadados da
+paginação seguem nos cabeçalhos, o que mantém compatíveis os clientes
+que esperam um array:
+
+- `X-Next-Cursor`: cursor da próxima página (ausente na última);
+- `Link`: URL da próxima página com `rel="next"` (RFC 8288);
+- `X-Total-Count`: total de itens, somente com `include_total=true`.
+
+Exemplo:
+```http
+GET /produtos/?limit=50&order_by=updated_at
+GET /produtos/?limit=50&order_by=updated_at&cursor=<X-Next-Cursor>
+```
+"""
+
+import uuid
+from typing import Any, Callable, Literal, Optional, Type
+
+from fastapi import HTTPException, Query, Request, status
+
+from src.api.responses import DTOResponse
+from src.core.pagination import (
+    DEFAULT_LIMIT,
+    MAX_LIMIT,
+    InvalidCursorError,
+    Page,
+    PageParams,
+    decode_cursor,
+)
+
+PAGINATION_HEADERS = ["X-Next-Cursor", "X-Total-Count", "Link"]
+
+
+def _page_params(id_type: Type[Any]) -> Callable[..., PageParams]:
+    """
+    Cria a dependência de paginação de um recurso cujo `id` é do tipo
+    `id_type` (`int` ou `uuid.UUID`), usado para validar o cursor.
+    """
+
+    def page_params(
+        limit: int = Query(
+            DEFAULT_LIMIT, ge=1, le=MAX_LIMIT, description="Itens por página."
+        ),
+        cursor: Optional[str] = Query(
+            None, description="Valor de `X-Next-Cursor` da página anterior."
+        ),
+        order_by: Literal["id", "updated_at"] = Query(
+            "id", description="Chave de ordenação da listagem."
+        ),
+        include_total: bool = Query(
+            False, description="Inclui o total de itens em `X-Total-Count`."
+        ),
+    ) -> PageParams:
+        """
+        Dependência que lê os parâmetros de paginação da query string.
+
+        Um cursor inválido (malformado, gerado para outra ordenação ou com
+        valores de outro tipo) resulta em 400.
+        """
+        after = None
+        if cursor:
+            try:
+                after = decode_cursor(cursor, order_by, id_type)
+            except InvalidCursorError as exc:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+                ) from exc
+
+        return PageParams(
+            limit=limit, order_by=order_by, after=after, include_total=include_total
+        )
+
+    return page_params
+
+
+page_params = _page_params(int)
+"""Paginação de recursos com `id` inteiro (produtos, bancas)."""
+
+uuid_page_params = _page_params(uuid.UUID)
+"""Paginação de recursos com `id` UUID (usuários)."""
+
+
+def page_response(page: Page, request: Request) -> DTOResponse:
+    """
+    Monta a resposta de uma página: itens no corpo e metadados nos
+    cabeçalhos.
+
+    Parâmetros
+    ----------
+    page : Page
+        Página retornada pelo serviço.
+    request : Request
+        Requisição atual, usada para montar o link da próxima página.
+
+    Retorno
+    -------
+    DTOResponse
+        Resposta com a lista de itens.
+    """
+    headers = {}
+    if page.next_cursor:
+        # Referência relativa: a resposta não depende do `Host` usado.
+        next_url = request.url.include_query_params(cursor=page.next_cursor)
+        next_url = f"{next_url.path}?{next_url.query}"
+        headers["X-Next-Cursor"] = page.next_cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+    if page.total is not None:
+        headers["X-Total-Count"] = str(page.total)
+
+    return DTOResponse(page.items, headers=headers)
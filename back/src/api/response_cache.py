@@ -0,0 +1,206 @@
+"""
+Cache de respostas serializadas das listagens mais acessadas.
+
+Guarda, em memória do processo, os bytes finais da resposta (JSON e suas
+versões comprimidas, ver `src.core.compression`) junto com os cabeçalhos. Um acerto devolve os bytes
+diretamente, sem consultar as linhas, montar DTOs nem codificar JSON.
+
+A chave é o `ETag` calculado por `src.api.conditional.table_validators`,
+que já combina rota, query string e a versão das tabelas envolvidas.
+Qualquer escrita confirmada incrementa a versão da tabela (ver
+`src.core.versioning`) e, com ela, a chave: entradas antigas deixam de
+ser alcançadas e saem pelo LRU. Como a versão é lida do banco a cada
+requisição (uma busca pela chave primária de `table_versions`), a
+invalidação vale também para escritas feitas por outros processos.
+
+O tamanho total é limitado por `APP_RESPONSE_CACHE_MAX_BYTES` (0
+desativa o cache).
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from fastapi import Request, Response
+
+from src.core import compression
+from src.core.config import get_settings
+
+_SKIP_HEADERS = frozenset({"content-length", "content-type", "content-encoding"})
+
+
+@dataclass
+class CachedResponse:
+    """
+    Resposta serializada mantida no cache.
+
+    ## Atributos
+    - **body** (*bytes*): Corpo JSON sem compressão.
+    - **headers** (*dict*): Cabeçalhos da resposta original.
+    - **media_type** (*str*): Tipo de mídia do corpo.
+    - **encoded** (*dict*): Corpo comprimido por codificação; vazio para
+      corpos menores que `Settings.compression_min_bytes`.
+    """
+
+    body: bytes
+    headers: Dict[str, str]
+    media_type: str = "application/json"
+    encoded: Dict[str, bytes] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_response(cls, response: Response) -> "CachedResponse":
+        """
+        Copia corpo e cabeçalhos de uma resposta já renderizada,
+        comprimindo o corpo uma única vez em cada codificação disponível.
+        """
+        body = bytes(response.body)
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name not in _SKIP_HEADERS
+        }
+        encoded = {}
+        if len(body) >= get_settings().compression_min_bytes:
+            headers["Vary"] = "Accept-Encoding"
+            encoded = {
+                name: compression.compress(body, name) for name in compression.ENCODINGS
+            }
+        return cls(
+            body=body,
+            headers=headers,
+            media_type=response.media_type or "application/json",
+            encoded=encoded,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+    def to_response(self, request: Request) -> Response:
+        """
+        Monta a resposta HTTP, escolhendo a codificação aceita pelo
+        cliente.
+        """
+        headers = dict(self.headers)
+        body = self.body
+        encoding = compression.negotiate(
+            request.headers.get("accept-encoding", ""), list(self.encoded)
+        )
+        if encoding is not None:
+            body = self.encoded[encoding]
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type=self.media_type, headers=headers)
+
+
+class ResponseCache:
+    """
+    Cache LRU de respostas serializadas, limitado pelo total de bytes.
+
+    Seguro entre threads: os endpoints síncronos rodam no threadpool.
+
+    ## Parâmetros
+    - **max_bytes** (*int*): Tamanho máximo somado dos corpos guardados.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Retorna a entrada da chave, marcando-a como usada recentemente.
+        """
+        if not self.max_bytes:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: str, response: Response) -> CachedResponse:
+        """
+        Guarda o corpo e os cabeçalhos de uma resposta já renderizada.
+
+        Respostas maiores que o próprio limite do cache não são guardadas.
+
+        Retorno
+        -------
+        CachedResponse
+            Entrada criada (guardada ou não), pronta para ser enviada.
+        """
+        entry = CachedResponse.from_response(response)
+        if entry.size > self.max_bytes:
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+        return entry
+
+    def clear(self) -> None:
+        """
+        Remove todas as entradas e zera as estatísticas.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Retorna ocupação e contadores de acerto/erro.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+response_cache = ResponseCache(get_settings().response_cache_max_bytes)
+
+
+def cached_response(
+    request: Request, key: str, build: Callable[[], Response]
+) -> Response:
+    """
+    Devolve a resposta guardada sob `key` ou, na ausência dela, monta a
+    resposta com `build`, guarda-a e a devolve.
+
+    Parâmetros
+    ----------
+    request : Request
+        Requisição atual (define a codificação da resposta).
+    key : str
+        Chave da representação (o `ETag` da listagem).
+    build : Callable[[], Response]
+        Monta a resposta completa; chamada apenas em caso de falta.
+
+    Retorno
+    -------
+    Response
+        Resposta com os bytes do cache.
+    """
+    entry = response_cache.get(key)
+    if entry is None:
+        entry = response_cache.put(key, build())
+    return entry.to_response(request)
@@ -0,0 +1,71 @@
+"""
+Classes de resposta HTTP utilizadas pelos endpoints.
+
+- `ORJSONResponse` é a classe padrão da aplicação (ver `src.main`):
+  serializa dicionários e listas simples com `orjson`.
+- `DTOResponse` serializa DTOs Pydantic já construídos pelos serviços
+  diretamente para bytes JSON, com o serializador nativo do Pydantic.
+
+Quando um endpoint devolve um `Response`, o FastAPI não valida nem
+converte novamente o conteúdo contra o `response_model`; o
+`response_model` continua declarado apenas para a documentação OpenAPI.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Union
+
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+
+__all__ = ["DTOResponse", "ORJSONResponse", "dto_adapter"]
+
+
+@lru_cache(maxsize=None)
+def dto_adapter(tp: Any) -> TypeAdapter:
+    """
+    Retorna o `TypeAdapter` (em cache) do tipo informado.
+
+    Construir um `TypeAdapter` compila o esquema do tipo; o cache garante
+    que isso ocorra uma única vez por tipo no processo.
+    """
+    return TypeAdapter(tp)
+
+
+class DTOResponse(Response):
+    """
+    Resposta JSON para um DTO ou uma lista de DTOs do mesmo tipo.
+
+    O conteúdo é serializado por `TypeAdapter.dump_json`, sem passar por
+    `dict` intermediário nem por nova validação.
+
+    Parâmetros
+    ----------
+    content : BaseModel | Sequence[BaseModel]
+        DTO (ou lista de DTOs) a ser enviado.
+    status_code : int
+        Código HTTP da resposta (padrão 200).
+    model : type | None
+        Tipo do DTO. Se omitido, é deduzido do conteúdo.
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Union[BaseModel, Sequence[BaseModel]],
+        status_code: int = 200,
+        model: Optional[type] = None,
+        **kwargs,
+    ):
+        self.model = model
+        super().__init__(content, status_code=status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return dto_adapter(self.model or type(content)).dump_json(content)
+
+        items = list(content)
+        if not items:
+            return b"[]"
+        model = self.model or type(items[0])
+        return dto_adapter(List[model]).dump_json(items)
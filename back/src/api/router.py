@@ -1,17 +1,33 @@
 """
 Módulo responsável por centralizar e expor todos os endpoints da aplicação.
+
+Os routers de cada grupo de endpoints são incluídos diretamente na
+aplicação (`include_routers`). O FastAPI recria as rotas a cada
+`include_router`; um router intermediário agrupando os demais faria essa
+cópia duas vezes, aumentando o tempo de inicialização.
 """
 
-from fastapi import APIRouter
-from .endpoints import health, auth, users, banca, produto, pesquisa
+from enum import Enum
+from typing import List, Tuple, Union
+
+from fastapi import APIRouter, FastAPI
+from .endpoints import health, auth, users, banca, produto, pesquisa, debug
+
+# Endpoints disponíveis e as tags com que são registrados
+ROUTERS: List[Tuple[APIRouter, List[Union[str, Enum]]]] = [
+    (health.router, ["Health"]),
+    (auth.router, ["Auth"]),
+    (users.router, ["Users"]),
+    (banca.router, ["bancas"]),
+    (produto.router, ["produtos"]),
+    (pesquisa.router, ["Pesquisa"]),
+    (debug.router, ["Debug"]),
+]
 
-# Router principal da API
-router = APIRouter()
 
-# Registro dos endpoints disponíveis
-router.include_router(health.router, tags=["Health"])
-router.include_router(auth.router, tags=["Auth"])
-router.include_router(users.router, tags=["Users"])
-router.include_router(banca.router, tags=["bancas"])
-router.include_router(produto.router, tags=["produtos"])
-router.include_router(pesquisa.router, tags=["Pesquisa"])
+def include_routers(app: FastAPI) -> None:
+    """
+    Registra todos os endpoints na aplicação.
+    """
+    for router, tags in ROUTERS:
+        app.include_router(router, tags=tags)
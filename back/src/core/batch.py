@@ -0,0 +1,60 @@
+"""
+# Leitura em Lote por Identificadores
+
+Tipos e funções compartilhados pelas leituras `?ids=1,2,3`, que buscam
+vários itens com uma única consulta `IN (...)` em vez de uma requisição
+por item.
+
+Os itens são devolvidos na ordem em que os ids foram pedidos (o banco
+não garante ordem no `IN`), e os ids sem item correspondente são
+informados à parte.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+MAX_BATCH_IDS = 500
+
+
+@dataclass(frozen=True)
+class Batch(Generic[T]):
+    """
+    Resultado de uma leitura em lote.
+
+    ## Atributos
+    - **items** (*List[T]*): Itens encontrados, na ordem dos ids pedidos.
+    - **missing** (*List[int]*): Ids pedidos que não existem.
+    """
+
+    items: List[T]
+    missing: List[int]
+
+
+def make_batch(
+    ids: Sequence[int],
+    rows: Sequence[Any],
+    convert: Callable[[Sequence[Any]], List[T]],
+) -> Batch[T]:
+    """
+    Ordena as linhas lidas conforme os ids pedidos.
+
+    Parâmetros
+    ----------
+    ids : Sequence[int]
+        Ids na ordem pedida pelo cliente.
+    rows : Sequence
+        Objetos ORM lidos com `IN (...)`, em qualquer ordem.
+    convert : Callable
+        Conversão dos objetos ORM para DTOs.
+
+    Retorno
+    -------
+    Batch
+        Itens convertidos e ids ausentes.
+    """
+    by_id = {row.id: row for row in rows}
+    found = [by_id[item_id] for item_id in ids if item_id in by_id]
+    missing = [item_id for item_id in ids if item_id not in by_id]
+    return Batch(items=convert(found), missing=missing)
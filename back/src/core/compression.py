@@ -0,0 +1,128 @@
+"""
+# Compressão de Respostas
+
+Codificações de conteúdo suportadas e negociação com `Accept-Encoding`.
+
+- `gzip`: sempre disponível (biblioteca padrão).
+- `br` (Brotli) e `zstd` (Zstandard): usadas apenas se os pacotes
+  opcionais `brotli` / `zstandard` estiverem instalados.
+
+Em empate de preferência do cliente, o servidor escolhe na ordem de
+`ENCODINGS` (`zstd`, `br`, `gzip`): melhor taxa de compressão para JSON
+com custo de CPU equivalente ou menor que o do gzip nos níveis padrão.
+
+Os níveis são configuráveis (`APP_GZIP_LEVEL`, `APP_BROTLI_QUALITY`,
+`APP_ZSTD_LEVEL`).
+"""
+
+import gzip
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from src.core.config import get_settings
+
+# Pacotes opcionais, sem stubs de tipos; None quando não instalados.
+brotli: Any
+zstandard: Any
+
+try:
+    import brotli  # type: ignore[import]
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard  # type: ignore[import]
+except ImportError:
+    zstandard = None
+
+
+def _gzip(data: bytes) -> bytes:
+    # mtime=0 mantém a saída determinística para o mesmo conteúdo.
+    return gzip.compress(data, compresslevel=get_settings().gzip_level, mtime=0)
+
+
+def _brotli(data: bytes) -> bytes:
+    return brotli.compress(data, quality=get_settings().brotli_quality)
+
+
+def _zstd(data: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=get_settings().zstd_level).compress(data)
+
+
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+if brotli is not None:
+    _COMPRESSORS["br"] = _brotli
+if zstandard is not None:
+    _COMPRESSORS["zstd"] = _zstd
+
+ENCODINGS: Tuple[str, ...] = tuple(
+    name for name in ("zstd", "br", "gzip") if name in _COMPRESSORS
+)
+"""Codificações disponíveis, em ordem de preferência do servidor."""
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+
+
+def is_compressible(media_type: str) -> bool:
+    """
+    Indica se o tipo de mídia se beneficia de compressão.
+    """
+    return media_type.lower().startswith(COMPRESSIBLE_TYPES)
+
+
+def negotiate(
+    accept_encoding: str, available: Sequence[str] = ENCODINGS
+) -> Optional[str]:
+    """
+    Escolhe a codificação a partir do cabeçalho `Accept-Encoding`.
+
+    Considera os pesos (`q`) enviados pelo cliente; `q=0` exclui a
+    codificação e `*` vale para as não citadas. Em empate, prevalece a
+    ordem de `available`.
+
+    Parâmetros
+    ----------
+    accept_encoding : str
+        Valor do cabeçalho `Accept-Encoding`.
+    available : Sequence[str]
+        Codificações oferecidas, em ordem de preferência.
+
+    Retorno
+    -------
+    str | None
+        Codificação escolhida ou None (enviar sem compressão).
+    """
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, *params = (part.strip() for part in item.split(";"))
+        if not name:
+            continue
+        weight = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[name.lower()] = weight
+
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for name in available:
+        weight = weights.get(name, wildcard)
+        if weight > best_weight:
+            best, best_weight = name, weight
+    return best
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    """
+    Comprime `data` com a codificação informada (uma de `ENCODINGS`).
+    """
+    return _COMPRESSORS[encoding](data)
@@ -0,0 +1,116 @@
+"""
+# Configurações da Aplicação
+
+Parâmetros lidos de variáveis de ambiente (prefixo `APP_`) ou de um
+arquivo `.env`, com valores padrão adequados ao desenvolvimento local.
+
+Exemplo:
+```bash
+APP_SLOW_QUERY_MS=50 APP_SQL_DEBUG=true uvicorn src.main:app
+```
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """
+    Configurações gerais da aplicação.
+
+    ## Atributos
+    - **database_url** (*str*): URL de conexão do banco.
+    - **slow_query_ms** (*float*): Consultas com duração igual ou superior
+      a este limite são registradas em log com seus parâmetros.
+    - **n_plus_one_threshold** (*int*): Quantidade de execuções do mesmo
+      comando, em uma única requisição, a partir da qual a requisição é
+      sinalizada como possível N+1.
+    - **sql_debug** (*bool*): Habilita o endpoint `/debug/queries` com o
+      detalhamento das consultas das últimas requisições.
+    - **sql_debug_history** (*int*): Quantidade de requisições mantidas
+      para o endpoint de depuração.
+    - **pool_size** (*int*): Conexões mantidas abertas no pool.
+    - **max_overflow** (*int*): Conexões extras permitidas acima de
+      `pool_size` em momentos de pico.
+    - **pool_timeout** (*float*): Tempo máximo, em segundos, de espera
+      por uma conexão livre.
+    - **response_cache_max_bytes** (*int*): Memória máxima, por processo,
+      do cache de respostas serializadas. 0 desativa o cache.
+    - **compression_min_bytes** (*int*): Tamanho mínimo do corpo para que
+      a resposta seja comprimida.
+    - **compression_offload_bytes** (*int*): Corpos a partir deste tamanho
+      são comprimidos no threadpool, fora do event loop.
+    - **gzip_level** (*int*): Nível do gzip (1 a 9).
+    - **brotli_quality** (*int*): Qualidade do Brotli (0 a 11), se
+      disponível.
+    - **zstd_level** (*int*): Nível do Zstandard (1 a 22), se disponível.
+    - **search_log_batch_size** (*int*): Máximo de registros de pesquisa
+      gravados por `INSERT` em lote.
+    - **search_log_max_pending** (*int*): Capacidade da fila de registros
+      de pesquisa aguardando gravação.
+    - **metrics_dir** (*str | None*): Diretório compartilhado onde cada
+      processo grava o retrato das suas métricas, somadas na coleta de
+      `/metrics`. Sem ele, apenas o processo atual é exposto.
+    - **metrics_flush_seconds** (*float*): Intervalo de gravação do
+      retrato de métricas de cada processo.
+    - **readiness_db_timeout** (*float*): Tempo limite, em segundos, da
+      verificação de conectividade com o banco em `/health/ready`.
+    - **readiness_pool_saturation** (*float*): Fração de conexões do pool
+      em uso a partir da qual o processo é considerado sobrecarregado.
+    - **readiness_queue_saturation** (*float*): Fração da fila de
+      registros de pesquisa a partir da qual o processo é considerado
+      sobrecarregado.
+    - **readiness_max_loop_lag_ms** (*float*): Atraso do event loop a
+      partir do qual o processo é considerado sobrecarregado.
+    - **readiness_overload_seconds** (*float*): Tempo de sobrecarga
+      contínua após o qual `/health/ready` passa a responder 503.
+    - **loop_lag_interval** (*float*): Intervalo, em segundos, entre as
+      medições do atraso do event loop.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="APP_", env_file=".env", extra="ignore"
+    )
+
+    database_url: str = "sqlite:///./data/database.db"
+    pool_size: int = Field(default=5, ge=1)
+    max_overflow: int = Field(default=10, ge=0)
+    pool_timeout: float = Field(default=30.0, gt=0)
+
+    slow_query_ms: float = Field(default=100.0, ge=0)
+    n_plus_one_threshold: int = Field(default=10, ge=2)
+
+    sql_debug: bool = False
+    sql_debug_history: int = Field(default=50, ge=1)
+
+    response_cache_max_bytes: int = Field(default=32 * 1024 * 1024, ge=0)
+
+    compression_min_bytes: int = Field(default=1024, ge=0)
+    compression_offload_bytes: int = Field(default=64 * 1024, ge=0)
+    gzip_level: int = Field(default=6, ge=1, le=9)
+    brotli_quality: int = Field(default=4, ge=0, le=11)
+    zstd_level: int = Field(default=3, ge=1, le=22)
+
+    search_log_batch_size: int = Field(default=500, ge=1)
+    search_log_max_pending: int = Field(default=10_000, ge=1)
+
+    metrics_dir: Optional[str] = None
+    metrics_flush_seconds: float = Field(default=1.0, gt=0)
+
+    readiness_db_timeout: float = Field(default=1.0, gt=0)
+    readiness_pool_saturation: float = Field(default=0.9, gt=0, le=1)
+    readiness_queue_saturation: float = Field(default=0.8, gt=0, le=1)
+    readiness_max_loop_lag_ms: float = Field(default=200.0, gt=0)
+    readiness_overload_seconds: float = Field(default=10.0, ge=0)
+    loop_lag_interval: float = Field(default=0.5, gt=0)
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Retorna a instância única de configurações do processo.
+    """
+    return Settings()
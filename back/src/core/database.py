@@ -6,26 +6,188 @@ de dados da aplicação. A configuração inclui:
 
 - criação do engine de conexão
 - fábrica de sessões para operações transacionais
+- provedor de sessão por requisição, com abertura preguiçosa
+- contabilização de consultas e tempo de banco por requisição, log de
+  consultas lentas e detecção de comandos repetidos (N+1)
 - base declarativa utilizada pelos modelos ORM
+- criação das tabelas na inicialização da aplicação (`init_db`)
 
 Todos os módulos que interagem com o banco devem utilizar esta camada
 como ponto central de inicialização e gerenciamento.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Generator, Iterator, Optional, Set, Union, cast
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.orm import Session, configure_mappers, declarative_base, sessionmaker
+
+from src.core.config import get_settings
+from src.core.metrics import InstrumentedQueuePool
+
+logger = logging.getLogger(__name__)
+
+_MAX_LOGGED_PARAMS = 500
+
+# Opção de execução que exclui um comando da detecção de N+1, para
+# comandos repetidos por natureza (por exemplo, um por transação).
+SKIP_N_PLUS_ONE = "skip_n_plus_one"
+
+
+# -------------------------------------------------------------------
+# Estatísticas de consultas por requisição
+# -------------------------------------------------------------------
+@dataclass
+class QueryStats:
+    """
+    Acumula o número de consultas e o tempo gasto no banco.
+
+    ## Atributos
+    - **queries** (*int*): Quantidade de comandos enviados ao banco.
+    - **db_time** (*float*): Tempo total de execução, em segundos.
+    - **statements** (*Counter[str]*): Execuções por formato de comando
+      (texto SQL com parâmetros ainda não substituídos).
+    - **exempt** (*Set[str]*): Comandos fora da detecção de N+1: os
+      enviados com `executemany` (um lote por execução) e os marcados com
+      a opção de execução `SKIP_N_PLUS_ONE`.
+    """
+
+    queries: int = 0
+    db_time: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+    exempt: Set[str] = field(default_factory=set)
+
+    @property
+    def db_time_ms(self) -> float:
+        """Tempo total de banco em milissegundos."""
+        return self.db_time * 1000.0
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """
+        Retorna os comandos executados ao menos `threshold` vezes.
+
+        Um mesmo comando repetido muitas vezes em uma requisição indica,
+        em geral, um padrão N+1 (uma consulta por item de uma lista).
+        """
+        return {
+            statement: count
+            for statement, count in self.statements.most_common()
+            if count >= threshold and statement not in self.exempt
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar(
+    "query_stats", default=None
+)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Abre um escopo de contabilização de consultas.
+
+    Todas as consultas executadas no contexto atual (inclusive em threads
+    do threadpool iniciadas a partir dele) são somadas ao objeto retornado.
+
+    ## Retorno
+    - **QueryStats**: Acumulador associado ao escopo.
+    """
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """
+    Retorna o acumulador do escopo atual, se houver.
+    """
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += elapsed
+        stats.statements[statement] += 1
+        if executemany or context.execution_options.get(SKIP_N_PLUS_ONE, False):
+            stats.exempt.add(statement)
+
+    elapsed_ms = elapsed * 1000.0
+    if elapsed_ms >= get_settings().slow_query_ms:
+        logger.warning(
+            "Consulta lenta (%.1f ms): %s | parâmetros: %s",
+            elapsed_ms,
+            statement,
+            repr(parameters)[:_MAX_LOGGED_PARAMS],
+        )
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """
+    Registra no engine os eventos de contabilização de consultas e de
+    log de consultas lentas (`Settings.slow_query_ms`).
+
+    ## Parâmetros
+    - **engine** (*Engine*): Engine a ser instrumentado.
+
+    ## Retorno
+    - **Engine**: O próprio engine, para encadeamento.
+    """
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
+
+def _enable_foreign_keys(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def enable_sqlite_foreign_keys(engine: Engine) -> Engine:
+    """
+    Habilita a verificação de chaves estrangeiras em cada nova conexão
+    SQLite (`PRAGMA foreign_keys=ON`).
+
+    Sem essa opção o SQLite ignora as restrições e os `ON DELETE CASCADE`
+    declarados nos modelos.
+
+    ## Parâmetros
+    - **engine** (*Engine*): Engine SQLite a ser configurado.
+
+    ## Retorno
+    - **Engine**: O próprio engine, para encadeamento.
+    """
+    event.listen(engine, "connect", _enable_foreign_keys)
+    return engine
 
 
 # -------------------------------------------------------------------
 # Engine Factory
 # -------------------------------------------------------------------
-def create_db_engine(url: str = "sqlite:///./data/database.db"):
+def create_db_engine(url: Union[str, URL, None] = None):
     """
     Cria e retorna o engine de banco de dados.
 
     ## Parâmetros
-    - **url** (*str*): Caminho de conexão do banco.
-      Por padrão, utiliza SQLite armazenado em arquivo local.
+    - **url** (*str | URL | None*): Caminho de conexão do banco.
+      Por padrão, utiliza `Settings.database_url` (SQLite em arquivo local).
 
     ## Retorno
     - **Engine**: Instância configurada para comunicação com o banco.
@@ -33,8 +195,28 @@ def create_db_engine(url: str = "sqlite:///./data/database.db"):
     ## Observações
     - `check_same_thread=False` é necessário em ambientes que executam
       múltiplas threads, garantindo acesso seguro ao SQLite.
+    - O engine já sai instrumentado para contabilizar consultas
+      (ver `track_queries`) e com chaves estrangeiras habilitadas, de
+      modo que as remoções em cascata são executadas pelo próprio banco.
+    - Bancos em arquivo usam `InstrumentedQueuePool`, dimensionado por
+      `Settings.pool_size`, `max_overflow` e `pool_timeout`, que mede o
+      tempo de espera por conexões (ver `src.core.metrics`). Bancos em
+      memória mantêm o pool padrão do SQLAlchemy.
     """
-    return create_engine(url, connect_args={"check_same_thread": False})
+    settings = get_settings()
+    url = make_url(url or settings.database_url)
+
+    pool_args = {}
+    if url.database not in (None, "", ":memory:"):
+        pool_args = {
+            "poolclass": InstrumentedQueuePool,
+            "pool_size": settings.pool_size,
+            "max_overflow": settings.max_overflow,
+            "pool_timeout": settings.pool_timeout,
+        }
+
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **pool_args)
+    return instrument_engine(enable_sqlite_foreign_keys(engine))
 
 
 engine = create_db_engine()
@@ -56,13 +238,71 @@ def create_session_factory(engine):
     ## Detalhes
     - `autocommit=False`: o commit deve ser realizado manualmente.
     - `autoflush=False`: evita gravações automáticas prematuras.
+    - `expire_on_commit=False`: os objetos continuam utilizáveis após o
+      `commit` da unidade de trabalho, sem novo SELECT para montar DTOs.
     """
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
 
 
 SessionLocal = create_session_factory(engine)
 
 
+# -------------------------------------------------------------------
+# Request-scoped Session Provider
+# -------------------------------------------------------------------
+class LazySession:
+    """
+    Sessão preguiçosa: a `Session` real só é criada no primeiro uso.
+
+    Requisições que falham na validação, ou que são respondidas sem
+    consultar o banco, nunca instanciam a sessão nem retiram conexões
+    do pool.
+
+    ## Parâmetros
+    - **factory** (*Callable[[], Session]*): Fábrica da sessão real.
+    """
+
+    def __init__(self, factory: Callable[[], Session]):
+        self._factory = factory
+        self._session: Optional[Session] = None
+
+    @property
+    def started(self) -> bool:
+        """Indica se a sessão real já foi criada."""
+        return self._session is not None
+
+    def __getattr__(self, name: str):
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    def close(self) -> None:
+        """Fecha a sessão real, caso tenha sido criada."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+
+def get_db() -> Generator[Session, None, None]:
+    """
+    Dependência FastAPI que fornece uma sessão por requisição.
+
+    ## Retorno
+    - **Session**: Sessão preguiçosa, fechada ao fim da requisição.
+
+    ## Observações
+    - Único provedor de sessão da API; os endpoints não devem instanciar
+      `SessionLocal` diretamente.
+    """
+    db = LazySession(SessionLocal)
+    try:
+        yield cast(Session, db)
+    finally:
+        db.close()
+
+
 # -------------------------------------------------------------------
 # Declarative Base
 # -------------------------------------------------------------------
@@ -81,3 +321,83 @@ def create_declarative_base():
 
 
 Base = create_declarative_base()
+
+
+# -------------------------------------------------------------------
+# Inicialização do Esquema
+# -------------------------------------------------------------------
+_initialized = False
+
+# Chaves gravadas como `BinaryUUID`. Bancos criados antes dessa mudança
+# guardam os mesmos valores como texto de 36 caracteres.
+_UUID_KEYS = (("users", "id"), ("addresses", "id"))
+
+
+def check_uuid_storage(engine: Engine) -> None:
+    """
+    Verifica se as chaves UUID do banco estão no formato atual (16 bytes).
+
+    O `create_all` não altera tabelas existentes: um arquivo SQLite criado
+    antes da adoção de `BinaryUUID` mantém as chaves como texto, que a
+    aplicação não consegue ler nem referenciar.
+
+    Exceções
+    --------
+    RuntimeError
+        Se alguma chave ainda estiver gravada como texto. O banco deve ser
+        recriado (ver `docs/models.md`).
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    tables = set(inspect(engine).get_table_names())
+    with engine.connect() as conn:
+        for table, column in _UUID_KEYS:
+            if table not in tables:
+                continue
+            legacy = conn.execute(
+                text(f"SELECT 1 FROM {table} WHERE typeof({column}) = 'text' LIMIT 1")
+            ).first()
+            if legacy is not None:
+                raise RuntimeError(
+                    f"A tabela '{table}' guarda UUIDs como texto, formato "
+                    "anterior ao atual (16 bytes). Recrie o banco "
+                    f"({engine.url.database}) antes de iniciar a aplicação."
+                )
+
+
+def init_db() -> None:
+    """
+    Prepara o banco e os modelos para a primeira requisição.
+
+    - Cria as tabelas ausentes (`create_all`) e recusa bancos com chaves
+      UUID no formato antigo (`check_uuid_storage`).
+    - Configura os mapeamentos do ORM (`configure_mappers`), trabalho que
+      de outro modo recairia sobre a primeira consulta.
+
+    ## Observações
+    - Chamada no `lifespan` da aplicação, e não no import: importar
+      `src.main` (testes, ferramentas, workers com `preload_app`) não
+      acessa o banco.
+    - Executa uma única vez por processo. Com o Gunicorn, o processo
+      mestre a executa antes de criar os workers (ver `gunicorn.conf.py`),
+      evitando que vários workers criem as mesmas tabelas ao mesmo tempo.
+    """
+    global _initialized
+    if _initialized:
+        return
+
+    # Registra todos os modelos no metadata antes de criar as tabelas.
+    from src.models import (  # noqa: F401
+        address,
+        banca,
+        pesquisa,
+        produto_model,
+        table_version,
+        user,
+    )
+
+    Base.metadata.create_all(bind=engine)
+    check_uuid_storage(engine)
+    configure_mappers()
+    _initialized = True
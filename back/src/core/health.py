@@ -0,0 +1,290 @@
+"""
+# Verificações de Saúde
+
+Verificações usadas pelos endpoints de prontidão (`/health/ready`) para
+decidir se o processo deve continuar recebendo tráfego.
+
+Falhas de conectividade com o banco tornam o processo não pronto
+imediatamente; os sinais de sobrecarga (pool, fila, event loop) só
+depois de persistirem por `APP_READINESS_OVERLOAD_SECONDS`.
+
+- `check_database`: conectividade com o banco, com tempo limite.
+- `check_pool`: ocupação do pool de conexões.
+- `check_queue`: ocupação de uma fila interna (por exemplo, a de
+  registros de pesquisa).
+- `check_loop_lag`: atraso do event loop medido por `LoopLagMonitor`.
+- `OverloadTracker`: transforma sinais momentâneos de sobrecarga em
+  "sobrecarga sustentada", para que picos curtos não tirem o processo
+  de circulação.
+
+Cada verificação retorna um `CheckResult`; nenhuma lança exceções.
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+import anyio
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+from src.core.config import get_settings
+
+# Sinaliza uma verificação de banco em andamento. A verificação roda em
+# uma thread própria, fora do threadpool dos endpoints (que pode estar
+# esgotado), e uma thread presa no driver não pode ser interrompida:
+# enquanto ela não termina, as verificações seguintes falham sem criar
+# outra thread.
+_database_busy = threading.Event()
+
+
+@dataclass
+class CheckResult:
+    """
+    Resultado de uma verificação.
+
+    ## Atributos
+    - **ok** (*bool*): Indica se a verificação passou.
+    - **detail** (*dict*): Valores medidos, expostos na resposta.
+    """
+
+    ok: bool
+    detail: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"ok": self.ok, **self.detail}
+
+
+# -------------------------------------------------------------------
+# Banco de dados
+# -------------------------------------------------------------------
+def _ping(engine: Engine) -> None:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def _start_probe(
+    engine: Engine, loop: asyncio.AbstractEventLoop
+) -> "asyncio.Future[Optional[Exception]]":
+    """
+    Executa `_ping` em uma thread própria; o futuro recebe a exceção
+    levantada, ou None em caso de sucesso.
+    """
+    done: "asyncio.Future[Optional[Exception]]" = loop.create_future()
+
+    def resolve(error: Optional[Exception]) -> None:
+        if not done.done():
+            done.set_result(error)
+
+    def run() -> None:
+        error: Optional[Exception] = None
+        try:
+            _ping(engine)
+        except Exception as exc:
+            error = exc
+        finally:
+            _database_busy.clear()
+        try:
+            loop.call_soon_threadsafe(resolve, error)
+        except RuntimeError:
+            pass  # event loop já encerrado
+
+    _database_busy.set()
+    threading.Thread(target=run, name="health-db", daemon=True).start()
+    return done
+
+
+async def check_database(engine: Engine, timeout: float) -> CheckResult:
+    """
+    Executa `SELECT 1` no banco, aguardando no máximo `timeout` segundos
+    (incluída a espera por uma conexão do pool).
+
+    Uma verificação que expira continua em execução até o driver
+    retornar; até lá, as chamadas seguintes falham de imediato, sem
+    iniciar outra consulta.
+
+    Parâmetros
+    ----------
+    engine : Engine
+        Engine a verificar.
+    timeout : float
+        Tempo limite, em segundos.
+
+    Retorno
+    -------
+    CheckResult
+        `latency_ms` em caso de sucesso; `error` em caso de falha, de
+        tempo esgotado ou de verificação anterior ainda em andamento.
+    """
+    if _database_busy.is_set():
+        return CheckResult(False, {"error": "verificação anterior em andamento"})
+
+    start = time.perf_counter()
+    done = _start_probe(engine, asyncio.get_running_loop())
+    try:
+        with anyio.fail_after(timeout):
+            error = await done
+    except TimeoutError:
+        return CheckResult(False, {"error": f"timeout após {timeout:g} s"})
+    if error is not None:
+        return CheckResult(False, {"error": type(error).__name__})
+
+    latency_ms = (time.perf_counter() - start) * 1000.0
+    return CheckResult(True, {"latency_ms": round(latency_ms, 3)})
+
+
+# -------------------------------------------------------------------
+# Sinais de sobrecarga
+# -------------------------------------------------------------------
+def check_pool(engine: Engine, max_saturation: float) -> CheckResult:
+    """
+    Compara as conexões em uso com a capacidade do pool
+    (`pool_size + max_overflow`).
+
+    Pools sem limite de conexões (por exemplo, bancos em memória ou
+    `max_overflow=-1`) sempre passam.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool) or pool._max_overflow < 0:
+        return CheckResult(True, {"saturation": None})
+
+    saturation = pool.checkedout() / (pool.size() + pool._max_overflow)
+    return CheckResult(
+        saturation < max_saturation,
+        {"saturation": round(saturation, 3), "max": max_saturation},
+    )
+
+
+def check_queue(pending: int, capacity: int, max_saturation: float) -> CheckResult:
+    """
+    Compara os itens pendentes de uma fila com a sua capacidade.
+    """
+    saturation = pending / capacity if capacity else 0.0
+    return CheckResult(
+        saturation < max_saturation,
+        {"pending": pending, "saturation": round(saturation, 3), "max": max_saturation},
+    )
+
+
+class LoopLagMonitor:
+    """
+    Mede o atraso do event loop.
+
+    Uma tarefa dorme `interval` segundos repetidamente e registra quanto
+    acordou depois do previsto: callbacks demorados ou código bloqueante
+    no loop atrasam o despertar na mesma medida em que atrasam as
+    requisições.
+
+    ## Parâmetros
+    - **interval** (*float*): Intervalo entre as medições, em segundos.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.lag = 0.0
+        self._expected: Optional[float] = None
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """
+        Inicia a medição no event loop atual.
+        """
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Interrompe a medição.
+        """
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self._expected = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag = max(loop.time() - self._expected, 0.0)
+
+    def current(self) -> Optional[float]:
+        """
+        Atraso atual, em segundos, ou None se a medição não foi iniciada.
+
+        Considera também a medição em andamento: se o despertar previsto
+        já passou, o atraso acumulado até agora é levado em conta.
+        """
+        if not self.running or self._expected is None:
+            return None
+        overdue = asyncio.get_running_loop().time() - self._expected
+        return max(self.lag, overdue, 0.0)
+
+
+def check_loop_lag(monitor: LoopLagMonitor, max_lag_ms: float) -> CheckResult:
+    """
+    Compara o atraso atual do event loop com `max_lag_ms`.
+
+    Sem medição em andamento (por exemplo, fora do ciclo de vida da
+    aplicação), a verificação passa.
+    """
+    lag = monitor.current()
+    if lag is None:
+        return CheckResult(True, {"lag_ms": None})
+    lag_ms = lag * 1000.0
+    return CheckResult(
+        lag_ms < max_lag_ms, {"lag_ms": round(lag_ms, 3), "max": max_lag_ms}
+    )
+
+
+class OverloadTracker:
+    """
+    Registra desde quando o processo está sobrecarregado.
+
+    Cada verificação sem sobrecarga reinicia a contagem; quem chama
+    compara a duração retornada com o limite de sobrecarga sustentada
+    (`APP_READINESS_OVERLOAD_SECONDS`).
+
+    ## Parâmetros
+    - **clock** (*Callable[[], float]*): Relógio monotônico, em segundos.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._since: Optional[float] = None
+
+    def update(self, overloaded: bool) -> float:
+        """
+        Atualiza o estado com o resultado da verificação atual.
+
+        Retorno
+        -------
+        float
+            Há quantos segundos a sobrecarga persiste (0 sem sobrecarga).
+        """
+        now = self._clock()
+        if not overloaded:
+            self._since = None
+            return 0.0
+        if self._since is None:
+            self._since = now
+        return now - self._since
+
+    def reset(self) -> None:
+        self._since = None
+
+
+loop_lag = LoopLagMonitor(get_settings().loop_lag_interval)
+overload = OverloadTracker()
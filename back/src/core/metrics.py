@@ -0,0 +1,159 @@
+"""
+# Métricas de Infraestrutura
+
+Coleta de métricas do pool de conexões e do threadpool da aplicação,
+usadas para diagnosticar se a latência vem da espera por conexões ou por
+threads livres.
+
+- `Histogram`: histograma cumulativo de durações, seguro entre threads.
+- `InstrumentedQueuePool`: `QueuePool` que mede o tempo de cada
+  `checkout` de conexão e conta os `checkouts` que expiraram.
+- `pool_stats` / `threadpool_stats`: retratos atuais para exposição
+  no endpoint de métricas.
+"""
+
+import bisect
+import itertools
+import threading
+import time
+from typing import Any, Dict, Sequence
+
+import anyio.to_thread
+from sqlalchemy import exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+
+class Histogram:
+    """
+    Histograma cumulativo de durações (em segundos).
+
+    Cada observação é contada em todos os intervalos cujo limite superior
+    (`le`) é maior ou igual ao valor, no formato usado pelo Prometheus.
+
+    ## Parâmetros
+    - **buckets** (*Sequence[float]*): Limites superiores, em ordem
+      crescente. O intervalo `+Inf` é sempre incluído.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        # Contagem por intervalo (não cumulativa); o acúmulo é feito no
+        # retrato, mantendo `observe` em O(log n).
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """
+        Registra uma observação.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._sum += value
+            self._counts[index] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retorna contagens cumulativas por limite, total e soma.
+        """
+        with self._lock:
+            counts = list(itertools.accumulate(self._counts))
+            total = self._sum
+        labels = [str(b) for b in self.buckets] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, counts)),
+            "count": counts[-1],
+            "sum": total,
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    `QueuePool` que registra o tempo de espera de cada `checkout`.
+
+    O tempo medido inclui a espera por uma conexão livre e, quando há
+    folga de `overflow`, a abertura de uma nova conexão. `checkouts` que
+    excedem `pool_timeout` são contados em `checkout_timeouts`.
+
+    As métricas pertencem à instância do pool; `engine.dispose()` cria um
+    novo pool e, portanto, reinicia as contagens.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_time = Histogram()
+        self.checkout_timeouts = 0
+        self._timeouts_lock = threading.Lock()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            with self._timeouts_lock:
+                self.checkout_timeouts += 1
+            raise
+        finally:
+            self.wait_time.observe(time.perf_counter() - start)
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Retorna o estado atual do pool de conexões do engine.
+
+    ## Retorno
+    - **dict**: Tamanho configurado, conexões em uso e ociosas, overflow
+      e, para `InstrumentedQueuePool`, o histograma de espera e o número
+      de `checkouts` expirados.
+    """
+    pool = engine.pool
+    stats: Dict[str, Any] = {"class": type(pool).__name__}
+
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+
+    if isinstance(pool, InstrumentedQueuePool):
+        stats["checkout_timeouts"] = pool.checkout_timeouts
+        stats["checkout_wait_seconds"] = pool.wait_time.snapshot()
+
+    return stats
+
+
+def threadpool_stats() -> Dict[str, Any]:
+    """
+    Retorna a ocupação do threadpool do AnyIO, onde rodam os endpoints
+    síncronos.
+
+    Deve ser chamada de dentro do event loop.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    statistics = limiter.statistics()
+    return {
+        "total_tokens": limiter.total_tokens,
+        "borrowed_tokens": statistics.borrowed_tokens,
+        "tasks_waiting": statistics.tasks_waiting,
+    }
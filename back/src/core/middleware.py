@@ -0,0 +1,270 @@
+"""
+# Middlewares da Aplicação
+
+Middlewares ASGI de infraestrutura registrados em `src.main`.
+
+- `QueryStatsMiddleware`: contabiliza as consultas de cada requisição.
+- `MetricsMiddleware`: alimenta as métricas Prometheus por rota.
+- `CompressionMiddleware`: comprime as respostas (gzip, Brotli, Zstandard).
+
+Os middlewares são implementados diretamente sobre a interface ASGI,
+sem `BaseHTTPMiddleware`, para não adicionar tarefas extras nem cópias
+de corpo em cada requisição.
+"""
+
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List
+
+import anyio.to_thread
+
+from src.core import compression
+from src.core.prometheus import registry
+from src.core.config import get_settings
+from src.core.database import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+_recent_reports: Deque[Dict[str, Any]] = deque(maxlen=get_settings().sql_debug_history)
+
+
+def recent_query_reports() -> List[Dict[str, Any]]:
+    """
+    Retorna os relatórios de consultas das últimas requisições, da mais
+    recente para a mais antiga.
+
+    Os relatórios só são coletados com `Settings.sql_debug` habilitado.
+    """
+    return list(reversed(_recent_reports))
+
+
+def _build_report(scope, stats: QueryStats, threshold: int) -> Dict[str, Any]:
+    return {
+        "method": scope["method"],
+        "path": scope["path"],
+        "queries": stats.queries,
+        "db_time_ms": round(stats.db_time_ms, 3),
+        "n_plus_one": stats.repeated(threshold),
+        "statements": dict(stats.statements.most_common()),
+    }
+
+
+class QueryStatsMiddleware:
+    """
+    Contabiliza as consultas executadas durante cada requisição HTTP.
+
+    - O acumulador (`QueryStats`) fica disponível em
+      `request.state.db_stats` para os endpoints e demais middlewares.
+    - A resposta recebe os cabeçalhos `X-DB-Queries` e `X-DB-Time-ms`,
+      com os valores contabilizados até o envio dos cabeçalhos.
+    - Comandos repetidos ao menos `Settings.n_plus_one_threshold` vezes
+      são registrados em log como possível N+1, exceto os lotes enviados
+      com `executemany` e os marcados com `SKIP_N_PLUS_ONE` (ver
+      `QueryStats.exempt`).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+
+        with track_queries() as stats:
+            scope.setdefault("state", {})["db_stats"] = stats
+
+            async def send_with_stats(message):
+                if message["type"] == "http.response.start":
+                    headers = list(message.get("headers", []))
+                    headers.append((b"x-db-queries", str(stats.queries).encode()))
+                    headers.append(
+                        (b"x-db-time-ms", f"{stats.db_time_ms:.2f}".encode())
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_stats)
+            finally:
+                self._report(scope, stats, settings)
+
+    @staticmethod
+    def _report(scope, stats: QueryStats, settings) -> None:
+        logger.debug(
+            "%s %s: %d consulta(s), %.2f ms de banco",
+            scope["method"],
+            scope["path"],
+            stats.queries,
+            stats.db_time_ms,
+        )
+
+        for statement, count in stats.repeated(settings.n_plus_one_threshold).items():
+            logger.warning(
+                "Possível N+1 em %s %s: %d execuções de %s",
+                scope["method"],
+                scope["path"],
+                count,
+                statement,
+            )
+
+        if settings.sql_debug:
+            _recent_reports.append(
+                _build_report(scope, stats, settings.n_plus_one_threshold)
+            )
+
+
+class MetricsMiddleware:
+    """
+    Registra, para cada requisição HTTP, as métricas expostas em
+    `/metrics` (ver `src.core.prometheus`).
+
+    - `http_requests_total` e `http_request_duration_seconds`, por
+      método, modelo de rota (por exemplo, `/produtos/{produto_id}`) e
+      status. Requisições que não correspondem a nenhuma rota usam a
+      rota `<unmatched>`, evitando uma série por URL.
+    - `http_requests_in_progress`, por método (a rota só é conhecida
+      após o roteamento).
+    - `db_queries_total` e `db_query_duration_seconds_total`, lidos do
+      acumulador de `QueryStatsMiddleware`, que deve envolver este
+      middleware.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        start = time.perf_counter()
+        registry.add("http_requests_in_progress", {"method": method}, 1)
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            registry.add("http_requests_in_progress", {"method": method}, -1)
+            route = getattr(scope.get("route"), "path", None) or "<unmatched>"
+            labels = {"method": method, "route": route}
+            registry.inc("http_requests_total", {**labels, "status": str(status)})
+            registry.observe("http_request_duration_seconds", labels, elapsed)
+
+            stats = scope.get("state", {}).get("db_stats")
+            if stats is not None and stats.queries:
+                registry.inc("db_queries_total", {"route": route}, stats.queries)
+                registry.inc(
+                    "db_query_duration_seconds_total", {"route": route}, stats.db_time
+                )
+
+
+class CompressionMiddleware:
+    """
+    Comprime as respostas conforme o `Accept-Encoding` do cliente.
+
+    - Apenas corpos completos (sem streaming), de tipos textuais (ver
+      `compression.is_compressible`) e com ao menos
+      `Settings.compression_min_bytes` são comprimidos.
+    - Corpos a partir de `Settings.compression_offload_bytes` são
+      comprimidos no threadpool, sem bloquear o event loop.
+    - Respostas que já possuem `Content-Encoding` (por exemplo, vindas do
+      cache de respostas) são repassadas sem alteração.
+    - Respostas elegíveis recebem `Vary: Accept-Encoding`, comprimidas
+      ou não, para que caches intermediários separem as variantes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = get_settings()
+        accept = _header(scope["headers"], b"accept-encoding")
+        encoding = compression.negotiate(accept) if accept else None
+        start = None
+
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            pending, start = start, None
+            body = message.get("body", b"")
+            headers = pending.get("headers", [])
+            eligible = (
+                not message.get("more_body", False)
+                and pending["status"] not in (204, 304)
+                and len(body) >= settings.compression_min_bytes
+                and not _header(headers, b"content-encoding")
+                and compression.is_compressible(_header(headers, b"content-type"))
+            )
+            if not eligible:
+                await send(pending)
+                await send(message)
+                return
+
+            headers = _with_vary(headers)
+            if encoding is not None:
+                if len(body) >= settings.compression_offload_bytes:
+                    compressed = await anyio.to_thread.run_sync(
+                        compression.compress, body, encoding
+                    )
+                else:
+                    compressed = compression.compress(body, encoding)
+                if len(compressed) < len(body):
+                    body = compressed
+                    headers = [
+                        (name, value)
+                        for name, value in headers
+                        if name.lower() != b"content-length"
+                    ]
+                    headers.append((b"content-encoding", encoding.encode()))
+                    headers.append((b"content-length", str(len(body)).encode()))
+
+            await send({**pending, "headers": headers})
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def _header(headers, name: bytes) -> str:
+    """
+    Retorna o valor do cabeçalho ASGI informado (ou string vazia).
+    """
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return ""
+
+
+def _with_vary(headers) -> list:
+    """
+    Acrescenta `Accept-Encoding` ao cabeçalho `Vary`.
+    """
+    headers = list(headers)
+    for i, (key, value) in enumerate(headers):
+        if key.lower() == b"vary":
+            if b"accept-encoding" not in value.lower():
+                headers[i] = (key, value + b", Accept-Encoding")
+            return headers
+    headers.append((b"vary", b"Accept-Encoding"))
+    return headers
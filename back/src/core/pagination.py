@@ -0,0 +1,237 @@
+"""
+# Paginação por Cursor (keyset)
+
+Tipos e funções compartilhados pelas listagens paginadas.
+
+Em vez de `OFFSET`, cada página continua a partir da chave da última
+linha entregue (`WHERE (chave) > (última chave) ORDER BY chave LIMIT n`).
+Assim:
+
+- o custo de cada página é constante (busca direta no índice), qualquer
+  que seja a posição na listagem;
+- inserções concorrentes não deslocam as páginas seguintes: nenhuma
+  linha já existente é repetida ou pulada.
+
+Ordenações suportadas (`ORDER_KEYS`):
+- `id`: pelo identificador;
+- `updated_at`: pela data de alteração, com desempate pelo `id`.
+
+O cursor é opaco para o cliente: um JSON em base64 (URL-safe) com a
+ordenação e os valores da chave da última linha. Por vir do cliente, o
+cursor é validado contra o tipo do `id` de cada recurso (inteiro ou
+UUID) antes de chegar ao banco.
+"""
+
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+ORDER_KEYS = {
+    "id": ("id",),
+    "updated_at": ("updated_at", "id"),
+}
+
+_DATETIME_FIELDS = frozenset({"updated_at"})
+
+# Intervalo de uma coluna INTEGER do SQLite (64 bits com sinal).
+_MIN_INT, _MAX_INT = -(2**63), 2**63 - 1
+
+
+class InvalidCursorError(ValueError):
+    """
+    Cursor malformado ou gerado para outra ordenação.
+    """
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """
+    Parâmetros de uma página solicitada.
+
+    ## Atributos
+    - **limit** (*int*): Quantidade máxima de itens.
+    - **order_by** (*str*): Chave de ordenação (ver `ORDER_KEYS`).
+    - **after** (*tuple | None*): Chave da última linha da página anterior;
+      None na primeira página.
+    - **include_total** (*bool*): Se o total de linhas deve ser contado.
+    """
+
+    limit: int = DEFAULT_LIMIT
+    order_by: str = "id"
+    after: Optional[Tuple[Any, ...]] = None
+    include_total: bool = False
+
+
+@dataclass
+class Page(Generic[T]):
+    """
+    Página de resultados.
+
+    ## Atributos
+    - **items** (*list*): Itens da página, na ordem da chave.
+    - **next_cursor** (*str | None*): Cursor da próxima página; None
+      quando esta é a última.
+    - **total** (*int | None*): Total de linhas da listagem, quando
+      solicitado.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def encode_cursor(order_by: str, values: Sequence[Any]) -> str:
+    """
+    Gera o cursor opaco para a chave informada.
+
+    Parâmetros
+    ----------
+    order_by : str
+        Chave de ordenação.
+    values : Sequence
+        Valores da chave, na ordem de `ORDER_KEYS[order_by]`.
+
+    Retorno
+    -------
+    str
+        Cursor em base64 URL-safe, sem preenchimento.
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps([order_by, *payload], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _decode_id(value: Any, id_type: Type[Any]) -> Any:
+    """
+    Valida o `id` de um cursor: inteiro de 64 bits ou UUID em texto.
+    """
+    if id_type is int:
+        if (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and _MIN_INT <= value <= _MAX_INT
+        ):
+            return value
+    elif isinstance(value, str):
+        try:
+            return str(uuid.UUID(value))
+        except ValueError:
+            pass
+    raise InvalidCursorError("Cursor inválido.")
+
+
+def decode_cursor(
+    cursor: str, order_by: str, id_type: Type[Any] = int
+) -> Tuple[Any, ...]:
+    """
+    Recupera a chave contida em um cursor.
+
+    Parâmetros
+    ----------
+    cursor : str
+        Cursor recebido do cliente.
+    order_by : str
+        Ordenação da requisição atual.
+    id_type : type
+        Tipo do `id` do recurso: `int` ou `uuid.UUID` (recebido como
+        texto).
+
+    Retorno
+    -------
+    tuple
+        Valores da chave, na ordem de `ORDER_KEYS[order_by]`.
+
+    Exceções
+    --------
+    InvalidCursorError
+        Se o cursor for malformado, pertencer a outra ordenação ou tiver
+        valores de tipo diferente do da chave.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursorError("Cursor inválido.") from exc
+
+    fields = ORDER_KEYS.get(order_by, ())
+    if (
+        not isinstance(data, list)
+        or len(data) != len(fields) + 1
+        or data[0] != order_by
+    ):
+        raise InvalidCursorError("Cursor inválido para esta ordenação.")
+
+    values = []
+    for field, value in zip(fields, data[1:]):
+        if field in _DATETIME_FIELDS:
+            try:
+                value = datetime.fromisoformat(value)
+            except (TypeError, ValueError) as exc:
+                raise InvalidCursorError("Cursor inválido.") from exc
+        elif field == "id":
+            value = _decode_id(value, id_type)
+        values.append(value)
+    return tuple(values)
+
+
+def make_page(
+    rows: Sequence[Any],
+    params: PageParams,
+    convert: Callable[[Sequence[Any]], List[T]],
+    total: Optional[int] = None,
+) -> Page[T]:
+    """
+    Monta a página a partir das linhas lidas pelo repositório.
+
+    O repositório lê `limit + 1` linhas: a linha excedente apenas indica
+    que existe uma próxima página e não é entregue.
+
+    Parâmetros
+    ----------
+    rows : Sequence
+        Objetos ORM em ordem de chave (até `limit + 1`).
+    params : PageParams
+        Parâmetros da página solicitada.
+    convert : Callable
+        Conversão dos objetos ORM para DTOs.
+    total : int | None
+        Total de linhas, quando contado.
+
+    Retorno
+    -------
+    Page
+        Itens convertidos, cursor seguinte e total.
+    """
+    has_more = len(rows) > params.limit
+    rows = rows[: params.limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        next_cursor = encode_cursor(
+            params.order_by,
+            [getattr(last, field) for field in ORDER_KEYS[params.order_by]],
+        )
+
+    return Page(items=convert(rows), next_cursor=next_cursor, total=total)
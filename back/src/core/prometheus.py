@@ -0,0 +1,436 @@
+"""
+# Métricas no Formato Prometheus
+
+Contadores, medidores e histogramas mantidos em memória pelo processo e
+expostos no formato texto do Prometheus (`/metrics`).
+
+Registro
+--------
+`registry` guarda os valores do processo atual. Cada atualização custa
+uma busca em dicionário e um `lock`, sem E/S.
+
+Vários processos (workers)
+--------------------------
+Com `APP_METRICS_DIR` definido, cada processo grava periodicamente
+(`APP_METRICS_FLUSH_SECONDS`) um retrato dos seus valores em
+`<dir>/metrics-<pid>.json`. O processo que atende a coleta grava o seu
+retrato atualizado e soma os de todos os arquivos:
+
+- contadores e histogramas: somados, inclusive os de processos já
+  encerrados, para que os totais nunca diminuam;
+- medidores (por exemplo, requisições em andamento): somados apenas
+  entre os processos ativos.
+
+O diretório deve ser esvaziado ao iniciar o servidor (`clear_directory`,
+chamado no `on_starting` do gunicorn), como no modo multiprocesso do
+cliente oficial do Prometheus.
+
+Workers reciclados (`max_requests`) deixariam um arquivo cada, relido em
+toda coleta. Ao fim de cada worker, `archive_process` (chamado no
+`child_exit` do gunicorn) soma os contadores e histogramas dele a
+`metrics-archive.json` e remove o seu arquivo. O acumulado registra as
+instâncias (pid e instante de início) já incorporadas, para que uma
+coleta feita entre a gravação do acumulado e a remoção não conte o
+worker duas vezes, sem confundi-lo com um novo worker que reutilize o
+mesmo pid.
+
+Sem `APP_METRICS_DIR`, a coleta expõe apenas o processo atual.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.core.config import get_settings
+from src.core.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+METRICS: Dict[str, Tuple[str, str]] = {
+    "http_requests_total": (
+        "counter",
+        "Requisições HTTP atendidas, por método, rota e status.",
+    ),
+    "http_request_duration_seconds": (
+        "histogram",
+        "Duração das requisições HTTP, por método e rota.",
+    ),
+    "http_requests_in_progress": (
+        "gauge",
+        "Requisições HTTP em andamento, por método.",
+    ),
+    "db_queries_total": (
+        "counter",
+        "Consultas enviadas ao banco, por rota.",
+    ),
+    "db_query_duration_seconds_total": (
+        "counter",
+        "Tempo total de execução das consultas, por rota.",
+    ),
+}
+"""Tipo e descrição de cada métrica exposta."""
+
+
+_instance: Tuple[int, str] = (0, "")
+
+
+def _instance_id() -> str:
+    """
+    Identifica o processo atual: pid e instante do primeiro uso.
+
+    Recalculado quando o pid muda, ou seja, em cada processo criado por
+    `fork` a partir do mestre.
+    """
+    global _instance
+    pid = os.getpid()
+    if _instance[0] != pid:
+        _instance = (pid, f"{pid}-{time.time_ns()}")
+    return _instance[1]
+
+
+def _labels(labels: Mapping[str, str]) -> LabelSet:
+    return tuple(sorted(labels.items()))
+
+
+# -------------------------------------------------------------------
+# Registro do processo
+# -------------------------------------------------------------------
+class Registry:
+    """
+    Valores das métricas do processo atual, seguros entre threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelSet], float] = defaultdict(float)
+        self._gauges: Dict[Tuple[str, LabelSet], float] = defaultdict(float)
+        self._histograms: Dict[Tuple[str, LabelSet], Histogram] = {}
+
+    def inc(self, name: str, labels: Mapping[str, str], value: float = 1.0) -> None:
+        """
+        Incrementa um contador.
+        """
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] += value
+
+    def add(self, name: str, labels: Mapping[str, str], delta: float) -> None:
+        """
+        Soma `delta` (positivo ou negativo) a um medidor.
+        """
+        key = (name, _labels(labels))
+        with self._lock:
+            self._gauges[key] += delta
+
+    def observe(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """
+        Registra uma observação em um histograma.
+        """
+        key = (name, _labels(labels))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram())
+        histogram.observe(value)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retrato serializável (JSON) dos valores atuais.
+        """
+        with self._lock:
+            counters = list(self._counters.items())
+            gauges = list(self._gauges.items())
+            histograms = list(self._histograms.items())
+        return {
+            "pid": os.getpid(),
+            "instance": _instance_id(),
+            "counters": [[n, dict(ls), v] for (n, ls), v in counters],
+            "gauges": [[n, dict(ls), v] for (n, ls), v in gauges],
+            "histograms": [[n, dict(ls), h.snapshot()] for (n, ls), h in histograms],
+        }
+
+    def clear(self) -> None:
+        """
+        Remove todos os valores.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+registry = Registry()
+
+
+# -------------------------------------------------------------------
+# Retratos por processo
+# -------------------------------------------------------------------
+_ARCHIVE_NAME = "metrics-archive.json"
+
+
+def _snapshot_path(directory: Path, pid: int) -> Path:
+    return directory / f"metrics-{pid}.json"
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    # Arquivo temporário e `os.replace`: a leitura nunca vê um arquivo
+    # incompleto.
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        # Arquivo removido ou substituído durante a leitura.
+        return None
+
+
+def write_snapshot(directory: str, snapshot: Dict[str, Any]) -> None:
+    """
+    Grava o retrato do processo de forma atômica.
+    """
+    _write_json(_snapshot_path(Path(directory), snapshot["pid"]), snapshot)
+
+
+def read_snapshots(directory: str) -> List[Dict[str, Any]]:
+    """
+    Lê os retratos de todos os processos gravados no diretório, incluindo
+    o acumulado dos processos encerrados.
+
+    Retratos de processos já incorporados ao acumulado são ignorados.
+    """
+    snapshots = [
+        snapshot
+        for path in Path(directory).glob("metrics-*.json")
+        if (snapshot := _read_json(path)) is not None
+    ]
+    archived = {i for s in snapshots for i in s.get("merged", [])}
+    return [s for s in snapshots if s.get("instance") not in archived]
+
+
+def clear_directory(directory: str) -> None:
+    """
+    Cria o diretório, se necessário, e remove os retratos de execuções
+    anteriores.
+    """
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for stale in [*path.glob("metrics-*.json"), *path.glob("metrics-*.tmp")]:
+        stale.unlink(missing_ok=True)
+
+
+def archive_process(directory: str, pid: int) -> None:
+    """
+    Incorpora o retrato de um processo encerrado ao acumulado
+    (`metrics-archive.json`) e remove o arquivo do processo.
+
+    Apenas contadores e histogramas são mantidos; medidores de processos
+    encerrados não entram na soma. Deve ser chamada por um único
+    processo (o mestre do gunicorn).
+    """
+    base = Path(directory)
+    path = _snapshot_path(base, pid)
+    snapshot = _read_json(path)
+    if snapshot is None:
+        return
+
+    archive_path = base / _ARCHIVE_NAME
+    archive = _read_json(archive_path) or {}
+    merged = merge([archive, {**snapshot, "gauges": []}])
+
+    # Só a instância recém-incorporada precisa ser lembrada: os arquivos
+    # das anteriores já foram removidos.
+    _write_json(
+        archive_path,
+        {
+            "pid": None,
+            "merged": [snapshot.get("instance")],
+            "counters": [[n, dict(ls), v] for (n, ls), v in merged["counters"].items()],
+            "gauges": [],
+            "histograms": [
+                [n, dict(ls), data] for (n, ls), data in merged["histograms"].items()
+            ],
+        },
+    )
+    path.unlink(missing_ok=True)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect() -> List[Dict[str, Any]]:
+    """
+    Retratos a expor na coleta: o do processo atual e, com
+    `APP_METRICS_DIR`, os dos demais processos.
+    """
+    own = registry.snapshot()
+    directory = get_settings().metrics_dir
+    if not directory:
+        return [own]
+
+    write_snapshot(directory, own)
+    others = [s for s in read_snapshots(directory) if s.get("pid") != own["pid"]]
+    return [own, *others]
+
+
+def merge(snapshots: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Soma os retratos de vários processos.
+
+    Medidores de processos encerrados são ignorados; contadores e
+    histogramas são sempre somados.
+
+    Retorno
+    -------
+    dict
+        `counters` e `gauges` (chave → valor) e `histograms`
+        (chave → contagens por limite, total e soma).
+    """
+    counters: Dict[Tuple[str, LabelSet], float] = defaultdict(float)
+    gauges: Dict[Tuple[str, LabelSet], float] = defaultdict(float)
+    histograms: Dict[Tuple[str, LabelSet], Dict[str, Any]] = {}
+    own_pid = os.getpid()
+
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get("counters", []):
+            counters[(name, _labels(labels))] += value
+
+        # O arquivo de processos encerrados (`archive_process`) não tem pid.
+        pid = snapshot.get("pid")
+        process_gauges = snapshot.get("gauges", [])
+        if process_gauges and pid is not None and (pid == own_pid or _is_alive(pid)):
+            for name, labels, value in process_gauges:
+                gauges[(name, _labels(labels))] += value
+
+        for name, labels, data in snapshot.get("histograms", []):
+            merged = histograms.setdefault(
+                (name, _labels(labels)), {"buckets": {}, "count": 0, "sum": 0.0}
+            )
+            for bound, count in data["buckets"].items():
+                merged["buckets"][bound] = merged["buckets"].get(bound, 0) + count
+            merged["count"] += data["count"]
+            merged["sum"] += data["sum"]
+
+    return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+
+# -------------------------------------------------------------------
+# Formato de exposição
+# -------------------------------------------------------------------
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelSet, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = [*labels, extra] if extra else list(labels)
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in items) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def render(merged: Dict[str, Any]) -> str:
+    """
+    Gera o texto no formato de exposição do Prometheus (versão 0.0.4).
+    """
+    series: Dict[str, List[str]] = defaultdict(list)
+
+    for kind in ("counters", "gauges"):
+        for (name, labels), value in sorted(merged[kind].items()):
+            series[name].append(
+                f"{name}{_format_labels(labels)} {_format_value(value)}"
+            )
+
+    for (name, labels), data in sorted(merged["histograms"].items()):
+        buckets = sorted(
+            data["buckets"].items(),
+            key=lambda item: float("inf") if item[0] == "+Inf" else float(item[0]),
+        )
+        for bound, count in buckets:
+            series[name].append(
+                f"{name}_bucket{_format_labels(labels, ('le', bound))} {count}"
+            )
+        series[name].append(f"{name}_count{_format_labels(labels)} {data['count']}")
+        series[name].append(
+            f"{name}_sum{_format_labels(labels)} {_format_value(data['sum'])}"
+        )
+
+    lines = []
+    for name in sorted(series):
+        kind, description = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(series[name])
+    return "\n".join(lines) + "\n"
+
+
+def exposition() -> str:
+    """
+    Coleta, soma e formata as métricas de todos os processos.
+    """
+    return render(merge(collect()))
+
+
+# -------------------------------------------------------------------
+# Gravação periódica
+# -------------------------------------------------------------------
+_flusher: Optional[threading.Thread] = None
+_flusher_lock = threading.Lock()
+
+
+def flush() -> None:
+    """
+    Grava o retrato atual do processo, se `APP_METRICS_DIR` estiver
+    definido.
+    """
+    directory = get_settings().metrics_dir
+    if directory:
+        try:
+            write_snapshot(directory, registry.snapshot())
+        except OSError:
+            logger.exception("Falha ao gravar as métricas em %s", directory)
+
+
+def start_flusher() -> None:
+    """
+    Inicia (uma vez por processo) a thread que grava o retrato do
+    processo a cada `APP_METRICS_FLUSH_SECONDS`.
+    """
+    global _flusher
+    settings = get_settings()
+    if not settings.metrics_dir:
+        return
+
+    with _flusher_lock:
+        if _flusher is not None and _flusher.is_alive():
+            return
+
+        def run() -> None:
+            while True:
+                time.sleep(settings.metrics_flush_seconds)
+                flush()
+
+        _flusher = threading.Thread(target=run, name="metrics-flush", daemon=True)
+        _flusher.start()
@@ -0,0 +1,99 @@
+"""
+# Coalescência de Requisições (single-flight)
+
+Quando várias requisições idênticas chegam ao mesmo tempo, apenas a
+primeira executa o cálculo; as demais aguardam o término dela e recebem
+o mesmo resultado (ou a mesma exceção).
+
+Não é um cache: assim que o cálculo termina a chave é liberada, e a
+próxima chamada executa novamente. Só são compartilhados resultados de
+cálculos que estavam em andamento.
+
+Os endpoints síncronos rodam no threadpool, por isso a coordenação usa
+primitivas de `threading`.
+"""
+
+import threading
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """
+    Cálculo em andamento para uma chave.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[T] = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """
+    Executa no máximo um cálculo por chave de cada vez.
+
+    Uso
+    ---
+    ```python
+    flight = SingleFlight()
+    resultado, compartilhado = flight.do(chave, lambda: calcular(...))
+    ```
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """
+        Executa `fn` ou aguarda o cálculo já em andamento para `key`.
+
+        Parâmetros
+        ----------
+        key : Hashable
+            Identifica cálculos equivalentes.
+        fn : Callable[[], T]
+            Cálculo a executar caso nenhum esteja em andamento.
+
+        Retorno
+        -------
+        tuple[T, bool]
+            O resultado e se ele foi compartilhado com outra chamada
+            (False para quem executou o cálculo).
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True  # type: ignore[return-value]
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result, call.waiters > 0
+
+    def in_flight(self) -> int:
+        """
+        Quantidade de chaves com cálculo em andamento.
+        """
+        with self._lock:
+            return len(self._calls)
@@ -0,0 +1,69 @@
+"""
+# Perfil de Inicialização
+
+Mede a duração das etapas de inicialização do processo, do primeiro
+import da aplicação até o fim do `lifespan`, quando o servidor passa a
+aceitar requisições.
+
+`src.main` importa este módulo antes de qualquer outro, de modo que a
+primeira etapa inclui o import do FastAPI, do SQLAlchemy e do Pydantic.
+O resumo é registrado em log ao final da inicialização.
+
+Para o detalhamento por módulo, ver `benchmarks/bench_startup.py`
+(`python -X importtime`).
+"""
+
+import logging
+import time
+from typing import Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class StartupProfile:
+    """
+    Duração, em segundos, de cada etapa da inicialização.
+
+    ## Parâmetros
+    - **clock** (*Callable[[], float]*): Relógio monotônico, em segundos.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._start = clock()
+        self._last = self._start
+        self.phases: Dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """
+        Encerra a etapa `phase`, iniciada no fim da etapa anterior.
+        """
+        now = self._clock()
+        self.phases[phase] = now - self._last
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        """Tempo desde a criação do perfil até a última etapa."""
+        return self._last - self._start
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Retorna a duração de cada etapa e o total, em milissegundos.
+        """
+        summary = {name: round(s * 1000.0, 1) for name, s in self.phases.items()}
+        summary["total"] = round(self.total * 1000.0, 1)
+        return summary
+
+    def log(self) -> None:
+        """
+        Registra o resumo em log.
+        """
+        logger.info(
+            "Inicialização concluída em %.0f ms (%s)",
+            self.total * 1000.0,
+            ", ".join(f"{name}: {ms} ms" for name, ms in self.summary().items()),
+        )
+
+
+profile = StartupProfile()
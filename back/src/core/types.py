@@ -0,0 +1,78 @@
+"""
+# Tipos de Coluna
+
+Tipos SQLAlchemy compartilhados pelos modelos ORM.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from typing import Optional, Union
+
+from sqlalchemy import DateTime, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+def utcnow() -> datetime:
+    """
+    Retorna o instante atual em UTC (com fuso horário).
+    """
+    return datetime.now(timezone.utc)
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    Data/hora nativa armazenada sempre em UTC.
+
+    - Na gravação, valores com fuso são convertidos para UTC e gravados
+      sem fuso (o SQLite não possui tipo com fuso horário).
+    - Na leitura, o valor volta como `datetime` com `tzinfo=UTC`.
+
+    No SQLite o valor é gravado no formato `YYYY-MM-DD HH:MM:SS.ffffff`,
+    cuja ordem lexicográfica coincide com a cronológica; por isso índices
+    sobre essas colunas atendem consultas por intervalo de tempo.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def process_result_value(self, value: Optional[datetime], dialect):
+        if value is not None and value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+
+
+class BinaryUUID(TypeDecorator):
+    """
+    UUID armazenado em 16 bytes, exposto à aplicação como string.
+
+    A forma textual (36 caracteres) continua sendo usada em toda a
+    aplicação e na API; apenas a representação em disco é compacta, o que
+    reduz chaves primárias, chaves estrangeiras e seus índices.
+
+    Valores que não são UUIDs válidos levantam `ValueError` (envolvido
+    pelo SQLAlchemy em `StatementError`) em vez de serem enviados como
+    `NULL`. A validação do formato cabe à borda da API: DTOs e
+    parâmetros de rota tipados como `uuid.UUID`.
+    """
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value: Union[str, uuid.UUID, None], dialect):
+        if value is None:
+            return None
+        if isinstance(value, uuid.UUID):
+            return value.bytes
+        if not isinstance(value, str):
+            raise ValueError(f"UUID inválido: {value!r}")
+        return uuid.UUID(value).bytes
+
+    def process_result_value(self, value: Optional[bytes], dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=value))
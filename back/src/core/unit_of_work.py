@@ -0,0 +1,62 @@
+"""
+# Unidade de Trabalho
+
+Define a fronteira transacional das operações de escrita.
+
+Os repositórios apenas enviam as alterações ao banco (`flush`); quem
+decide quando a transação é confirmada é a camada de serviços, por meio
+de `UnitOfWork`. Assim, operações compostas por vários passos (por
+exemplo, criar o endereço e depois a banca) são gravadas com um único
+`commit` e desfeitas por completo em caso de falha.
+
+Cada `commit` também incrementa, uma única vez, a versão das tabelas
+alteradas na transação (ver `src.core.versioning`).
+"""
+
+from typing import Literal
+
+from sqlalchemy.orm import Session
+
+import src.core.versioning  # noqa: F401  (registra os eventos de versionamento)
+
+
+class UnitOfWork:
+    """
+    Gerenciador de contexto que delimita uma transação de negócio.
+
+    Uso
+    ---
+    ```python
+    with UnitOfWork(db):
+        address = address_repo.create_address(...)
+        banca = banca_repo.create_banca(address_id=address.id, ...)
+    ```
+
+    - Saída normal do bloco: `commit`.
+    - Exceção dentro do bloco (ou no próprio `commit`): `rollback` e a
+      exceção é propagada.
+
+    Parâmetros
+    ----------
+    db : Session
+        Sessão compartilhada pelos repositórios envolvidos na operação.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __enter__(self) -> "UnitOfWork":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> Literal[False]:
+        if exc_type is not None:
+            self.db.rollback()
+            return False
+
+        try:
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        return False
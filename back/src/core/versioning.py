@@ -0,0 +1,219 @@
+"""
+# Versionamento de Tabelas
+
+Mantém um contador de geração por tabela (`table_versions`), usado como
+sinal único de invalidação de caches e índices derivados.
+
+Funcionamento:
+- Durante a transação, a sessão anota quais tabelas foram alteradas,
+  tanto por objetos ORM (`flush`) quanto por comandos `INSERT`/`UPDATE`/
+  `DELETE` executados diretamente.
+- Imediatamente antes do `commit`, cada tabela alterada tem sua versão
+  incrementada **uma vez**, na mesma transação. Assim, um lote com
+  milhares de linhas gera uma única invalidação.
+- Remoções também marcam as tabelas alcançadas por `ON DELETE CASCADE`,
+  já que o banco remove essas linhas sem passar pela sessão.
+- Em caso de `rollback`, as anotações são descartadas.
+
+Os eventos são registrados na classe `Session`, valendo para todas as
+sessões da aplicação.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import Delete, Insert, Update, event, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+from sqlalchemy.sql.expression import TableClause
+
+from src.core.database import SKIP_N_PLUS_ONE
+from src.core.types import utcnow
+from src.models.table_version import TableVersion
+
+_TOUCHED_KEY = "touched_tables"
+_VERSION_TABLE = TableVersion.__tablename__
+
+
+def _touched(session: Session) -> Set[str]:
+    return session.info.setdefault(_TOUCHED_KEY, set())
+
+
+@lru_cache(maxsize=None)
+def _cascade_tables(table_name: str) -> FrozenSet[str]:
+    """
+    Retorna as tabelas cujas linhas são removidas em cascata (direta ou
+    indiretamente) quando uma linha de `table_name` é removida.
+    """
+    tables = TableVersion.metadata.tables.values()
+    found: Set[str] = set()
+    pending = [table_name]
+    while pending:
+        parent = pending.pop()
+        for child in tables:
+            if child.name in found:
+                continue
+            if any(
+                fk.ondelete == "CASCADE" and fk.column.table.name == parent
+                for fk in child.foreign_keys
+            ):
+                found.add(child.name)
+                pending.append(child.name)
+    return frozenset(found)
+
+
+# -------------------------------------------------------------------
+# Leitura das versões
+# -------------------------------------------------------------------
+def get_versions(db: Session, tables: Iterable[str]) -> Dict[str, int]:
+    """
+    Retorna a versão atual de cada tabela informada.
+
+    Tabelas que nunca foram alteradas têm versão 0.
+
+    Parâmetros
+    ----------
+    db : Session
+        Sessão utilizada na consulta.
+    tables : Iterable[str]
+        Nomes das tabelas.
+
+    Retorno
+    -------
+    dict[str, int]
+        Mapeamento nome da tabela → versão.
+    """
+    names = list(tables)
+    stmt = select(TableVersion.table_name, TableVersion.version).where(
+        TableVersion.table_name.in_(names)
+    )
+    found = dict(db.execute(stmt).tuples().all())
+    return {name: found.get(name, 0) for name in names}
+
+
+def get_version(db: Session, table: str) -> int:
+    """
+    Retorna a versão atual de uma tabela (0 se nunca alterada).
+    """
+    return get_versions(db, [table])[table]
+
+
+def get_version_stamps(
+    db: Session, tables: Iterable[str]
+) -> Dict[str, Tuple[int, Optional[datetime]]]:
+    """
+    Retorna a versão e o instante da última alteração de cada tabela.
+
+    Tabelas que nunca foram alteradas têm versão 0 e instante None.
+
+    Parâmetros
+    ----------
+    db : Session
+        Sessão utilizada na consulta.
+    tables : Iterable[str]
+        Nomes das tabelas.
+
+    Retorno
+    -------
+    dict[str, tuple[int, datetime | None]]
+        Mapeamento nome da tabela → (versão, última alteração).
+    """
+    names = list(tables)
+    stmt = select(
+        TableVersion.table_name, TableVersion.version, TableVersion.updated_at
+    ).where(TableVersion.table_name.in_(names))
+    found = {name: (version, at) for name, version, at in db.execute(stmt)}
+    return {name: found.get(name, (0, None)) for name in names}
+
+
+# -------------------------------------------------------------------
+# Incremento
+# -------------------------------------------------------------------
+def bump_versions(db: Session, tables: Iterable[str]) -> None:
+    """
+    Incrementa a versão das tabelas informadas com um único comando.
+
+    Utiliza `INSERT ... ON CONFLICT DO UPDATE`, criando o contador na
+    primeira alteração da tabela.
+    """
+    now = utcnow()
+    rows = [
+        {"table_name": name, "version": 1, "updated_at": now} for name in sorted(tables)
+    ]
+    if not rows:
+        return
+
+    stmt = sqlite_insert(TableVersion).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[TableVersion.table_name],
+        set_={
+            "version": TableVersion.version + 1,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    # Executado uma vez por transação: em requisições com vários commits
+    # (importação em lote) não indica N+1.
+    db.execute(stmt, execution_options={SKIP_N_PLUS_ONE: True})
+
+
+# -------------------------------------------------------------------
+# Eventos de sessão
+# -------------------------------------------------------------------
+@event.listens_for(Session, "after_flush")
+def _collect_flushed(session: Session, flush_context: UOWTransaction) -> None:
+    """
+    Anota as tabelas dos objetos ORM inseridos, alterados ou removidos.
+    """
+    modified = (obj for obj in session.dirty if session.is_modified(obj))
+    tables = {
+        obj.__table__.name for obj in chain(session.new, session.deleted, modified)
+    }
+    for obj in session.deleted:
+        tables |= _cascade_tables(obj.__table__.name)
+    tables.discard(_VERSION_TABLE)
+    if tables:
+        _touched(session).update(tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_dml(state: ORMExecuteState) -> None:
+    """
+    Anota a tabela alvo de comandos `INSERT`/`UPDATE`/`DELETE` diretos.
+    """
+    statement = state.statement
+    if not isinstance(statement, (Insert, Update, Delete)):
+        return
+    # UPDATE/DELETE sobre um JOIN (não usados com o SQLite) não têm uma
+    # única tabela alvo.
+    if not isinstance(statement.table, TableClause):
+        return
+
+    name = statement.table.name
+    if name == _VERSION_TABLE:
+        return
+
+    touched = _touched(state.session)
+    touched.add(name)
+    if isinstance(statement, Delete):
+        touched |= _cascade_tables(name)
+
+
+@event.listens_for(Session, "before_commit")
+def _bump_touched(session: Session) -> None:
+    """
+    Incrementa, na própria transação, a versão das tabelas alteradas.
+    """
+    session.flush()
+    tables = session.info.pop(_TOUCHED_KEY, None)
+    if tables:
+        bump_versions(session, tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_touched(session: Session) -> None:
+    """
+    Descarta as anotações de uma transação desfeita.
+    """
+    session.info.pop(_TOUCHED_KEY, None)
@@ -8,7 +8,9 @@ entre as camadas de rota, serviço e repositório.
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.dto.common import IsoDateTime
 
 
 # -----------------------
@@ -70,8 +72,7 @@ class AddressRead(AddressBase):
     """
 
     id: str
-    created_at: str
-    updated_at: str
+    created_at: IsoDateTime
+    updated_at: IsoDateTime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
@@ -7,9 +7,18 @@ Os DTOs padronizam a entrada e saída de informações entre rotas, serviços
 e repositórios, garantindo validação e consistência estrutural.
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
-from src.dto.address_dto import AddressCreate
+import uuid
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Type, TypeVar, cast
+
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from src.dto.common import IsoDateTime
+from src.dto.address_dto import AddressCreate, AddressRead
+from src.dto.produto_dto import ProdutoRead
+from src.dto.user_dto import UserResponseDTO
+
+T = TypeVar("T", bound=BaseModel)
 
 
 # -----------------------
@@ -36,7 +45,7 @@ class BancaCreate(BancaBase):
     do endereço associado.
     """
 
-    supplier_id: str = Field(..., description="ID do fornecedor")
+    supplier_id: uuid.UUID = Field(..., description="ID do fornecedor")
     address: AddressCreate = Field(
         ..., description="Dados completos do endereço da banca"
     )
@@ -54,8 +63,8 @@ class BancaUpdate(BaseModel):
     nome: Optional[str] = None
     descricao: Optional[str] = None
     horario_funcionamento: Optional[str] = None
-    supplier_id: Optional[str] = None
-    address_id: Optional[str] = None
+    supplier_id: Optional[uuid.UUID] = None
+    address_id: Optional[uuid.UUID] = None
 
 
 # -----------------------
@@ -71,8 +80,61 @@ class BancaRead(BancaBase):
     id: int
     supplier_id: str
     address_id: str
-    created_at: str
-    updated_at: str
+    created_at: IsoDateTime
+    updated_at: IsoDateTime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# -----------------------
+# READ COM RELACIONAMENTOS (include=)
+# -----------------------
+BANCA_INCLUDES = {
+    "address": AddressRead,
+    "produtos": List[ProdutoRead],
+    "supplier": UserResponseDTO,
+}
+"""Relacionamentos que podem ser incorporados à leitura de uma banca."""
+
+
+class BancaDetail(BancaRead):
+    """
+    Banca com os relacionamentos incorporados por `include=`.
+
+    Cada relacionamento aparece na resposta somente quando solicitado;
+    esta classe descreve a forma completa para a documentação.
+    """
+
+    address: Optional[AddressRead] = None
+    produtos: Optional[List[ProdutoRead]] = None
+    supplier: Optional[UserResponseDTO] = None
+
+
+def banca_detail_model(model: Type[T], include: Optional[Iterable[str]]) -> Type[T]:
+    """
+    Retorna o DTO de banca com os relacionamentos de `include`.
+
+    Parâmetros
+    ----------
+    model : type[BaseModel]
+        DTO base (`BancaRead` ou um parcial de `fieldset_model`).
+    include : Iterable[str] | None
+        Nomes em `BANCA_INCLUDES`. Vazio retorna o próprio `model`.
+
+    Retorno
+    -------
+    type[BaseModel]
+        DTO lido por `from_attributes`, mantido em cache por combinação.
+    """
+    if not include:
+        return model
+    return _banca_detail_model(model, frozenset(include))
+
 
-    class Config:
-        from_attributes = True
+@lru_cache(maxsize=256)
+def _banca_detail_model(model: Type[T], include: FrozenSet[str]) -> Type[T]:
+    definitions: Dict[str, Any] = {
+        name: (tp, ...) for name, tp in BANCA_INCLUDES.items() if name in include
+    }
+    detail = create_model(f"{model.__name__}Detail", __base__=model, **definitions)
+    return cast(Type[T], detail)
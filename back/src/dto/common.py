@@ -0,0 +1,36 @@
+"""
+## DTOs: Tipos Comuns
+
+Tipos Pydantic reutilizados pelos DTOs das demais entidades.
+"""
+
+from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import BeforeValidator, Field
+
+
+def _to_iso(value: Any) -> Any:
+    """
+    Converte `datetime` para string ISO 8601; outros valores passam direto.
+    """
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+IsoDateTime = Annotated[str, BeforeValidator(_to_iso)]
+"""
+Data/hora exposta pela API como string ISO 8601.
+
+Os modelos ORM armazenam `datetime` nativo; a conversão para texto
+acontece apenas na fronteira da API.
+"""
+
+
+DbInt = Annotated[int, Field(ge=-(2**63), le=2**63 - 1)]
+"""
+Inteiro que cabe em uma coluna INTEGER do SQLite (64 bits com sinal).
+
+Valores fora desse intervalo não podem ser enviados ao banco (o driver
+levanta `OverflowError`); a validação os rejeita antes, como os demais
+campos inválidos.
+"""
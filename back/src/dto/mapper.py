@@ -0,0 +1,112 @@
+"""
+## DTOs: Conversão ORM → DTO
+
+Funções compartilhadas pelos serviços para converter objetos ORM nos
+DTOs de leitura, lendo os atributos diretamente (`from_attributes`).
+
+- `to_dto`: converte um único objeto com `model_validate`.
+- `to_dto_list`: converte uma coleção inteira em uma única chamada de
+  validação, por meio de um `TypeAdapter(list[...])` mantido em cache.
+- `fieldset_model`: DTO parcial com apenas alguns campos de outro DTO,
+  usado pelas respostas com `fields=` (ver `src.api.fieldsets`).
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Type, TypeVar, cast
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+
+T = TypeVar("T", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Retorna (em cache) o `TypeAdapter` de `list[model]`.
+    """
+    return TypeAdapter(List[model])
+
+
+def to_dto(model: Type[T], obj: Any) -> T:
+    """
+    Converte um objeto ORM no DTO informado.
+
+    Parâmetros
+    ----------
+    model : type[BaseModel]
+        Classe do DTO de destino.
+    obj : Any
+        Objeto ORM (ou qualquer objeto com os atributos do DTO).
+
+    Retorno
+    -------
+    BaseModel
+        Instância validada do DTO.
+    """
+    return model.model_validate(obj, from_attributes=True)
+
+
+def to_dto_list(model: Type[T], objs: Iterable[Any]) -> List[T]:
+    """
+    Converte uma coleção de objetos ORM em uma lista de DTOs.
+
+    A validação da lista inteira acontece em uma única chamada ao núcleo
+    do Pydantic, em vez de uma construção de DTO por item em Python.
+
+    Parâmetros
+    ----------
+    model : type[BaseModel]
+        Classe do DTO de destino.
+    objs : Iterable[Any]
+        Objetos ORM a converter.
+
+    Retorno
+    -------
+    list[BaseModel]
+        DTOs na mesma ordem dos objetos recebidos.
+    """
+    return _list_adapter(model).validate_python(list(objs), from_attributes=True)
+
+
+def fieldset_model(model: Type[T], fields: Optional[Iterable[str]]) -> Type[T]:
+    """
+    Retorna um DTO com apenas os campos informados de `model`.
+
+    Os campos mantêm tipo, validadores e documentação do DTO original e
+    aparecem na ordem em que foram declarados nele. As classes geradas
+    ficam em cache por combinação de campos.
+
+    Parâmetros
+    ----------
+    model : type[BaseModel]
+        DTO completo.
+    fields : Iterable[str] | None
+        Campos desejados. None (ou todos os campos) retorna o próprio
+        `model`.
+
+    Retorno
+    -------
+    type[BaseModel]
+        DTO parcial, lido por `from_attributes`.
+    """
+    if fields is None:
+        return model
+    return _fieldset_model(model, frozenset(fields))
+
+
+@lru_cache(maxsize=256)
+def _fieldset_model(model: Type[T], fields: FrozenSet[str]) -> Type[T]:
+    if fields >= model.model_fields.keys():
+        return model
+
+    definitions: Dict[str, Any] = {
+        name: (info.annotation, info)
+        for name, info in model.model_fields.items()
+        if name in fields
+    }
+    partial = create_model(
+        f"{model.__name__}Partial",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+    return cast(Type[T], partial)
@@ -7,8 +7,11 @@ Os DTOs padronizam a validação dos dados enviados e recebidos pelas rotas,
 permitindo consistência entre serviços e repositórios.
 """
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import List, Optional, Type
+from pydantic import BaseModel, ConfigDict, Field, create_model
+
+from src.dto.common import IsoDateTime
 
 from src.dto.produto_dto import ProdutoRead
 from src.dto.banca_dto import BancaRead
@@ -52,10 +55,9 @@ class PesquisaRead(PesquisaBase):
     """
 
     id: int
-    created_at: str
+    created_at: IsoDateTime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================
@@ -71,5 +73,23 @@ class SearchResponse(BaseModel):
     produtos: List[ProdutoRead] = Field(default_factory=list)
     bancas: List[BancaRead] = Field(default_factory=list)
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+@lru_cache(maxsize=256)
+def search_response_model(
+    produto_model: Type[BaseModel], banca_model: Type[BaseModel]
+) -> Type[SearchResponse]:
+    """
+    Retorna a variante de `SearchResponse` cujas listas usam os DTOs
+    informados (por exemplo, DTOs parciais de `fieldset_model`).
+    """
+    if produto_model is ProdutoRead and banca_model is BancaRead:
+        return SearchResponse
+
+    return create_model(
+        "SearchResponsePartial",
+        __base__=SearchResponse,
+        produtos=(List[produto_model], Field(default_factory=list)),
+        bancas=(List[banca_model], Field(default_factory=list)),
+    )
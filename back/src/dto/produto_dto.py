@@ -7,8 +7,10 @@ Os DTOs garantem validação consistente e padronizam a troca de dados
 entre rotas, serviços e repositórios.
 """
 
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from src.dto.common import DbInt, IsoDateTime
 
 
 # ============================================================
@@ -21,7 +23,7 @@ class ProdutoBase(BaseModel):
     """
 
     nome: str = Field(..., description="Nome do produto")
-    preco: float = Field(..., description="Preço do produto")
+    preco: float = Field(..., allow_inf_nan=False, description="Preço do produto")
     imagem: Optional[str] = Field(
         None, description="URL da imagem ou caminho no sistema"
     )
@@ -35,7 +37,7 @@ class ProdutoCreate(ProdutoBase):
     Estrutura utilizada para registrar um novo produto.
     """
 
-    banca_id: int = Field(..., description="ID da banca à qual o produto pertence")
+    banca_id: DbInt = Field(..., description="ID da banca à qual o produto pertence")
 
 
 # ============================================================
@@ -48,9 +50,9 @@ class ProdutoUpdate(BaseModel):
     """
 
     nome: Optional[str] = None
-    preco: Optional[float] = None
+    preco: Optional[float] = Field(None, allow_inf_nan=False)
     imagem: Optional[str] = None
-    banca_id: Optional[int] = None
+    banca_id: Optional[DbInt] = None
 
 
 # ============================================================
@@ -64,8 +66,67 @@ class ProdutoRead(ProdutoBase):
 
     id: int
     banca_id: int
-    created_at: str
-    updated_at: str
+    created_at: IsoDateTime
+    updated_at: IsoDateTime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ============================================================
+# BULK IMPORT
+# ============================================================
+class ProdutoBulkError(BaseModel):
+    """
+    Erro associado a uma linha da importação em lote.
+    """
+
+    linha: int = Field(..., description="Número da linha no arquivo enviado")
+    erro: str = Field(..., description="Motivo da rejeição da linha")
+
+
+class ProdutoBulkResult(BaseModel):
+    """
+    Resultado consolidado de uma importação em lote de produtos.
+    """
+
+    inseridos: int = Field(..., description="Quantidade de produtos gravados")
+    erros: List[ProdutoBulkError] = Field(default_factory=list)
+
+
+# ============================================================
+# BULK PRICE UPDATE
+# ============================================================
+class ProdutoPrecoItem(BaseModel):
+    """
+    Novo preço de um produto na atualização em lote.
+    """
+
+    produto_id: DbInt = Field(..., description="ID do produto")
+    preco: float = Field(..., allow_inf_nan=False, description="Novo preço do produto")
+
+
+class ProdutoPrecoBulkUpdate(BaseModel):
+    """
+    Lista de preços a aplicar nos produtos de uma banca.
+
+    Cada produto pode aparecer uma única vez. O tamanho do lote é
+    limitado para manter o comando dentro do limite de parâmetros do
+    SQLite.
+    """
+
+    itens: List[ProdutoPrecoItem] = Field(..., min_length=1, max_length=5000)
+
+    @model_validator(mode="after")
+    def _produtos_unicos(self) -> "ProdutoPrecoBulkUpdate":
+        ids = [item.produto_id for item in self.itens]
+        if len(ids) != len(set(ids)):
+            raise ValueError("Cada produto deve aparecer uma única vez.")
+        return self
+
+
+class ProdutoPrecoBulkResult(BaseModel):
+    """
+    Resultado da atualização de preços em lote.
+    """
 
-    class Config:
-        from_attributes = True
+    atualizados: int = Field(..., description="Quantidade de produtos alterados")
@@ -9,7 +9,9 @@ repositórios.
 """
 
 from typing import Optional, Literal
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+from src.dto.common import IsoDateTime
 
 
 # ============================================================
@@ -50,12 +52,14 @@ class UserResponseDTO(BaseModel):
     A senha nunca é exposta neste DTO.
     """
 
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: str
     email: EmailStr
     type: Literal["user", "admin", "supplier"]
-    created_at: str
-    updated_at: str
+    created_at: IsoDateTime
+    updated_at: IsoDateTime
 
 
 # ============================================================
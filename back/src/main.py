@@ -6,15 +6,58 @@ e integra o conjunto de rotas disponibilizado no pacote `api`. A aplicação
 resultante fornece suporte às funcionalidades essenciais do sistema,
 incluindo busca de produtos, gerenciamento de fornecedores e interações com
 usuários, conforme definido nos requisitos funcionais.
+
+O import não acessa o banco: a criação das tabelas acontece no
+`lifespan` (ver `src.core.database.init_db`). A duração de cada etapa da
+inicialização é registrada em log (ver `src.core.startup`).
 """
 
+# Importado primeiro para que a medição inclua o import das dependências.
+from src.core.startup import profile
+
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from src.api.router import router as api_router
-from src.core.database import Base, engine
+from src.api.batch import MISSING_IDS_HEADER
+from src.api.pagination import PAGINATION_HEADERS
+from src.api.responses import ORJSONResponse
+from src.api.router import include_routers
+from src.core.database import init_db
+from src.core import health, prometheus
+from src.core.middleware import (
+    CompressionMiddleware,
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+)
+from src.services.search_log import search_log
+
+profile.mark("imports")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ciclo de vida da aplicação.
+
+    - Início: cria as tabelas ausentes, inicia a gravação periódica das
+      métricas do processo e a medição do atraso do event loop (usada em
+      `/health/ready`).
+    - Encerramento: grava os registros de pesquisa que ainda estão na
+      fila e o último retrato das métricas.
+    """
+    profile.mark("server")
+    await anyio.to_thread.run_sync(init_db)
+    profile.mark("schema")
+    prometheus.start_flusher()
+    health.loop_lag.start()
+    profile.log()
+    yield
+    await health.loop_lag.stop()
+    await anyio.to_thread.run_sync(search_log.flush)
+    prometheus.flush()
 
-# Criação das tabelas no banco
-Base.metadata.create_all(bind=engine)
 
 # Instância principal
 app = FastAPI(
@@ -24,6 +67,8 @@ app = FastAPI(
         "entre usuários, fornecedores e administradores."
     ),
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 origins = [
@@ -37,7 +82,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[*PAGINATION_HEADERS, MISSING_IDS_HEADER],
 )
 
+app.add_middleware(CompressionMiddleware)
+# Envolvido por QueryStatsMiddleware, para ler as consultas da requisição.
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+
 # Registro das rotas da aplicação
-app.include_router(api_router)
+include_routers(app)
+profile.mark("app")
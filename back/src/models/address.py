@@ -11,13 +11,14 @@ operações de persistência e consulta pelas camadas superiores.
 """
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Float
+from sqlalchemy import String, Float, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.core.types import BinaryUUID, UTCDateTime, utcnow
 
 
 class Address(Base):
@@ -31,7 +32,7 @@ class Address(Base):
 
     __tablename__ = "addresses"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(BinaryUUID, primary_key=True, index=True)
 
     street: Mapped[str] = mapped_column(String, nullable=False)
     number: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -45,8 +46,20 @@ class Address(Base):
     latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    created_at: Mapped[str] = mapped_column(String, nullable=False)
-    updated_at: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.current_timestamp(),
+    )
 
     bancas = relationship("Banca", back_populates="address")
 
@@ -78,7 +91,7 @@ class Address(Base):
 
         Gera automaticamente o ID (UUID) e define timestamps de criação e atualização.
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = utcnow()
 
         self.id = str(uuid.uuid4())
         self.street = street
@@ -9,13 +9,14 @@ Utiliza SQLAlchemy ORM para mapear a tabela `bancas` e permitir operações CRUD
 via camadas de repositório e serviço.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.core.types import BinaryUUID, UTCDateTime, utcnow
 
 
 class Banca(Base):
@@ -34,19 +35,32 @@ class Banca(Base):
     )
 
     supplier_id: Mapped[str] = mapped_column(
-        String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+        BinaryUUID, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
 
     address_id: Mapped[str] = mapped_column(
-        String, ForeignKey("addresses.id", ondelete="CASCADE"), nullable=False
+        BinaryUUID, ForeignKey("addresses.id", ondelete="CASCADE"), nullable=False
     )
 
     nome: Mapped[str] = mapped_column(String, nullable=False)
     descricao: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     horario_funcionamento: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    created_at: Mapped[str] = mapped_column(String, nullable=False)
-    updated_at: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.current_timestamp(),
+        index=True,
+    )
 
     # -----------------------------
     # Relacionamentos
@@ -59,6 +73,7 @@ class Banca(Base):
         "Produto",
         back_populates="banca",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __init__(
@@ -81,7 +96,7 @@ class Banca(Base):
 
         Define automaticamente `created_at` e `updated_at`.
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = utcnow()
 
         self.supplier_id = supplier_id
         self.address_id = address_id
@@ -9,13 +9,14 @@ Utiliza SQLAlchemy ORM para mapear a tabela `pesquisas` e permitir
 operações de registro e consulta pela camada de serviço.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Integer, String, Float
+from sqlalchemy import Integer, String, Float, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.core.database import Base
+from src.core.types import UTCDateTime, utcnow
 
 
 class Pesquisa(Base):
@@ -40,7 +41,13 @@ class Pesquisa(Base):
     latitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     longitude: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
 
-    created_at: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+        index=True,
+    )
 
     def __init__(
         self,
@@ -56,9 +63,9 @@ class Pesquisa(Base):
         - `latitude`: Localização latitude no momento da pesquisa (opcional).
         - `longitude`: Localização longitude no momento da pesquisa (opcional).
 
-        Define automaticamente o campo `created_at` no padrão ISO 8601 (UTC).
+        Define automaticamente o campo `created_at` (UTC).
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = utcnow()
 
         self.termo = termo
         self.latitude = latitude
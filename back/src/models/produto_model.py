@@ -10,13 +10,14 @@ Utiliza SQLAlchemy ORM para mapear a tabela `produtos`, permitindo
 operações de consulta e persistência pelas camadas de repositório e serviço.
 """
 
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Integer, Float, ForeignKey
+from sqlalchemy import String, Integer, Float, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.core.types import UTCDateTime, utcnow
 
 
 class Produto(Base):
@@ -29,6 +30,13 @@ class Produto(Base):
     """
 
     __tablename__ = "produtos"
+    # Listagem paginada dos produtos de uma banca por data de alteração.
+    # No SQLite, todo índice carrega implicitamente o `id` (rowid), que
+    # serve de desempate; o índice simples de `banca_id` atende a
+    # listagem ordenada por `id`.
+    __table_args__ = (
+        Index("ix_produtos_banca_id_updated_at", "banca_id", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, index=True, autoincrement=True
@@ -38,14 +46,28 @@ class Produto(Base):
         Integer,
         ForeignKey("bancas.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
 
     nome: Mapped[str] = mapped_column(String, nullable=False)
     preco: Mapped[float] = mapped_column(Float, nullable=False)
     imagem: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
-    created_at: Mapped[str] = mapped_column(String, nullable=False)
-    updated_at: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.current_timestamp(),
+        index=True,
+    )
 
     banca = relationship("Banca", back_populates="produtos")
 
@@ -65,9 +87,9 @@ class Produto(Base):
         - `preco`: Valor do produto.
         - `imagem`: Caminho ou URL da imagem ilustrativa (opcional).
 
-        Define automaticamente `created_at` e `updated_at` no padrão ISO 8601 (UTC).
+        Define automaticamente `created_at` e `updated_at` (UTC).
         """
-        now = datetime.now(timezone.utc).isoformat()
+        now = utcnow()
 
         self.banca_id = banca_id
         self.nome = nome
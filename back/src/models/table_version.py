@@ -0,0 +1,41 @@
+"""
+## Modelo ORM: TableVersion
+
+Contador de geração por tabela. Cada transação confirmada que altera uma
+tabela incrementa o seu contador uma única vez, independentemente de
+quantas linhas foram modificadas.
+
+O contador fica no próprio banco para que todos os processos da
+aplicação enxerguem o mesmo valor; caches e validadores HTTP usam essa
+versão para saber se os dados de uma tabela mudaram.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.core.database import Base
+from src.core.types import UTCDateTime, utcnow
+
+
+class TableVersion(Base):
+    """
+    Modelo ORM da tabela `table_versions`.
+
+    - `table_name`: nome da tabela monitorada.
+    - `version`: geração atual, incrementada a cada transação de escrita.
+    """
+
+    __tablename__ = "table_versions"
+
+    table_name: Mapped[str] = mapped_column(String, primary_key=True)
+
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+    )
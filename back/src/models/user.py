@@ -3,20 +3,25 @@ Modelo ORM responsável pelo mapeamento da tabela de usuários.
 
 Contém os atributos essenciais para identificação e autenticação, incluindo
 nome, e-mail, senha, tipo de usuário e registros de criação e atualização.
-O identificador é gerado automaticamente no formato UUID v4.
+O identificador é gerado automaticamente no formato UUID v4 e armazenado
+em 16 bytes (ver `BinaryUUID`).
 """
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy import String, Enum
+from sqlalchemy import String, Enum, Index, func
 from src.core.database import Base
+from src.core.types import BinaryUUID, UTCDateTime, utcnow
 
 
 class User(Base):
     __tablename__ = "users"
+    # Chave da listagem paginada por data de alteração (ver
+    # `src.core.pagination`).
+    __table_args__ = (Index("ix_users_updated_at_id", "updated_at", "id"),)
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, index=True)
+    id: Mapped[str] = mapped_column(BinaryUUID, primary_key=True, index=True)
     name: Mapped[str] = mapped_column(String, nullable=False)
     email: Mapped[str] = mapped_column(String, unique=True, index=True, nullable=False)
     password: Mapped[str] = mapped_column(String, nullable=False)
@@ -27,8 +32,20 @@ class User(Base):
         default="user",
     )
 
-    created_at: Mapped[str] = mapped_column(String, nullable=False)
-    updated_at: Mapped[str] = mapped_column(String, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        server_default=func.current_timestamp(),
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        UTCDateTime,
+        nullable=False,
+        default=utcnow,
+        onupdate=utcnow,
+        server_default=func.current_timestamp(),
+    )
 
     def __init__(self, name: str, email: str, password: str, type: str = "user"):
         """
@@ -46,7 +63,7 @@ class User(Base):
         if type not in ("user", "admin", "supplier"):
             raise ValueError("Invalid user type.")
 
-        now = datetime.now(timezone.utc).isoformat()
+        now = utcnow()
 
         self.id = str(uuid.uuid4())
         self.name = name
@@ -8,11 +8,19 @@ Implementa métodos padronizados de criação, consulta, atualização
 e remoção.
 """
 
+import uuid
 from typing import Optional, Sequence
-from datetime import datetime, timezone
+from sqlalchemy import bindparam, insert, select, update
 from sqlalchemy.orm import Session
 
+from src.core.types import utcnow
+
 from src.models.address import Address
+from src.repositories.utils import column_values
+
+
+# Consultas de leitura frequente, construídas uma única vez.
+_SELECT_BY_ID = select(Address).where(Address.id == bindparam("address_id"))
 
 
 class AddressRepository:
@@ -70,25 +78,26 @@ class AddressRepository:
         Retorno
         -------
         Address
-            Instância persistida com ID e metadados preenchidos.
+            Instância persistida com ID e metadados preenchidos, obtida com
+            um único `INSERT ... RETURNING`.
         """
-
-        address = Address(
-            street=street,
-            number=number,
-            complement=complement,
-            district=district,
-            city=city,
-            state=state,
-            zip_code=zip_code,
-            latitude=latitude,
-            longitude=longitude,
+        stmt = (
+            insert(Address)
+            .values(
+                id=str(uuid.uuid4()),
+                street=street,
+                number=number,
+                complement=complement,
+                district=district,
+                city=city,
+                state=state,
+                zip_code=zip_code,
+                latitude=latitude,
+                longitude=longitude,
+            )
+            .returning(Address)
         )
-
-        self.db.add(address)
-        self.db.commit()
-        self.db.refresh(address)
-        return address
+        return self.db.scalars(stmt).one()
 
     # ------------------------------------------------------------
     # READ
@@ -107,7 +116,7 @@ class AddressRepository:
         Address | None
             O registro encontrado ou None caso não exista.
         """
-        return self.db.query(Address).filter_by(id=address_id).first()
+        return self.db.scalars(_SELECT_BY_ID, {"address_id": address_id}).first()
 
     def get_all(self) -> Sequence[Address]:
         """
@@ -140,19 +149,16 @@ class AddressRepository:
         Address | None
             Instância atualizada ou None caso o endereço não seja encontrado.
         """
-        address = self.get_by_id(address_id)
-        if not address:
-            return None
-
-        for key, value in fields.items():
-            if hasattr(address, key) and value is not None:
-                setattr(address, key, value)
-
-        address.updated_at = datetime.now(timezone.utc).isoformat()
-
-        self.db.commit()
-        self.db.refresh(address)
-        return address
+        values = column_values(Address, fields)
+        values["updated_at"] = utcnow()
+
+        stmt = (
+            update(Address)
+            .where(Address.id == address_id)
+            .values(**values)
+            .returning(Address)
+        )
+        return self.db.scalars(stmt).one_or_none()
 
     # ------------------------------------------------------------
     # DELETE
@@ -176,4 +182,4 @@ class AddressRepository:
             return
 
         self.db.delete(address)
-        self.db.commit()
+        self.db.flush()
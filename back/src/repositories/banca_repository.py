@@ -6,11 +6,43 @@ de dados, servindo como intermediário entre o modelo ORM e a camada de
 serviços.
 """
 
-from typing import Optional, Sequence
-from datetime import datetime, timezone
+from datetime import datetime
+from typing import Collection, Iterable, Optional, Sequence, Set
+from sqlalchemy import Select, bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
 
+from src.core.pagination import PageParams
+from src.core.types import utcnow
+
 from src.models.banca import Banca
+from src.repositories.utils import (
+    column_values,
+    count_rows,
+    keyset_page,
+    load_fields,
+    load_relations,
+    relation_columns,
+)
+
+
+# Consultas de leitura frequente, construídas uma única vez.
+_SELECT_BY_ID = select(Banca).where(Banca.id == bindparam("banca_id"))
+_SELECT_BY_IDS = select(Banca).where(Banca.id.in_(bindparam("ids", expanding=True)))
+_SELECT_UPDATED_AT = select(Banca.updated_at).where(Banca.id == bindparam("banca_id"))
+_SELECT_BY_SUPPLIER_ID = select(Banca).where(
+    Banca.supplier_id == bindparam("supplier_id")
+)
+
+
+def _load(
+    stmt: Select, fields: Optional[Collection[str]], include: Collection[str]
+) -> Select:
+    """
+    Aplica a leitura parcial (`fields`) e a carga dos relacionamentos
+    (`include`) a uma consulta sobre `Banca`.
+    """
+    stmt = load_fields(stmt, Banca, fields, relation_columns(Banca, include))
+    return load_relations(stmt, Banca, include)
 
 
 class BancaRepository:
@@ -54,23 +86,29 @@ class BancaRepository:
         Retorno
         -------
         Banca
-            Instância persistida com identificador gerado.
-        """
-        banca = Banca(
-            supplier_id=supplier_id,
-            address_id=address_id,
-            nome=nome,
-            descricao=descricao,
-            horario_funcionamento=horario_funcionamento,
+            Instância persistida com identificador gerado, obtida com um
+            único `INSERT ... RETURNING`.
+        """
+        stmt = (
+            insert(Banca)
+            .values(
+                supplier_id=supplier_id,
+                address_id=address_id,
+                nome=nome,
+                descricao=descricao,
+                horario_funcionamento=horario_funcionamento,
+            )
+            .returning(Banca)
         )
-
-        self.db.add(banca)
-        self.db.commit()
-        self.db.refresh(banca)
-        return banca
+        return self.db.scalars(stmt).one()
 
     # READ
-    def get_by_id(self, banca_id: int) -> Optional[Banca]:
+    def get_by_id(
+        self,
+        banca_id: int,
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Optional[Banca]:
         """
         Consulta uma banca pelo identificador.
 
@@ -78,24 +116,140 @@ class BancaRepository:
         ----------
         banca_id : int
             Identificador único da banca.
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+        include : Collection[str]
+            Relacionamentos carregados junto (`address`, `produtos`,
+            `supplier`), uma consulta adicional por relacionamento.
 
         Retorno
         -------
         Banca ou None
             Registro encontrado ou None.
         """
-        return self.db.query(Banca).filter_by(id=banca_id).first()
+        stmt = _load(_SELECT_BY_ID, fields, include)
+        return self.db.scalars(stmt, {"banca_id": banca_id}).first()
 
-    def get_all(self) -> Sequence[Banca]:
+    def get_many(
+        self,
+        ids: Collection[int],
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Sequence[Banca]:
+        """
+        Consulta várias bancas com um único `IN (...)`.
+
+        A ordem do resultado não é garantida; ids inexistentes são
+        simplesmente ignorados.
+
+        Parâmetros
+        ----------
+        ids : Collection[int]
+            Identificadores procurados.
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+        include : Collection[str]
+            Relacionamentos carregados junto (ver `get_by_id`).
+
+        Retorno
+        -------
+        Sequence[Banca]
+            Registros encontrados.
+        """
+        stmt = _load(_SELECT_BY_IDS, fields, include)
+        return self.db.scalars(stmt, {"ids": list(ids)}).all()
+
+    def get_updated_at(self, banca_id: int) -> Optional[datetime]:
+        """
+        Retorna apenas o `updated_at` da banca (None se não existir), sem
+        carregar o objeto ORM.
+        """
+        return self.db.scalar(_SELECT_UPDATED_AT, {"banca_id": banca_id})
+
+    def get_all(
+        self,
+        fields: Optional[Collection[str]] = None,
+        required: Collection[str] = (),
+    ) -> Sequence[Banca]:
         """
         Retorna todas as bancas cadastradas.
 
+        Parâmetros
+        ----------
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+        required : Collection[str]
+            Colunas lidas mesmo fora de `fields` (usadas em filtros).
+
         Retorno
         -------
         Sequence[Banca]
             Lista com todos os registros persistidos.
         """
-        return self.db.query(Banca).all()
+        stmt = load_fields(select(Banca), Banca, fields, required)
+        return self.db.scalars(stmt).all()
+
+    def get_page(
+        self,
+        params: PageParams,
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Sequence[Banca]:
+        """
+        Lê uma página de bancas por cursor (ver `keyset_page`).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, chave inicial e tamanho da página.
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+        include : Collection[str]
+            Relacionamentos carregados junto (ver `get_by_id`); o número
+            de consultas não depende do tamanho da página.
+
+        Retorno
+        -------
+        Sequence[Banca]
+            Até `params.limit + 1` registros, em ordem de chave.
+        """
+        return keyset_page(
+            self.db,
+            load_relations(select(Banca), Banca, include),
+            Banca,
+            params.order_by,
+            params.after,
+            params.limit,
+            fields,
+            required=relation_columns(Banca, include),
+        )
+
+    def count(self) -> int:
+        """
+        Retorna a quantidade de bancas cadastradas.
+        """
+        return count_rows(self.db, select(Banca))
+
+    def get_existing_ids(self, banca_ids: Iterable[int]) -> Set[int]:
+        """
+        Verifica, em uma única consulta `IN (...)`, quais bancas existem.
+
+        Parâmetros
+        ----------
+        banca_ids : Iterable[int]
+            Identificadores a verificar.
+
+        Retorno
+        -------
+        set[int]
+            Subconjunto dos identificadores que existem no banco.
+        """
+        ids = set(banca_ids)
+        if not ids:
+            return set()
+
+        stmt = select(Banca.id).where(Banca.id.in_(ids))
+        return set(self.db.scalars(stmt).all())
 
     def get_by_supplier(self, supplier_id: str) -> Sequence[Banca]:
         """
@@ -111,7 +265,26 @@ class BancaRepository:
         Sequence[Banca]
             Lista de bancas pertencentes ao fornecedor.
         """
-        return self.db.query(Banca).filter_by(supplier_id=supplier_id).all()
+        return self.db.scalars(
+            _SELECT_BY_SUPPLIER_ID, {"supplier_id": supplier_id}
+        ).all()
+
+    def get_updated_since(self, since: datetime) -> Sequence[Banca]:
+        """
+        Retorna as bancas alteradas a partir do instante informado.
+
+        Parâmetros
+        ----------
+        since : datetime
+            Instante inicial (inclusivo).
+
+        Retorno
+        -------
+        Sequence[Banca]
+            Bancas alteradas, em ordem de `updated_at` (usa o índice).
+        """
+        stmt = select(Banca).where(Banca.updated_at >= since).order_by(Banca.updated_at)
+        return self.db.scalars(stmt).all()
 
     # UPDATE
     def update_banca(self, banca_id: int, **fields) -> Optional[Banca]:
@@ -128,27 +301,25 @@ class BancaRepository:
         Retorno
         -------
         Banca ou None
-            Instância atualizada ou None se o registro não existir.
+            Instância atualizada (via `UPDATE ... RETURNING`) ou None se o
+            registro não existir.
         """
-        banca = self.get_by_id(banca_id)
-        if not banca:
-            return None
-
-        for key, value in fields.items():
-            if hasattr(banca, key) and value is not None:
-                setattr(banca, key, value)
+        values = column_values(Banca, fields)
+        values["updated_at"] = utcnow()
 
-        banca.updated_at = datetime.now(timezone.utc).isoformat()
-
-        self.db.commit()
-        self.db.refresh(banca)
-        return banca
+        stmt = (
+            update(Banca).where(Banca.id == banca_id).values(**values).returning(Banca)
+        )
+        return self.db.scalars(stmt).one_or_none()
 
     # DELETE
-    def delete_banca(self, banca_id: int) -> None:
+    def delete_banca(self, banca_id: int) -> bool:
         """
         Remove a banca correspondente ao identificador.
 
+        Executa um único `DELETE`; os produtos da banca são removidos pelo
+        próprio banco (`ON DELETE CASCADE`), sem serem carregados.
+
         Parâmetros
         ----------
         banca_id : int
@@ -156,12 +327,8 @@ class BancaRepository:
 
         Retorno
         -------
-        None
-            Não há retorno.
+        bool
+            True se a banca foi removida, False caso não exista.
         """
-        banca = self.get_by_id(banca_id)
-        if not banca:
-            return
-
-        self.db.delete(banca)
-        self.db.commit()
+        stmt = delete(Banca).where(Banca.id == banca_id).returning(Banca.id)
+        return self.db.execute(stmt).scalar_one_or_none() is not None
@@ -7,12 +7,18 @@ Funciona como camada intermediária entre o modelo ORM `Pesquisa` e os serviços
 permitindo registrar pesquisas e consultar registros previamente feitos.
 """
 
-from typing import Optional, Sequence, List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+from sqlalchemy import bindparam, func, insert, select
 from sqlalchemy.orm import Session
 
 from src.models.pesquisa import Pesquisa
 
 
+# Consultas de leitura frequente, construídas uma única vez.
+_SELECT_BY_ID = select(Pesquisa).where(Pesquisa.id == bindparam("pesquisa_id"))
+
+
 class PesquisaRepository:
     """
     Encapsula as operações CRUD e consultas específicas da entidade Pesquisa.
@@ -50,19 +56,39 @@ class PesquisaRepository:
         Retorno
         -------
         Pesquisa
-            Instância persistida contendo ID e timestamp gerados.
+            Instância persistida contendo ID e timestamp gerados, obtida
+            com um único `INSERT ... RETURNING`.
         """
-
-        pesquisa = Pesquisa(
-            termo=termo,
-            latitude=latitude,
-            longitude=longitude,
+        stmt = (
+            insert(Pesquisa)
+            .values(
+                termo=termo,
+                latitude=latitude,
+                longitude=longitude,
+            )
+            .returning(Pesquisa)
         )
+        return self.db.scalars(stmt).one()
 
-        self.db.add(pesquisa)
-        self.db.commit()
-        self.db.refresh(pesquisa)
-        return pesquisa
+    def registrar_lote(self, registros: Sequence[Dict[str, Any]]) -> int:
+        """
+        Registra várias pesquisas com um único `INSERT` em lote.
+
+        Parâmetros
+        ----------
+        registros : Sequence[dict]
+            Valores de cada pesquisa (`termo`, `latitude`, `longitude` e,
+            opcionalmente, `created_at`).
+
+        Retorno
+        -------
+        int
+            Quantidade de pesquisas enviadas ao banco.
+        """
+        if not registros:
+            return 0
+        self.db.execute(insert(Pesquisa), list(registros))
+        return len(registros)
 
     # ============================================================
     # LIST
@@ -78,6 +104,51 @@ class PesquisaRepository:
         """
         return self.db.query(Pesquisa).all()
 
+    # ============================================================
+    # INTERVALO DE TEMPO
+    # ============================================================
+    def listar_periodo(
+        self, inicio: datetime, fim: Optional[datetime] = None
+    ) -> Sequence[Pesquisa]:
+        """
+        Retorna as pesquisas registradas em um intervalo de tempo.
+
+        A consulta usa o índice de `created_at` (busca por intervalo).
+
+        Parâmetros
+        ----------
+        inicio : datetime
+            Início do intervalo (inclusivo).
+        fim : datetime | None
+            Fim do intervalo (exclusivo). Quando omitido, não há limite.
+
+        Retorno
+        -------
+        Sequence[Pesquisa]
+            Pesquisas do período, em ordem cronológica.
+        """
+        stmt = select(Pesquisa).where(Pesquisa.created_at >= inicio)
+        if fim is not None:
+            stmt = stmt.where(Pesquisa.created_at < fim)
+        return self.db.scalars(stmt.order_by(Pesquisa.created_at)).all()
+
+    def contar_desde(self, inicio: datetime) -> int:
+        """
+        Conta as pesquisas registradas a partir de um instante.
+
+        Parâmetros
+        ----------
+        inicio : datetime
+            Instante inicial (inclusivo), por exemplo "há uma hora".
+
+        Retorno
+        -------
+        int
+            Quantidade de pesquisas no período.
+        """
+        stmt = select(func.count()).where(Pesquisa.created_at >= inicio)
+        return self.db.scalar(stmt) or 0
+
     # ============================================================
     # GET BY ID
     # ============================================================
@@ -95,7 +166,7 @@ class PesquisaRepository:
         Pesquisa | None
             Instância encontrada ou None caso não exista.
         """
-        return self.db.query(Pesquisa).filter_by(id=pesquisa_id).first()
+        return self.db.scalars(_SELECT_BY_ID, {"pesquisa_id": pesquisa_id}).first()
 
     # ============================================================
     # ALIAS (DUPLICADO)
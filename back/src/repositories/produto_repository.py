@@ -6,11 +6,32 @@ de dados, servindo como intermediário entre o modelo ORM e a camada de
 serviços.
 """
 
-from typing import Optional, Sequence
-from datetime import datetime, timezone
+from datetime import datetime
+from typing import Any, Collection, Dict, List, Mapping, Optional, Sequence
+from sqlalchemy import bindparam, case, insert, select, update
 from sqlalchemy.orm import Session
 
+from src.core.pagination import PageParams
+from src.core.types import utcnow
+
 from src.models.produto_model import Produto
+from src.repositories.utils import (
+    column_values,
+    count_rows,
+    keyset_page,
+    load_fields,
+)
+
+
+# Consultas de leitura frequente, construídas uma única vez no carregamento
+# do módulo. O SQL compilado fica no cache do engine e cada chamada apenas
+# associa os parâmetros, sem reconstruir a consulta.
+_SELECT_BY_ID = select(Produto).where(Produto.id == bindparam("produto_id"))
+_SELECT_BY_BANCA_ID = select(Produto).where(Produto.banca_id == bindparam("banca_id"))
+_SELECT_BY_IDS = select(Produto).where(Produto.id.in_(bindparam("ids", expanding=True)))
+_SELECT_UPDATED_AT = select(Produto.updated_at).where(
+    Produto.id == bindparam("produto_id")
+)
 
 
 class ProdutoRepository:
@@ -38,39 +59,181 @@ class ProdutoRepository:
     ) -> Produto:
         """
         Registra um novo produto no banco de dados.
+
+        Executa um único `INSERT ... RETURNING`, que devolve a linha
+        persistida (incluindo o ID gerado) sem SELECT adicional.
         """
-        produto = Produto(
-            banca_id=banca_id,
-            nome=nome,
-            preco=preco,
-            imagem=imagem,
+        stmt = (
+            insert(Produto)
+            .values(
+                banca_id=banca_id,
+                nome=nome,
+                preco=preco,
+                imagem=imagem,
+            )
+            .returning(Produto)
         )
+        return self.db.scalars(stmt).one()
+
+    def bulk_create_produtos(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Registra vários produtos com um único `executemany`.
+
+        Os valores de `created_at`/`updated_at` vêm dos defaults das
+        colunas. Nenhum objeto ORM é carregado de volta.
 
-        self.db.add(produto)
-        self.db.commit()
-        self.db.refresh(produto)
-        return produto
+        Parâmetros
+        ----------
+        rows : Sequence[dict]
+            Linhas com `banca_id`, `nome`, `preco` e `imagem`.
+
+        Retorno
+        -------
+        int
+            Quantidade de produtos inseridos.
+        """
+        if not rows:
+            return 0
+
+        self.db.execute(insert(Produto), list(rows))
+        return len(rows)
 
     # ============================================================
     # READ
     # ============================================================
-    def get_by_id(self, produto_id: int) -> Optional[Produto]:
+    def get_by_id(
+        self, produto_id: int, fields: Optional[Collection[str]] = None
+    ) -> Optional[Produto]:
         """
         Consulta um produto pelo identificador.
+
+        Com `fields`, apenas as colunas informadas são lidas.
         """
-        return self.db.query(Produto).filter_by(id=produto_id).first()
+        stmt = load_fields(_SELECT_BY_ID, Produto, fields)
+        return self.db.scalars(stmt, {"produto_id": produto_id}).first()
 
-    def get_all(self) -> Sequence[Produto]:
+    def get_many(
+        self, ids: Collection[int], fields: Optional[Collection[str]] = None
+    ) -> Sequence[Produto]:
+        """
+        Consulta vários produtos com um único `IN (...)`.
+
+        A ordem do resultado não é garantida; ids inexistentes são
+        simplesmente ignorados.
+
+        Parâmetros
+        ----------
+        ids : Collection[int]
+            Identificadores procurados.
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+
+        Retorno
+        -------
+        Sequence[Produto]
+            Registros encontrados.
+        """
+        stmt = load_fields(_SELECT_BY_IDS, Produto, fields)
+        return self.db.scalars(stmt, {"ids": list(ids)}).all()
+
+    def get_updated_at(self, produto_id: int) -> Optional[datetime]:
+        """
+        Retorna apenas o `updated_at` do produto (None se não existir),
+        sem carregar o objeto ORM.
+        """
+        return self.db.scalar(_SELECT_UPDATED_AT, {"produto_id": produto_id})
+
+    def get_all(
+        self,
+        fields: Optional[Collection[str]] = None,
+        required: Collection[str] = (),
+    ) -> Sequence[Produto]:
         """
         Retorna todos os produtos cadastrados.
+
+        Com `fields`, apenas as colunas informadas (e as de `required`)
+        são lidas.
         """
-        return self.db.query(Produto).all()
+        stmt = load_fields(select(Produto), Produto, fields, required)
+        return self.db.scalars(stmt).all()
 
     def get_by_banca(self, banca_id: int) -> Sequence[Produto]:
         """
         Retorna todos os produtos pertencentes a uma banca específica.
         """
-        return self.db.query(Produto).filter_by(banca_id=banca_id).all()
+        return self.db.scalars(_SELECT_BY_BANCA_ID, {"banca_id": banca_id}).all()
+
+    def get_page(
+        self, params: PageParams, fields: Optional[Collection[str]] = None
+    ) -> Sequence[Produto]:
+        """
+        Lê uma página de produtos por cursor (ver `keyset_page`).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, chave inicial e tamanho da página.
+        fields : Collection[str] | None
+            Colunas a ler (ver `load_fields`); None lê todas.
+
+        Retorno
+        -------
+        Sequence[Produto]
+            Até `params.limit + 1` registros, em ordem de chave.
+        """
+        return keyset_page(
+            self.db,
+            select(Produto),
+            Produto,
+            params.order_by,
+            params.after,
+            params.limit,
+            fields,
+        )
+
+    def count(self) -> int:
+        """
+        Retorna a quantidade de produtos cadastrados.
+        """
+        return count_rows(self.db, select(Produto))
+
+    def get_page_by_banca(
+        self,
+        banca_id: int,
+        params: PageParams,
+        fields: Optional[Collection[str]] = None,
+    ) -> Sequence[Produto]:
+        """
+        Lê uma página dos produtos de uma banca por cursor.
+        """
+        stmt = select(Produto).where(Produto.banca_id == banca_id)
+        return keyset_page(
+            self.db,
+            stmt,
+            Produto,
+            params.order_by,
+            params.after,
+            params.limit,
+            fields,
+        )
+
+    def count_by_banca(self, banca_id: int) -> int:
+        """
+        Retorna a quantidade de produtos de uma banca.
+        """
+        return count_rows(self.db, select(Produto).where(Produto.banca_id == banca_id))
+
+    def get_updated_since(self, since: datetime) -> Sequence[Produto]:
+        """
+        Retorna os produtos alterados a partir do instante informado,
+        utilizando o índice de `updated_at`.
+        """
+        stmt = (
+            select(Produto)
+            .where(Produto.updated_at >= since)
+            .order_by(Produto.updated_at)
+        )
+        return self.db.scalars(stmt).all()
 
     # ============================================================
     # UPDATE
@@ -78,20 +241,53 @@ class ProdutoRepository:
     def update_produto(self, produto_id: int, **fields) -> Optional[Produto]:
         """
         Atualiza os campos informados do produto especificado.
+
+        Executa um único `UPDATE ... RETURNING`; retorna None quando
+        nenhuma linha corresponde ao identificador.
         """
-        produto = self.get_by_id(produto_id)
-        if not produto:
-            return None
+        values = column_values(Produto, fields)
+        values["updated_at"] = utcnow()
 
-        for key, value in fields.items():
-            if hasattr(produto, key) and value is not None:
-                setattr(produto, key, value)
+        stmt = (
+            update(Produto)
+            .where(Produto.id == produto_id)
+            .values(**values)
+            .returning(Produto)
+        )
+        return self.db.scalars(stmt).one_or_none()
 
-        produto.updated_at = datetime.now(timezone.utc).isoformat()
+    def bulk_update_precos(
+        self, banca_id: int, precos: Mapping[int, float]
+    ) -> List[int]:
+        """
+        Atualiza o preço de vários produtos de uma banca em um único
+        `UPDATE ... CASE ... RETURNING`.
+
+        Somente produtos pertencentes à banca informada são alterados.
+
+        Parâmetros
+        ----------
+        banca_id : int
+            Banca dona dos produtos.
+        precos : Mapping[int, float]
+            Novo preço por ID de produto.
 
-        self.db.commit()
-        self.db.refresh(produto)
-        return produto
+        Retorno
+        -------
+        list[int]
+            IDs dos produtos efetivamente atualizados.
+        """
+        if not precos:
+            return []
+
+        stmt = (
+            update(Produto)
+            .where(Produto.banca_id == banca_id, Produto.id.in_(list(precos)))
+            .values(preco=case(dict(precos), value=Produto.id), updated_at=utcnow())
+            .returning(Produto.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        return list(self.db.scalars(stmt).all())
 
     # ============================================================
     # DELETE
@@ -105,5 +301,5 @@ class ProdutoRepository:
             return False
 
         self.db.delete(produto)
-        self.db.commit()
+        self.db.flush()
         return True
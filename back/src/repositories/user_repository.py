@@ -6,10 +6,20 @@ de dados, servindo como intermediário entre o modelo ORM e a camada de
 serviços.
 """
 
-from typing import Optional, List
-from datetime import datetime, timezone
+import uuid
+from typing import Optional, List, Sequence
+from sqlalchemy import bindparam, delete, insert, select, update
 from sqlalchemy.orm import Session
+
+from src.core.pagination import PageParams
+from src.core.types import utcnow
 from src.models.user import User
+from src.repositories.utils import column_values, count_rows, keyset_page
+
+
+# Consultas de leitura frequente, construídas uma única vez.
+_SELECT_BY_ID = select(User).where(User.id == bindparam("user_id"))
+_SELECT_BY_EMAIL = select(User).where(User.email == bindparam("email"))
 
 
 class UserRepository:
@@ -46,13 +56,29 @@ class UserRepository:
         Retorno
         -------
         User
-            Instância persistida com identificador gerado.
+            Instância persistida com identificador gerado, obtida com um
+            único `INSERT ... RETURNING`.
+
+        Exceções
+        --------
+        ValueError
+            Quando o tipo informado não é suportado.
         """
-        user = User(name=name, email=email, password=password, type=type)
-        self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        if type not in ("user", "admin", "supplier"):
+            raise ValueError("Invalid user type.")
+
+        stmt = (
+            insert(User)
+            .values(
+                id=str(uuid.uuid4()),
+                name=name,
+                email=email,
+                password=password,
+                type=type,
+            )
+            .returning(User)
+        )
+        return self.db.scalars(stmt).one()
 
     # READ
     def get_by_id(self, user_id: str) -> Optional[User]:
@@ -69,7 +95,7 @@ class UserRepository:
         User ou None
             Registro encontrado ou None.
         """
-        return self.db.query(User).filter_by(id=user_id).first()
+        return self.db.scalars(_SELECT_BY_ID, {"user_id": user_id}).first()
 
     def get_by_email(self, email: str) -> Optional[User]:
         """
@@ -85,7 +111,7 @@ class UserRepository:
         User ou None
             Registro correspondente ou None.
         """
-        return self.db.query(User).filter_by(email=email).first()
+        return self.db.scalars(_SELECT_BY_EMAIL, {"email": email}).first()
 
     def get_all(self) -> List[User]:
         """
@@ -98,6 +124,30 @@ class UserRepository:
         """
         return self.db.query(User).all()
 
+    def get_page(self, params: PageParams) -> Sequence[User]:
+        """
+        Lê uma página de usuários por cursor (ver `keyset_page`).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, chave inicial e tamanho da página.
+
+        Retorno
+        -------
+        Sequence[User]
+            Até `params.limit + 1` registros, em ordem de chave.
+        """
+        return keyset_page(
+            self.db, select(User), User, params.order_by, params.after, params.limit
+        )
+
+    def count(self) -> int:
+        """
+        Retorna a quantidade de usuários cadastrados.
+        """
+        return count_rows(self.db, select(User))
+
     # UPDATE
     def update_user(self, user_id: str, **fields) -> Optional[User]:
         """
@@ -113,27 +163,24 @@ class UserRepository:
         Retorno
         -------
         User ou None
-            Instância atualizada ou None se o registro não existir.
+            Instância atualizada (via `UPDATE ... RETURNING`) ou None se o
+            registro não existir.
         """
-        user = self.get_by_id(user_id)
-        if not user:
-            return None
-
-        for key, value in fields.items():
-            if hasattr(user, key) and value is not None:
-                setattr(user, key, value)
-
-        user.updated_at = datetime.now(timezone.utc).isoformat()
+        values = column_values(User, fields)
+        values["updated_at"] = utcnow()
 
-        self.db.commit()
-        self.db.refresh(user)
-        return user
+        stmt = update(User).where(User.id == user_id).values(**values).returning(User)
+        return self.db.scalars(stmt).one_or_none()
 
     # DELETE
-    def delete_user(self, user_id: str) -> None:
+    def delete_user(self, user_id: str) -> bool:
         """
         Remove o usuário correspondente ao identificador.
 
+        Executa um único `DELETE`; as bancas de um fornecedor (e os
+        produtos delas) são removidas pelo próprio banco
+        (`ON DELETE CASCADE`).
+
         Parâmetros
         ----------
         user_id : str
@@ -141,12 +188,8 @@ class UserRepository:
 
         Retorno
         -------
-        None
-            Não há retorno.
+        bool
+            True se o usuário foi removido, False caso não exista.
         """
-        user = self.get_by_id(user_id)
-        if not user:
-            return
-
-        self.db.delete(user)
-        self.db.commit()
+        stmt = delete(User).where(User.id == user_id).returning(User.id)
+        return self.db.execute(stmt).scalar_one_or_none() is not None
@@ -0,0 +1,180 @@
+"""
+## Utilitários dos Repositórios
+
+Funções auxiliares compartilhadas pelos repositórios na montagem de
+comandos `INSERT`/`UPDATE` diretos, das listagens paginadas, das
+leituras parciais (`fields=`) e da carga de relacionamentos
+(`include=`).
+"""
+
+from typing import Any, Collection, Dict, Iterable, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.orm import Session, load_only, selectinload
+
+from src.core.pagination import ORDER_KEYS
+
+
+def column_values(model, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Filtra os campos informados, mantendo apenas colunas do modelo.
+
+    Parâmetros
+    ----------
+    model : type
+        Classe ORM cuja tabela define as colunas válidas.
+    fields : dict
+        Campos recebidos da camada de serviços.
+
+    Retorno
+    -------
+    dict
+        Pares coluna/valor com valores não nulos, prontos para `values()`.
+    """
+    columns = model.__table__.columns
+    return {
+        key: value
+        for key, value in fields.items()
+        if key in columns and value is not None
+    }
+
+
+def load_fields(
+    stmt: Select,
+    model,
+    fields: Optional[Collection[str]],
+    required: Iterable[str] = (),
+) -> Select:
+    """
+    Restringe as colunas lidas pela consulta ORM às informadas.
+
+    As demais colunas ficam adiadas (`load_only`): não entram no `SELECT`
+    e só seriam lidas se acessadas depois. A chave primária é sempre
+    incluída pelo próprio SQLAlchemy.
+
+    Parâmetros
+    ----------
+    stmt : Select
+        Consulta sobre `model`.
+    model : type
+        Classe ORM consultada.
+    fields : Collection[str] | None
+        Atributos desejados. None mantém todas as colunas.
+    required : Iterable[str]
+        Atributos lidos mesmo que não solicitados (filtros, chaves de
+        ordenação).
+
+    Retorno
+    -------
+    Select
+        Consulta com a opção de carregamento aplicada.
+    """
+    if fields is None:
+        return stmt
+
+    names = dict.fromkeys([*required, *fields])
+    return stmt.options(load_only(*(getattr(model, name) for name in names)))
+
+
+def relation_columns(model, relations: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Retorna as colunas de `model` necessárias para carregar os
+    relacionamentos informados (chaves estrangeiras locais, ou a chave
+    primária nos relacionamentos um-para-muitos).
+
+    Usada como `required` de `load_fields`, evitando que uma coluna
+    adiada seja lida objeto a objeto durante a carga.
+    """
+    columns = []
+    for name in relations:
+        prop = getattr(model, name).property
+        columns.extend(column.key for column in prop.local_columns)
+    return tuple(dict.fromkeys(columns))
+
+
+def load_relations(stmt: Select, model, relations: Iterable[str]) -> Select:
+    """
+    Carrega os relacionamentos informados com `selectinload`.
+
+    Cada relacionamento custa uma única consulta adicional
+    (`WHERE chave IN (...)`) para todas as linhas do resultado, qualquer
+    que seja a quantidade de linhas.
+
+    Parâmetros
+    ----------
+    stmt : Select
+        Consulta sobre `model`.
+    model : type
+        Classe ORM consultada.
+    relations : Iterable[str]
+        Nomes dos relacionamentos de `model`.
+
+    Retorno
+    -------
+    Select
+        Consulta com as opções de carga.
+    """
+    options = [selectinload(getattr(model, name)) for name in relations]
+    return stmt.options(*options) if options else stmt
+
+
+def keyset_page(
+    db: Session,
+    stmt: Select,
+    model,
+    order_by: str,
+    after: Optional[Sequence[Any]],
+    limit: int,
+    fields: Optional[Collection[str]] = None,
+    required: Iterable[str] = (),
+) -> Sequence[Any]:
+    """
+    Lê uma página da consulta por cursor (keyset).
+
+    Aplica `WHERE (chave) > (after) ORDER BY chave LIMIT limit + 1`; a
+    linha excedente indica a existência de uma próxima página (ver
+    `src.core.pagination.make_page`).
+
+    Parâmetros
+    ----------
+    db : Session
+        Sessão ativa.
+    stmt : Select
+        Consulta base, já com os filtros da listagem.
+    model : type
+        Classe ORM cujas colunas formam a chave.
+    order_by : str
+        Chave de ordenação (ver `ORDER_KEYS`).
+    after : Sequence | None
+        Chave da última linha da página anterior.
+    limit : int
+        Tamanho da página.
+    fields : Collection[str] | None
+        Colunas a ler (ver `load_fields`); as da chave são sempre lidas.
+    required : Iterable[str]
+        Outras colunas lidas mesmo fora de `fields`.
+
+    Retorno
+    -------
+    Sequence
+        Até `limit + 1` objetos, em ordem de chave.
+    """
+    keys = ORDER_KEYS[order_by]
+    columns = [getattr(model, field) for field in keys]
+    stmt = load_fields(stmt, model, fields, required=(*keys, *required))
+
+    if after is not None:
+        if len(columns) == 1:
+            stmt = stmt.where(columns[0] > after[0])
+        else:
+            stmt = stmt.where(tuple_(*columns) > tuple(after))
+
+    stmt = stmt.order_by(*columns).limit(limit + 1)
+    return db.scalars(stmt).all()
+
+
+def count_rows(db: Session, stmt: Select) -> int:
+    """
+    Conta as linhas retornadas por uma consulta.
+    """
+    return db.execute(select(func.count()).select_from(stmt.subquery())).scalar_one()
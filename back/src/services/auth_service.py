@@ -8,28 +8,11 @@ Este serviço não implementa hashing de senha — apenas validações diretas,
 adequado para ambientes controlados ou protótipos.
 """
 
-from typing import Literal, cast
+from src.dto.mapper import to_dto
 from src.dto.user_dto import LoginDTO, UserResponseDTO
 from src.repositories.user_repository import UserRepository
 
 
-def _to_iso(value):
-    """
-    Converte um datetime para string ISO 8601 caso necessário.
-
-    Parâmetros
-    ----------
-    value : datetime | str
-        Valor retornado pelo ORM.
-
-    Retorno
-    -------
-    str
-        Representação padrão ISO 8601.
-    """
-    return value if isinstance(value, str) else value.isoformat()
-
-
 class AuthService:
     """
     Serviço responsável por operações de autenticação de usuários.
@@ -78,11 +61,4 @@ class AuthService:
         if str(user.password) != dto.password:
             raise ValueError("Senha incorreta.")
 
-        return UserResponseDTO(
-            id=str(user.id),
-            name=str(user.name),
-            email=str(user.email),
-            type=cast(Literal["user", "admin", "supplier"], str(user.type)),
-            created_at=_to_iso(user.created_at),
-            updated_at=_to_iso(user.updated_at),
-        )
+        return to_dto(UserResponseDTO, user)
@@ -9,23 +9,43 @@ Principais responsabilidades:
 - Validar os dados de criação e atualização de bancas.
 - Criar automaticamente o endereço associado a uma banca.
 - Encapsular lógica de leitura, listagem e exclusão.
+- Incorporar às leituras os relacionamentos pedidos em `include`
+  (endereço, produtos e fornecedor).
 """
 
-from typing import List, Optional
+from datetime import datetime
+from functools import partial
+from typing import Collection, List, Optional, Sequence, Type
 
+from src.core.batch import Batch, make_batch
+from src.core.pagination import Page, PageParams, make_page
+from src.core.unit_of_work import UnitOfWork
+from src.dto.mapper import fieldset_model, to_dto, to_dto_list
 from src.repositories.banca_repository import BancaRepository
 from src.repositories.address_repository import AddressRepository
+from src.repositories.user_repository import UserRepository
 
 from src.dto.banca_dto import (
     BancaCreate,
     BancaRead,
     BancaUpdate,
+    banca_detail_model,
 )
 
 from src.models.banca import Banca
 from src.models.address import Address
 
 
+def _read_model(
+    fields: Optional[Collection[str]], include: Collection[str]
+) -> Type[BancaRead]:
+    """
+    DTO de leitura com os campos de `fields` e os relacionamentos de
+    `include`.
+    """
+    return banca_detail_model(fieldset_model(BancaRead, fields), include)
+
+
 class BancaService:
     """
     Serviço de gerenciamento de bancas.
@@ -34,9 +54,16 @@ class BancaService:
     -----------------
     - Toda banca deve possuir um fornecedor válido (`supplier_id`).
     - Toda banca deve possuir um endereço próprio, criado a partir do DTO recebido.
+    - Fornecedor e endereço informados devem existir; caso contrário a
+      operação falha com `ValueError`, antes de qualquer escrita.
     """
 
-    def __init__(self, banca_repo: BancaRepository, address_repo: AddressRepository):
+    def __init__(
+        self,
+        banca_repo: BancaRepository,
+        address_repo: AddressRepository,
+        user_repo: Optional[UserRepository] = None,
+    ):
         """
         Inicializa o serviço com os repositórios necessários.
 
@@ -46,9 +73,37 @@ class BancaService:
             Repositório responsável pelas operações relacionadas à entidade Banca.
         address_repo : AddressRepository
             Repositório utilizado para criação e manipulação de endereços.
+        user_repo : UserRepository | None
+            Repositório usado para validar o fornecedor. Por padrão, usa a
+            mesma sessão de `banca_repo`.
         """
         self.banca_repo = banca_repo
         self.address_repo = address_repo
+        self.user_repo = user_repo or UserRepository(banca_repo.db)
+        self.uow = UnitOfWork(banca_repo.db)
+
+    # ============================================================
+    # VALIDAÇÃO
+    # ============================================================
+    def _check_references(
+        self, supplier_id: Optional[str] = None, address_id: Optional[str] = None
+    ) -> None:
+        """
+        Garante que o fornecedor e o endereço informados existem.
+
+        Com as chaves estrangeiras habilitadas, uma referência inexistente
+        seria recusada pelo banco com `IntegrityError`; a verificação
+        prévia permite responder com uma mensagem clara.
+
+        Exceções
+        --------
+        ValueError
+            Se algum dos identificadores não corresponder a um registro.
+        """
+        if supplier_id is not None and self.user_repo.get_by_id(supplier_id) is None:
+            raise ValueError("Fornecedor não encontrado.")
+        if address_id is not None and self.address_repo.get_by_id(address_id) is None:
+            raise ValueError("Endereço não encontrado.")
 
     # ============================================================
     # CREATE
@@ -66,35 +121,45 @@ class BancaService:
         -------
         BancaRead
             DTO contendo os dados completos da banca criada.
+
+        Exceções
+        --------
+        ValueError
+            Se o fornecedor não existir.
+
+        Observações
+        -----------
+        Endereço e banca são gravados na mesma transação: se a criação da
+        banca falhar, o endereço também é descartado.
         """
+        self._check_references(supplier_id=str(dto.supplier_id))
 
-        # 1. Criar endereço associado
-        address: Address = self.address_repo.create_address(**dto.address.dict())
-
-        # 2. Criar a banca
-        banca: Banca = self.banca_repo.create_banca(
-            supplier_id=dto.supplier_id,
-            address_id=address.id,
-            nome=dto.nome,
-            descricao=dto.descricao,
-            horario_funcionamento=dto.horario_funcionamento,
-        )
-
-        return BancaRead(
-            id=banca.id,
-            nome=banca.nome,
-            descricao=banca.descricao,
-            horario_funcionamento=banca.horario_funcionamento,
-            supplier_id=banca.supplier_id,
-            address_id=banca.address_id,
-            created_at=banca.created_at,
-            updated_at=banca.updated_at,
-        )
+        with self.uow:
+            # 1. Criar endereço associado
+            address: Address = self.address_repo.create_address(
+                **dto.address.model_dump()
+            )
+
+            # 2. Criar a banca
+            banca: Banca = self.banca_repo.create_banca(
+                supplier_id=str(dto.supplier_id),
+                address_id=address.id,
+                nome=dto.nome,
+                descricao=dto.descricao,
+                horario_funcionamento=dto.horario_funcionamento,
+            )
+
+        return to_dto(BancaRead, banca)
 
     # ============================================================
     # READ
     # ============================================================
-    def get_banca(self, banca_id: int) -> Optional[BancaRead]:
+    def get_banca(
+        self,
+        banca_id: int,
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Optional[BancaRead]:
         """
         Retorna uma banca específica pelo ID.
 
@@ -102,26 +167,67 @@ class BancaService:
         ----------
         banca_id : int
             Identificador da banca.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+        include : Collection[str]
+            Relacionamentos incorporados (`address`, `produtos`,
+            `supplier`).
 
         Retorno
         -------
         BancaRead | None
             DTO da banca encontrada ou None caso não exista.
         """
-        banca = self.banca_repo.get_by_id(banca_id)
+        banca = self.banca_repo.get_by_id(banca_id, fields, include)
         if not banca:
             return None
 
-        return BancaRead(
-            id=banca.id,
-            nome=banca.nome,
-            descricao=banca.descricao,
-            horario_funcionamento=banca.horario_funcionamento,
-            supplier_id=banca.supplier_id,
-            address_id=banca.address_id,
-            created_at=banca.created_at,
-            updated_at=banca.updated_at,
-        )
+        return to_dto(_read_model(fields, include), banca)
+
+    def get_bancas_by_ids(
+        self,
+        ids: Sequence[int],
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Batch[BancaRead]:
+        """
+        Retorna várias bancas pelos IDs, com uma única consulta.
+
+        Parâmetros
+        ----------
+        ids : Sequence[int]
+            Identificadores, na ordem desejada.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+        include : Collection[str]
+            Relacionamentos incorporados (ver `get_banca`).
+
+        Retorno
+        -------
+        Batch[BancaRead]
+            Bancas encontradas na ordem dos ids e ids inexistentes.
+        """
+        rows = self.banca_repo.get_many(ids, fields, include)
+
+        model = _read_model(fields, include)
+        return make_batch(ids, rows, partial(to_dto_list, model))
+
+    def get_updated_at(self, banca_id: int) -> Optional[datetime]:
+        """
+        Retorna o instante da última alteração da banca, usado como
+        validador das requisições condicionais.
+
+        Parâmetros
+        ----------
+        banca_id : int
+            Identificador da banca.
+
+        Retorno
+        -------
+        datetime | None
+            `updated_at` da banca ou None caso não exista.
+        """
+        return self.banca_repo.get_updated_at(banca_id)
 
     # ============================================================
     # LIST
@@ -137,19 +243,37 @@ class BancaService:
         """
         bancas = self.banca_repo.get_all()
 
-        return [
-            BancaRead(
-                id=b.id,
-                nome=b.nome,
-                descricao=b.descricao,
-                horario_funcionamento=b.horario_funcionamento,
-                supplier_id=b.supplier_id,
-                address_id=b.address_id,
-                created_at=b.created_at,
-                updated_at=b.updated_at,
-            )
-            for b in bancas
-        ]
+        return to_dto_list(BancaRead, bancas)
+
+    def list_bancas_page(
+        self,
+        params: PageParams,
+        fields: Optional[Collection[str]] = None,
+        include: Collection[str] = (),
+    ) -> Page[BancaRead]:
+        """
+        Retorna uma página das bancas cadastradas (paginação por cursor).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, cursor e tamanho da página.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+        include : Collection[str]
+            Relacionamentos incorporados (ver `get_banca`).
+
+        Retorno
+        -------
+        Page[BancaRead]
+            Itens da página, cursor da próxima e, se solicitado, o total.
+        """
+
+        rows = self.banca_repo.get_page(params, fields, include)
+        total = self.banca_repo.count() if params.include_total else None
+
+        model = _read_model(fields, include)
+        return make_page(rows, params, partial(to_dto_list, model), total)
 
     # ============================================================
     # UPDATE
@@ -169,27 +293,22 @@ class BancaService:
         -------
         BancaRead | None
             DTO atualizado ou None caso a banca não exista.
-        """
 
-        banca = self.banca_repo.get_by_id(banca_id)
-        if not banca:
-            return None
+        Exceções
+        --------
+        ValueError
+            Se o fornecedor ou o endereço informados não existirem.
+        """
+        changes = dto.model_dump(exclude_none=True, mode="json")
+        self._check_references(changes.get("supplier_id"), changes.get("address_id"))
 
-        updated = self.banca_repo.update_banca(banca_id, **dto.dict(exclude_none=True))
+        with self.uow:
+            updated = self.banca_repo.update_banca(banca_id, **changes)
 
         if updated is None:
             return None
 
-        return BancaRead(
-            id=updated.id,
-            nome=updated.nome,
-            descricao=updated.descricao,
-            horario_funcionamento=updated.horario_funcionamento,
-            supplier_id=updated.supplier_id,
-            address_id=updated.address_id,
-            created_at=updated.created_at,
-            updated_at=updated.updated_at,
-        )
+        return to_dto(BancaRead, updated)
 
     # ============================================================
     # DELETE
@@ -208,10 +327,5 @@ class BancaService:
         bool
             True se a banca foi removida, False caso não exista.
         """
-
-        banca = self.banca_repo.get_by_id(banca_id)
-        if not banca:
-            return False
-
-        self.banca_repo.delete_banca(banca_id)
-        return True
+        with self.uow:
+            return self.banca_repo.delete_banca(banca_id)
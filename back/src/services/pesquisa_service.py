@@ -10,23 +10,33 @@ Este serviço oferece funcionalidades avançadas para:
 - aplicar filtros de distância máxima (Haversine)
 - ordenar resultados por distância ou preço
 - combinar múltiplos filtros simultaneamente
+- coalescer buscas idênticas simultâneas em um único cálculo
+
+Buscas concorrentes com os mesmos parâmetros normalizados aguardam o
+cálculo que já está em andamento e compartilham o resultado (ver
+`src.core.singleflight`). O registro da pesquisa continua sendo feito
+por chamada.
 
 A camada de serviços integra consultas nos repositórios e aplica
 toda a lógica de negócio antes de retornar resultados estruturados.
 """
 
 import math
-from typing import Optional, List
+from typing import Collection, Hashable, List, Optional, Tuple
 
 from sqlalchemy.orm import Session
 
-from src.dto.pesquisa_dto import SearchResponse
+from src.core.singleflight import SingleFlight
+from src.core.unit_of_work import UnitOfWork
+from src.dto.mapper import fieldset_model, to_dto_list
+from src.dto.pesquisa_dto import SearchResponse, search_response_model
 from src.dto.produto_dto import ProdutoRead
 from src.dto.banca_dto import BancaRead
 
 from src.repositories.pesquisa_repository import PesquisaRepository
 from src.repositories.produto_repository import ProdutoRepository
 from src.repositories.banca_repository import BancaRepository
+from src.services.search_log import SearchLog
 
 
 # ============================================================
@@ -69,6 +79,57 @@ def calcular_distancia(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
 
 
+# ============================================================
+# CAMPOS DA RESPOSTA (fields=)
+# ============================================================
+
+
+def _fields_for(model, fields: Optional[Collection[str]]) -> Optional[List[str]]:
+    """
+    Filtra os campos solicitados na busca que pertencem ao DTO informado.
+
+    Retorna None quando nenhum campo foi solicitado.
+    """
+    if fields is None:
+        return None
+    return [name for name in fields if name in model.model_fields] or ["id"]
+
+
+# ============================================================
+# COALESCÊNCIA DE BUSCAS
+# ============================================================
+
+_buscas: SingleFlight[Tuple[list, list]] = SingleFlight()
+
+
+def _chave_busca(
+    termo: str,
+    tipo: str,
+    preco_max: Optional[float],
+    distancia_max_metros: Optional[float],
+    order_by: Optional[str],
+    lat_filtro: Optional[float],
+    lon_filtro: Optional[float],
+    fields: Optional[Collection[str]],
+) -> Hashable:
+    """
+    Normaliza os parâmetros que definem o resultado de uma busca.
+
+    O termo é comparado sem diferenciar maiúsculas (como no filtro) e a
+    localização considerada é a usada nos filtros, não a registrada.
+    """
+    return (
+        termo.lower(),
+        tipo,
+        preco_max,
+        distancia_max_metros,
+        order_by,
+        lat_filtro,
+        lon_filtro,
+        frozenset(fields) if fields is not None else None,
+    )
+
+
 # ============================================================
 # SERVIÇO DE PESQUISA
 # ============================================================
@@ -86,7 +147,7 @@ class PesquisaService:
     - Ordenação por distância ou preço.
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, search_log: Optional[SearchLog] = None):
         """
         Inicializa o serviço com instâncias dos repositórios usados.
 
@@ -94,8 +155,13 @@ class PesquisaService:
         ----------
         db : Session
             Sessão ativa do SQLAlchemy compartilhada entre os repositórios.
+        search_log : SearchLog | None
+            Fila de gravação em lote dos registros de pesquisa. Quando
+            omitida, cada pesquisa é registrada na própria sessão.
         """
         self.db = db
+        self.search_log = search_log
+        self.uow = UnitOfWork(db)
         self.produto_repo = ProdutoRepository(db)
         self.banca_repo = BancaRepository(db)
         self.pesquisa_repo = PesquisaRepository(db)
@@ -114,6 +180,7 @@ class PesquisaService:
         order_by: Optional[str] = None,
         lat_ref: Optional[float] = None,
         lon_ref: Optional[float] = None,
+        fields: Optional[Collection[str]] = None,
     ) -> SearchResponse:
         """
         Executa uma busca com filtros opcionais de preço, distância e ordenação.
@@ -138,6 +205,9 @@ class PesquisaService:
             Latitude alternativa para aplicar filtros de distância.
         lon_ref : float | None
             Longitude alternativa para aplicar filtros de distância.
+        fields : Collection[str] | None
+            Campos retornados em cada item. Cada lista recebe os campos
+            que existem no seu DTO (ou apenas `id`, se nenhum existir).
 
         Retorno
         -------
@@ -146,31 +216,104 @@ class PesquisaService:
         """
 
         # --------------------------------------------------------
-        # 1. Registrar a pesquisa
+        # 1. Registrar a pesquisa (sempre, mesmo se coalescida)
         # --------------------------------------------------------
-        self.pesquisa_repo.registrar(
-            termo=termo,
-            latitude=lat_user,
-            longitude=lon_user,
+        if self.search_log is not None:
+            self.search_log.record(termo, lat_user, lon_user)
+        else:
+            with self.uow:
+                self.pesquisa_repo.registrar(
+                    termo=termo,
+                    latitude=lat_user,
+                    longitude=lon_user,
+                )
+
+        produto_model = fieldset_model(ProdutoRead, _fields_for(ProdutoRead, fields))
+        banca_model = fieldset_model(BancaRead, _fields_for(BancaRead, fields))
+
+        # Localização base para filtros e ordenações
+        lat_filtro = lat_ref if lat_ref is not None else lat_user
+        lon_filtro = lon_ref if lon_ref is not None else lon_user
+
+        # --------------------------------------------------------
+        # 2. Calcular o resultado (ou aguardar o cálculo idêntico
+        #    em andamento)
+        # --------------------------------------------------------
+        chave = _chave_busca(
+            termo,
+            tipo,
+            preco_max,
+            distancia_max_metros,
+            order_by,
+            lat_filtro,
+            lon_filtro,
+            fields,
+        )
+        (produtos_result, bancas_result), _ = _buscas.do(
+            chave,
+            lambda: self._executar_busca(
+                termo,
+                tipo,
+                preco_max,
+                distancia_max_metros,
+                order_by,
+                lat_filtro,
+                lon_filtro,
+                fields,
+            ),
         )
 
+        # --------------------------------------------------------
+        # 3. Retorno no formato SearchResponse
+        # --------------------------------------------------------
+        return search_response_model(produto_model, banca_model)(
+            query=termo,
+            produtos=produtos_result,
+            bancas=bancas_result,
+        )
+
+    # --------------------------------------------------------
+    # CÁLCULO DA BUSCA
+    # --------------------------------------------------------
+    def _executar_busca(
+        self,
+        termo: str,
+        tipo: str,
+        preco_max: Optional[float],
+        distancia_max_metros: Optional[float],
+        order_by: Optional[str],
+        lat_filtro: Optional[float],
+        lon_filtro: Optional[float],
+        fields: Optional[Collection[str]],
+    ) -> Tuple[list, list]:
+        """
+        Filtra, ordena e converte produtos e bancas de uma busca.
+
+        Retorno
+        -------
+        tuple[list, list]
+            DTOs de produtos e de bancas encontrados.
+        """
         produtos_result: List[ProdutoRead] = []
         bancas_result: List[BancaRead] = []
 
+        produto_fields = _fields_for(ProdutoRead, fields)
+        banca_fields = _fields_for(BancaRead, fields)
+        produto_model = fieldset_model(ProdutoRead, produto_fields)
+        banca_model = fieldset_model(BancaRead, banca_fields)
+
         # Se houver filtro de distância, converter METROS → KM
         distancia_max_km = (
             distancia_max_metros / 1000.0 if distancia_max_metros is not None else None
         )
 
-        # Localização base para filtros e ordenações
-        lat_filtro = lat_ref if lat_ref is not None else lat_user
-        lon_filtro = lon_ref if lon_ref is not None else lon_user
-
         # --------------------------------------------------------
-        # 2. Buscar PRODUTOS
+        # Buscar PRODUTOS
         # --------------------------------------------------------
         if tipo in ("produto", "all"):
-            produtos = self.produto_repo.get_all()
+            produtos = self.produto_repo.get_all(
+                produto_fields, required=("nome", "preco", "banca_id")
+            )
 
             # Filtrar por nome
             produtos = [p for p in produtos if termo.lower() in p.nome.lower()]
@@ -211,24 +354,15 @@ class PesquisaService:
                 )
 
             # Converter para DTO
-            produtos_result = [
-                ProdutoRead(
-                    id=p.id,
-                    nome=p.nome,
-                    preco=p.preco,
-                    imagem=p.imagem,
-                    banca_id=p.banca_id,
-                    created_at=p.created_at,
-                    updated_at=p.updated_at,
-                )
-                for p in produtos
-            ]
+            produtos_result = to_dto_list(produto_model, produtos)
 
         # --------------------------------------------------------
-        # 3. Buscar BANCAS
+        # Buscar BANCAS
         # --------------------------------------------------------
         if tipo in ("banca", "all"):
-            bancas = self.banca_repo.get_all()
+            bancas = self.banca_repo.get_all(
+                banca_fields, required=("nome", "address_id")
+            )
 
             # Filtrar por nome
             bancas = [b for b in bancas if termo.lower() in b.nome.lower()]
@@ -262,25 +396,6 @@ class PesquisaService:
                 )
 
             # Converter para DTO
-            bancas_result = [
-                BancaRead(
-                    id=b.id,
-                    nome=b.nome,
-                    descricao=b.descricao,
-                    horario_funcionamento=b.horario_funcionamento,
-                    supplier_id=b.supplier_id,
-                    address_id=b.address_id,
-                    created_at=b.created_at,
-                    updated_at=b.updated_at,
-                )
-                for b in bancas
-            ]
+            bancas_result = to_dto_list(banca_model, bancas)
 
-        # --------------------------------------------------------
-        # 4. Retorno no formato SearchResponse
-        # --------------------------------------------------------
-        return SearchResponse(
-            query=termo,
-            produtos=produtos_result,
-            bancas=bancas_result,
-        )
+        return produtos_result, bancas_result
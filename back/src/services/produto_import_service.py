@@ -0,0 +1,215 @@
+"""
+## Serviço: ProdutoImportService
+
+Importação em lote de produtos a partir de listas de preços enviadas pelos
+fornecedores, em NDJSON (um objeto JSON por linha) ou CSV com cabeçalho.
+
+O corpo da requisição é processado em fluxo: cada linha é validada assim
+que chega e as linhas válidas são agrupadas em blocos gravados com um
+único `executemany` por transação.
+
+Regras de negócio:
+- Cada `banca_id` distinto é verificado uma única vez em toda a importação.
+- Linhas inválidas não interrompem a importação; são devolvidas como erro
+  com o número da linha correspondente.
+"""
+
+import csv
+import json
+import logging
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.core.unit_of_work import UnitOfWork
+from src.dto.produto_dto import ProdutoBulkError, ProdutoBulkResult, ProdutoCreate
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# PARSERS DE LINHA
+# ============================================================
+
+
+def _descrever_erro(exc: Exception) -> str:
+    """
+    Resume um erro de validação em uma mensagem curta.
+    """
+    if isinstance(exc, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(p) for p in err['loc']) or 'linha'}: {err['msg']}"
+            for err in exc.errors()
+        )
+    return str(exc)
+
+
+class NdjsonParser:
+    """
+    Interpreta linhas NDJSON: cada linha é um objeto JSON de produto.
+    """
+
+    def parse(self, linha: str) -> Optional[ProdutoCreate]:
+        try:
+            data = json.loads(linha)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"JSON inválido: {exc.msg}") from exc
+
+        if not isinstance(data, dict):
+            raise ValueError("Cada linha deve conter um objeto JSON.")
+
+        return ProdutoCreate.model_validate(data)
+
+
+class CsvParser:
+    """
+    Interpreta linhas CSV. A primeira linha é o cabeçalho com os nomes dos
+    campos (`banca_id`, `nome`, `preco` e, opcionalmente, `imagem`).
+
+    Campos com quebra de linha entre aspas não são suportados, pois o
+    arquivo é processado linha a linha.
+    """
+
+    def __init__(self):
+        self._header: Optional[List[str]] = None
+
+    def parse(self, linha: str) -> Optional[ProdutoCreate]:
+        valores = next(csv.reader([linha]))
+
+        if self._header is None:
+            self._header = [campo.strip() for campo in valores]
+            return None
+
+        if len(valores) != len(self._header):
+            raise ValueError(
+                f"Esperado(s) {len(self._header)} campo(s), "
+                f"recebido(s) {len(valores)}."
+            )
+
+        data: Dict[str, Any] = {
+            campo: (valor if valor != "" else None)
+            for campo, valor in zip(self._header, valores)
+        }
+        return ProdutoCreate.model_validate(data)
+
+
+# ============================================================
+# SERVIÇO DE IMPORTAÇÃO
+# ============================================================
+
+
+class ProdutoImportService:
+    """
+    Acumula o estado de uma importação em lote de produtos.
+
+    Uma instância corresponde a uma importação: guarda as bancas já
+    verificadas, o total inserido e os erros por linha.
+    """
+
+    chunk_size = 1000
+
+    def __init__(self, produto_repo: ProdutoRepository, banca_repo: BancaRepository):
+        """
+        Inicializa o serviço com os repositórios necessários.
+
+        Parâmetros
+        ----------
+        produto_repo : ProdutoRepository
+            Repositório utilizado para a gravação em lote.
+        banca_repo : BancaRepository
+            Repositório utilizado para verificar as bancas informadas.
+        """
+        self.produto_repo = produto_repo
+        self.banca_repo = banca_repo
+        self.uow = UnitOfWork(produto_repo.db)
+
+        self._bancas_validas: Set[int] = set()
+        self._bancas_invalidas: Set[int] = set()
+        self._inseridos = 0
+        self._erros: List[ProdutoBulkError] = []
+
+    # --------------------------------------------------------
+    # ERROS
+    # --------------------------------------------------------
+    def registrar_erro(self, linha: int, exc: Exception) -> None:
+        """
+        Registra a rejeição de uma linha.
+
+        Parâmetros
+        ----------
+        linha : int
+            Número da linha no corpo enviado (a partir de 1).
+        exc : Exception
+            Erro de interpretação ou validação da linha.
+        """
+        self._erros.append(ProdutoBulkError(linha=linha, erro=_descrever_erro(exc)))
+
+    # --------------------------------------------------------
+    # GRAVAÇÃO DE UM BLOCO
+    # --------------------------------------------------------
+    def importar_bloco(self, bloco: List[Tuple[int, ProdutoCreate]]) -> None:
+        """
+        Valida as bancas de um bloco de linhas e grava as linhas válidas.
+
+        Parâmetros
+        ----------
+        bloco : list[tuple[int, ProdutoCreate]]
+            Pares (número da linha, produto validado).
+
+        Observações
+        -----------
+        - Somente bancas ainda não vistas nesta importação são consultadas.
+        - O bloco é gravado em uma única transação; se a gravação falhar,
+          todas as linhas do bloco são reportadas com uma mensagem curta e
+          o erro do banco (comando e parâmetros) vai apenas para o log.
+        """
+        novas = {dto.banca_id for _, dto in bloco} - (
+            self._bancas_validas | self._bancas_invalidas
+        )
+        if novas:
+            existentes = self.banca_repo.get_existing_ids(novas)
+            self._bancas_validas |= existentes
+            self._bancas_invalidas |= novas - existentes
+
+        linhas: List[int] = []
+        rows: List[Dict[str, Any]] = []
+        for numero, dto in bloco:
+            if dto.banca_id not in self._bancas_validas:
+                self.registrar_erro(numero, ValueError("A banca informada não existe."))
+                continue
+            linhas.append(numero)
+            rows.append(dto.model_dump(include={"banca_id", "nome", "preco", "imagem"}))
+
+        if not rows:
+            return
+
+        try:
+            with self.uow:
+                inseridos = self.produto_repo.bulk_create_produtos(rows)
+        except SQLAlchemyError:
+            logger.exception(
+                "Falha ao gravar o bloco das linhas %d a %d", linhas[0], linhas[-1]
+            )
+            erro = ValueError(
+                f"Falha ao gravar o bloco das linhas {linhas[0]} a {linhas[-1]}; "
+                "nenhuma linha do bloco foi gravada."
+            )
+            for numero in linhas:
+                self.registrar_erro(numero, erro)
+            return
+
+        self._inseridos += inseridos
+
+    # --------------------------------------------------------
+    # RESULTADO
+    # --------------------------------------------------------
+    def resultado(self) -> ProdutoBulkResult:
+        """
+        Retorna o resumo da importação, com erros ordenados por linha.
+        """
+        return ProdutoBulkResult(
+            inseridos=self._inseridos,
+            erros=sorted(self._erros, key=lambda e: e.linha),
+        )
@@ -14,8 +14,14 @@ Principais responsabilidades:
 - Retornar dados estruturados via DTOs.
 """
 
-from typing import List, Optional
-
+from datetime import datetime
+from functools import partial
+from typing import Collection, List, Optional, Sequence
+
+from src.core.batch import Batch, make_batch
+from src.core.pagination import Page, PageParams, make_page
+from src.core.unit_of_work import UnitOfWork
+from src.dto.mapper import fieldset_model, to_dto, to_dto_list
 from src.repositories.produto_repository import ProdutoRepository
 from src.repositories.banca_repository import BancaRepository
 
@@ -23,6 +29,8 @@ from src.dto.produto_dto import (
     ProdutoCreate,
     ProdutoUpdate,
     ProdutoRead,
+    ProdutoPrecoBulkUpdate,
+    ProdutoPrecoBulkResult,
 )
 
 
@@ -44,6 +52,7 @@ class ProdutoService:
         """
         self.produto_repo = produto_repo
         self.banca_repo = banca_repo
+        self.uow = UnitOfWork(produto_repo.db)
 
     # ============================================================
     # CREATE
@@ -76,27 +85,22 @@ class ProdutoService:
         if not banca:
             raise ValueError("A banca informada não existe.")
 
-        produto = self.produto_repo.create_produto(
-            banca_id=dto.banca_id,
-            nome=dto.nome,
-            preco=dto.preco,
-            imagem=dto.imagem,
-        )
+        with self.uow:
+            produto = self.produto_repo.create_produto(
+                banca_id=dto.banca_id,
+                nome=dto.nome,
+                preco=dto.preco,
+                imagem=dto.imagem,
+            )
 
-        return ProdutoRead(
-            id=produto.id,
-            nome=produto.nome,
-            preco=produto.preco,
-            imagem=produto.imagem,
-            banca_id=produto.banca_id,
-            created_at=produto.created_at,
-            updated_at=produto.updated_at,
-        )
+        return to_dto(ProdutoRead, produto)
 
     # ============================================================
     # READ
     # ============================================================
-    def get_produto(self, produto_id: int) -> Optional[ProdutoRead]:
+    def get_produto(
+        self, produto_id: int, fields: Optional[Collection[str]] = None
+    ) -> Optional[ProdutoRead]:
         """
         Retorna um produto específico pelo ID.
 
@@ -104,6 +108,8 @@ class ProdutoService:
         ----------
         produto_id : int
             Identificador do produto.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
 
         Retorno
         -------
@@ -111,19 +117,51 @@ class ProdutoService:
             DTO do produto encontrado ou None caso não exista.
         """
 
-        produto = self.produto_repo.get_by_id(produto_id)
+        produto = self.produto_repo.get_by_id(produto_id, fields)
         if not produto:
             return None
 
-        return ProdutoRead(
-            id=produto.id,
-            nome=produto.nome,
-            preco=produto.preco,
-            imagem=produto.imagem,
-            banca_id=produto.banca_id,
-            created_at=produto.created_at,
-            updated_at=produto.updated_at,
-        )
+        return to_dto(fieldset_model(ProdutoRead, fields), produto)
+
+    def get_produtos_by_ids(
+        self, ids: Sequence[int], fields: Optional[Collection[str]] = None
+    ) -> Batch[ProdutoRead]:
+        """
+        Retorna vários produtos pelos IDs, com uma única consulta.
+
+        Parâmetros
+        ----------
+        ids : Sequence[int]
+            Identificadores, na ordem desejada.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+
+        Retorno
+        -------
+        Batch[ProdutoRead]
+            Produtos encontrados na ordem dos ids e ids inexistentes.
+        """
+        rows = self.produto_repo.get_many(ids, fields)
+
+        model = fieldset_model(ProdutoRead, fields)
+        return make_batch(ids, rows, partial(to_dto_list, model))
+
+    def get_updated_at(self, produto_id: int) -> Optional[datetime]:
+        """
+        Retorna o instante da última alteração do produto, usado como
+        validador das requisições condicionais.
+
+        Parâmetros
+        ----------
+        produto_id : int
+            Identificador do produto.
+
+        Retorno
+        -------
+        datetime | None
+            `updated_at` do produto ou None caso não exista.
+        """
+        return self.produto_repo.get_updated_at(produto_id)
 
     # ============================================================
     # LIST
@@ -140,18 +178,7 @@ class ProdutoService:
 
         produtos = self.produto_repo.get_all()
 
-        return [
-            ProdutoRead(
-                id=p.id,
-                nome=p.nome,
-                preco=p.preco,
-                imagem=p.imagem,
-                banca_id=p.banca_id,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-            for p in produtos
-        ]
+        return to_dto_list(ProdutoRead, produtos)
 
     def list_by_banca(self, banca_id: int) -> List[ProdutoRead]:
         """
@@ -170,18 +197,64 @@ class ProdutoService:
 
         produtos = self.produto_repo.get_by_banca(banca_id)
 
-        return [
-            ProdutoRead(
-                id=p.id,
-                nome=p.nome,
-                preco=p.preco,
-                imagem=p.imagem,
-                banca_id=p.banca_id,
-                created_at=p.created_at,
-                updated_at=p.updated_at,
-            )
-            for p in produtos
-        ]
+        return to_dto_list(ProdutoRead, produtos)
+
+    def list_produtos_page(
+        self, params: PageParams, fields: Optional[Collection[str]] = None
+    ) -> Page[ProdutoRead]:
+        """
+        Lista uma página dos produtos cadastrados (paginação por cursor).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, cursor e tamanho da página.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+
+        Retorno
+        -------
+        Page[ProdutoRead]
+            Itens da página, cursor da próxima e, se solicitado, o total.
+        """
+
+        rows = self.produto_repo.get_page(params, fields)
+        total = self.produto_repo.count() if params.include_total else None
+
+        model = fieldset_model(ProdutoRead, fields)
+        return make_page(rows, params, partial(to_dto_list, model), total)
+
+    def list_by_banca_page(
+        self,
+        banca_id: int,
+        params: PageParams,
+        fields: Optional[Collection[str]] = None,
+    ) -> Page[ProdutoRead]:
+        """
+        Lista uma página dos produtos de uma banca (paginação por cursor).
+
+        Parâmetros
+        ----------
+        banca_id : int
+            Identificador da banca.
+        params : PageParams
+            Ordenação, cursor e tamanho da página.
+        fields : Collection[str] | None
+            Campos do DTO a retornar; None retorna todos.
+
+        Retorno
+        -------
+        Page[ProdutoRead]
+            Itens da página, cursor da próxima e, se solicitado, o total.
+        """
+
+        rows = self.produto_repo.get_page_by_banca(banca_id, params, fields)
+        total = (
+            self.produto_repo.count_by_banca(banca_id) if params.include_total else None
+        )
+
+        model = fieldset_model(ProdutoRead, fields)
+        return make_page(rows, params, partial(to_dto_list, model), total)
 
     # ============================================================
     # UPDATE
@@ -218,22 +291,59 @@ class ProdutoService:
             if not self.banca_repo.get_by_id(dto.banca_id):
                 raise ValueError("A banca informada não existe.")
 
-        updated = self.produto_repo.update_produto(
-            produto_id, **dto.dict(exclude_none=True)
-        )
+        with self.uow:
+            updated = self.produto_repo.update_produto(
+                produto_id, **dto.model_dump(exclude_none=True)
+            )
 
         if not updated:
             return None
 
-        return ProdutoRead(
-            id=updated.id,
-            nome=updated.nome,
-            preco=updated.preco,
-            imagem=updated.imagem,
-            banca_id=updated.banca_id,
-            created_at=updated.created_at,
-            updated_at=updated.updated_at,
-        )
+        return to_dto(ProdutoRead, updated)
+
+    def update_precos(
+        self, banca_id: int, dto: ProdutoPrecoBulkUpdate
+    ) -> ProdutoPrecoBulkResult:
+        """
+        Aplica uma lista de preços aos produtos de uma banca.
+
+        Parâmetros
+        ----------
+        banca_id : int
+            Banca dona dos produtos.
+        dto : ProdutoPrecoBulkUpdate
+            Pares (produto, novo preço).
+
+        Regras de Negócio
+        -----------------
+        - Todos os produtos devem pertencer à banca informada.
+        - A lista é aplicada por completo ou não é aplicada: se algum
+          produto não pertencer à banca, nada é alterado.
+        - O lote é gravado com um único comando em uma única transação,
+          gerando uma única invalidação da tabela de produtos.
+
+        Exceções
+        --------
+        ValueError
+            Quando algum produto não existe ou pertence a outra banca.
+
+        Retorno
+        -------
+        ProdutoPrecoBulkResult
+            Quantidade de produtos atualizados.
+        """
+        precos = {item.produto_id: item.preco for item in dto.itens}
+
+        with self.uow:
+            atualizados = self.produto_repo.bulk_update_precos(banca_id, precos)
+            faltantes = set(precos) - set(atualizados)
+            if faltantes:
+                ids = ", ".join(str(i) for i in sorted(faltantes))
+                raise ValueError(
+                    f"Produto(s) não encontrado(s) na banca informada: {ids}."
+                )
+
+        return ProdutoPrecoBulkResult(atualizados=len(atualizados))
 
     # ============================================================
     # DELETE
@@ -252,4 +362,5 @@ class ProdutoService:
         bool
             True se o produto foi removido, False caso não exista.
         """
-        return self.produto_repo.delete_produto(produto_id)
+        with self.uow:
+            return self.produto_repo.delete_produto(produto_id)
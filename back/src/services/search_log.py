@@ -0,0 +1,145 @@
+"""
+## Serviço: SearchLog
+
+Registro assíncrono das pesquisas realizadas.
+
+Cada busca coloca o seu registro (termo, localização e instante da
+requisição) em uma fila em memória; uma thread de fundo retira os
+registros acumulados e os grava com um único `INSERT` em lote por
+transação. Em picos de buscas, dezenas de `commit`s individuais viram
+um só, e a requisição não espera pela escrita.
+
+- A fila é limitada por `APP_SEARCH_LOG_MAX_PENDING`. Cheia, a chamada
+  de `record` aguarda espaço (nenhuma pesquisa é descartada).
+- `flush()` aguarda a gravação de tudo o que já foi enfileirado; é
+  chamado no encerramento da aplicação.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from src.core.config import get_settings
+from src.core.database import SessionLocal
+from src.core.types import utcnow
+from src.core.unit_of_work import UnitOfWork
+from src.repositories.pesquisa_repository import PesquisaRepository
+
+logger = logging.getLogger(__name__)
+
+
+class SearchLog:
+    """
+    Fila de registros de pesquisa gravada em lotes por uma thread de fundo.
+
+    Parâmetros
+    ----------
+    session_factory : Callable[[], Session]
+        Fábrica das sessões usadas pela thread de gravação.
+    batch_size : int
+        Quantidade máxima de registros por `INSERT`.
+    max_pending : int
+        Capacidade da fila.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = 500,
+        max_pending: int = 10_000,
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.written = 0
+        self.failed = 0
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # --------------------------------------------------------
+    # PRODUTOR
+    # --------------------------------------------------------
+    def record(
+        self,
+        termo: str,
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+    ) -> None:
+        """
+        Enfileira o registro de uma pesquisa.
+
+        O instante é o da chamada, não o da gravação.
+        """
+        self._ensure_worker()
+        self._queue.put(
+            {
+                "termo": termo,
+                "latitude": latitude,
+                "longitude": longitude,
+                "created_at": utcnow(),
+            }
+        )
+
+    def pending(self) -> int:
+        """
+        Registros ainda não gravados (na fila ou no lote em gravação).
+        """
+        return self._queue.unfinished_tasks
+
+    def flush(self) -> None:
+        """
+        Aguarda a gravação de todos os registros já enfileirados.
+        """
+        self._queue.join()
+
+    # --------------------------------------------------------
+    # CONSUMIDOR
+    # --------------------------------------------------------
+    def _ensure_worker(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="search-log", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            # Aguarda o primeiro registro e leva junto os que chegaram
+            # enquanto o lote anterior era gravado.
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            with self.session_factory() as db, UnitOfWork(db):
+                PesquisaRepository(db).registrar_lote(batch)
+            self.written += len(batch)
+        except Exception:
+            # Um lote com falha é descartado; a thread segue atendendo a fila.
+            self.failed += len(batch)
+            logger.exception("Falha ao gravar %d registros de pesquisa", len(batch))
+
+
+_settings = get_settings()
+search_log = SearchLog(
+    SessionLocal,
+    batch_size=_settings.search_log_batch_size,
+    max_pending=_settings.search_log_max_pending,
+)
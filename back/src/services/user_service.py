@@ -9,7 +9,11 @@ e-mail duplicado) e retornando objetos DTO padronizados para consumo pela camada
 de apresentação.
 """
 
-from typing import List, Optional, Literal, cast
+from functools import partial
+from typing import List, Optional
+from src.core.pagination import Page, PageParams, make_page
+from src.core.unit_of_work import UnitOfWork
+from src.dto.mapper import to_dto, to_dto_list
 from src.repositories.user_repository import UserRepository
 from src.dto.user_dto import (
     UserCreateDTO,
@@ -18,23 +22,6 @@ from src.dto.user_dto import (
 )
 
 
-def _to_iso(value):
-    """
-    Converte valores retornados pelo ORM para o formato ISO 8601.
-
-    Parâmetros
-    ----------
-    value : datetime | str
-        Data retornada pelo repositório.
-
-    Retorno
-    -------
-    str
-        Representação ISO 8601 da data.
-    """
-    return value if isinstance(value, str) else value.isoformat()
-
-
 class UserService:
     """
     Serviço responsável pelo gerenciamento básico de usuários.
@@ -57,6 +44,7 @@ class UserService:
             Instância de repositório responsável pela persistência da entidade User.
         """
         self.repository = repository
+        self.uow = UnitOfWork(repository.db)
 
     # ---------------------------------------------------------
     # CREATE
@@ -88,21 +76,15 @@ class UserService:
         if existing:
             raise ValueError("E-mail já cadastrado.")
 
-        user = self.repository.create_user(
-            name=dto.name,
-            email=dto.email,
-            password=dto.password,
-            type=dto.type,
-        )
-
-        return UserResponseDTO(
-            id=str(user.id),
-            name=str(user.name),
-            email=str(user.email),
-            type=cast(Literal["user", "admin", "supplier"], str(user.type)),
-            created_at=_to_iso(user.created_at),
-            updated_at=_to_iso(user.updated_at),
-        )
+        with self.uow:
+            user = self.repository.create_user(
+                name=dto.name,
+                email=dto.email,
+                password=dto.password,
+                type=dto.type,
+            )
+
+        return to_dto(UserResponseDTO, user)
 
     # ---------------------------------------------------------
     # READ
@@ -126,14 +108,7 @@ class UserService:
         if not user:
             return None
 
-        return UserResponseDTO(
-            id=str(user.id),
-            name=str(user.name),
-            email=str(user.email),
-            type=cast(Literal["user", "admin", "supplier"], str(user.type)),
-            created_at=_to_iso(user.created_at),
-            updated_at=_to_iso(user.updated_at),
-        )
+        return to_dto(UserResponseDTO, user)
 
     # ---------------------------------------------------------
     # LIST
@@ -150,17 +125,27 @@ class UserService:
 
         users = self.repository.get_all()
 
-        return [
-            UserResponseDTO(
-                id=str(u.id),
-                name=str(u.name),
-                email=str(u.email),
-                type=cast(Literal["user", "admin", "supplier"], str(u.type)),
-                created_at=_to_iso(u.created_at),
-                updated_at=_to_iso(u.updated_at),
-            )
-            for u in users
-        ]
+        return to_dto_list(UserResponseDTO, users)
+
+    def list_users_page(self, params: PageParams) -> Page[UserResponseDTO]:
+        """
+        Lista uma página dos usuários cadastrados (paginação por cursor).
+
+        Parâmetros
+        ----------
+        params : PageParams
+            Ordenação, cursor e tamanho da página.
+
+        Retorno
+        -------
+        Page[UserResponseDTO]
+            Itens da página, cursor da próxima e, se solicitado, o total.
+        """
+
+        rows = self.repository.get_page(params)
+        total = self.repository.count() if params.include_total else None
+
+        return make_page(rows, params, partial(to_dto_list, UserResponseDTO), total)
 
     # ---------------------------------------------------------
     # UPDATE
@@ -184,34 +169,24 @@ class UserService:
             DTO atualizado ou None se o usuário não existir.
         """
 
-        user = self.repository.get_by_id(user_id)
-        if not user:
-            return None
-
-        updated = self.repository.update_user(
-            user_id=user_id,
-            name=dto.name,
-            email=dto.email,
-            password=dto.password,
-            type=dto.type,
-        )
+        with self.uow:
+            updated = self.repository.update_user(
+                user_id=user_id,
+                name=dto.name,
+                email=dto.email,
+                password=dto.password,
+                type=dto.type,
+            )
 
         if updated is None:
             return None
 
-        return UserResponseDTO(
-            id=str(updated.id),
-            name=str(updated.name),
-            email=str(updated.email),
-            type=cast(Literal["user", "admin", "supplier"], str(updated.type)),
-            created_at=_to_iso(updated.created_at),
-            updated_at=_to_iso(updated.updated_at),
-        )
+        return to_dto(UserResponseDTO, updated)
 
     # ---------------------------------------------------------
     # DELETE
     # ---------------------------------------------------------
-    def delete_user(self, user_id: str) -> None:
+    def delete_user(self, user_id: str) -> bool:
         """
         Remove um usuário do sistema.
 
@@ -222,7 +197,8 @@ class UserService:
 
         Retorno
         -------
-        None
-            A operação não retorna valor.
+        bool
+            True se o usuário foi removido, False caso não exista.
         """
-        self.repository.delete_user(user_id)
+        with self.uow:
+            return self.repository.delete_user(user_id)
@@ -1,7 +1,14 @@
 import pytest
+from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from src.core.database import Base
+from sqlalchemy.pool import StaticPool
+from src.core.database import (
+    Base,
+    enable_sqlite_foreign_keys,
+    get_db,
+    instrument_engine,
+)
 
 
 @pytest.fixture
@@ -14,10 +21,12 @@ def test_db():
     - Mantém o padrão de sessão utilizado no repositório.
     """
 
-    engine = create_engine(
-        "sqlite:///:memory:", connect_args={"check_same_thread": False}
+    engine = enable_sqlite_foreign_keys(
+        create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    )
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     Base.metadata.create_all(bind=engine)
 
@@ -27,3 +36,53 @@ def test_db():
         yield db
     finally:
         db.close()
+
+
+@pytest.fixture
+def api_client():
+    """
+    Cliente HTTP da aplicação apontando para um banco em memória.
+
+    - A dependência `get_db` é substituída por sessões de um engine
+      isolado (uma única conexão compartilhada entre as threads).
+    - A sessão de apoio (`api_client.db`) permite preparar dados.
+    - A fila de registros de pesquisa grava no mesmo banco e é esvaziada
+      ao final do teste.
+    """
+    from src.api.response_cache import response_cache
+    from src.main import app
+    from src.services.search_log import search_log
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    instrument_engine(enable_sqlite_foreign_keys(engine))
+    TestingSessionLocal = sessionmaker(
+        autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    )
+    Base.metadata.create_all(bind=engine)
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    session_factory = search_log.session_factory
+    search_log.session_factory = TestingSessionLocal
+    # Cada teste parte de um banco novo, com versões de tabela reiniciadas.
+    response_cache.clear()
+    client = TestClient(app)
+    client.db = TestingSessionLocal()  # type: ignore[attr-defined]
+
+    try:
+        yield client
+    finally:
+        search_log.flush()
+        search_log.session_factory = session_factory
+        client.db.close()  # type: ignore[attr-defined]
+        app.dependency_overrides.pop(get_db, None)
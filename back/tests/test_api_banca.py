@@ -0,0 +1,84 @@
+"""
+Testes da validação de identificadores e referências nas escritas de
+bancas e nas rotas de usuários.
+"""
+
+import uuid
+
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.user_repository import UserRepository
+
+ENDERECO = {"street": "Rua A", "city": "C", "state": "UF", "zip_code": "000"}
+
+
+def _criar_banca(db):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca"
+    )
+    db.commit()
+    return supplier, banca
+
+
+def test_criar_banca_com_supplier_id_invalido_responde_422(api_client):
+    resp = api_client.post(
+        "/bancas/", json={"nome": "B", "supplier_id": "nope", "address": ENDERECO}
+    )
+
+    assert resp.status_code == 422
+
+
+def test_atualizar_banca_com_ids_invalidos_responde_422(api_client):
+    _, banca = _criar_banca(api_client.db)
+
+    for campo in ("supplier_id", "address_id"):
+        resp = api_client.patch(f"/bancas/{banca.id}", json={campo: "nope"})
+        assert resp.status_code == 422
+
+
+def test_criar_banca_com_supplier_valido(api_client):
+    supplier, _ = _criar_banca(api_client.db)
+
+    resp = api_client.post(
+        "/bancas/",
+        json={"nome": "Nova", "supplier_id": supplier.id, "address": ENDERECO},
+    )
+
+    assert resp.status_code == 201
+    assert resp.json()["supplier_id"] == supplier.id
+
+
+def test_rota_de_usuario_com_id_invalido_responde_422(api_client):
+    assert api_client.get("/users/nope").status_code == 422
+    assert api_client.delete("/users/nope").status_code == 422
+
+
+def test_criar_banca_com_fornecedor_inexistente_responde_400(api_client):
+    resp = api_client.post(
+        "/bancas/",
+        json={"nome": "B", "supplier_id": str(uuid.uuid4()), "address": ENDERECO},
+    )
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Fornecedor não encontrado."
+    # Nenhum endereço órfão é criado.
+    assert AddressRepository(api_client.db).get_all() == []
+
+
+def test_atualizar_banca_com_referencias_inexistentes_responde_400(api_client):
+    supplier, banca = _criar_banca(api_client.db)
+
+    for campo, mensagem in (
+        ("supplier_id", "Fornecedor não encontrado."),
+        ("address_id", "Endereço não encontrado."),
+    ):
+        resp = api_client.patch(f"/bancas/{banca.id}", json={campo: str(uuid.uuid4())})
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == mensagem
+
+    resp = api_client.get(f"/bancas/{banca.id}")
+    assert resp.json()["supplier_id"] == supplier.id
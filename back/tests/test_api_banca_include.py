@@ -0,0 +1,132 @@
+"""
+Testes da incorporação de relacionamentos (`include=`) nas leituras de
+bancas.
+"""
+
+from sqlalchemy import event
+
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_bancas(db, quantidade=3, produtos_por_banca=2, email="f@test.com"):
+    supplier = UserRepository(db).create_user("F", email, "1", "supplier")
+    address_repo = AddressRepository(db)
+    banca_repo = BancaRepository(db)
+    produto_repo = ProdutoRepository(db)
+    ids = []
+    for i in range(quantidade):
+        address = address_repo.create_address(
+            street=f"Rua {i}", city="C", state="UF", zip_code="000"
+        )
+        banca = banca_repo.create_banca(
+            supplier_id=supplier.id, address_id=address.id, nome=f"B{i}"
+        )
+        for j in range(produtos_por_banca):
+            produto_repo.create_produto(banca_id=banca.id, nome=f"P{i}{j}", preco=1.0)
+        ids.append(banca.id)
+    db.commit()
+    return supplier, ids
+
+
+def _contar_consultas(api_client):
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and "table_versions" not in statement:
+            comandos.append(statement)
+
+    engine = api_client.db.get_bind()
+    event.listen(engine, "before_cursor_execute", registrar)
+    return comandos, lambda: event.remove(engine, "before_cursor_execute", registrar)
+
+
+def test_banca_com_todos_os_relacionamentos(api_client):
+    supplier, ids = _criar_bancas(api_client.db, quantidade=1)
+
+    resp = api_client.get(
+        f"/bancas/{ids[0]}", params={"include": "address,produtos,supplier"}
+    )
+
+    corpo = resp.json()
+    assert resp.status_code == 200
+    assert corpo["address"]["street"] == "Rua 0"
+    assert [p["nome"] for p in corpo["produtos"]] == ["P00", "P01"]
+    assert corpo["supplier"]["id"] == supplier.id
+    assert "password" not in corpo["supplier"]
+
+
+def test_sem_include_mantem_a_forma_original(api_client):
+    _, ids = _criar_bancas(api_client.db, quantidade=1)
+
+    corpo = api_client.get(f"/bancas/{ids[0]}").json()
+
+    assert not {"address", "produtos", "supplier"} & corpo.keys()
+
+
+def test_listagem_com_numero_fixo_de_consultas(api_client):
+    _criar_bancas(api_client.db, quantidade=2)
+    params = {"include": "address,produtos,supplier"}
+
+    comandos, parar = _contar_consultas(api_client)
+    try:
+        pequena = api_client.get("/bancas/", params=params)
+        consultas_pequena = len(comandos)
+
+        _criar_bancas(api_client.db, quantidade=8, email="g@test.com")
+        comandos.clear()
+        grande = api_client.get("/bancas/", params=params)
+        consultas_grande = len(comandos)
+    finally:
+        parar()
+
+    assert len(pequena.json()) == 2
+    assert len(grande.json()) == 10
+    assert all(len(b["produtos"]) == 2 for b in grande.json())
+    # Uma consulta para as bancas e uma por relacionamento.
+    assert consultas_pequena == consultas_grande == 4
+
+
+def test_include_com_fields_e_ids(api_client):
+    _, ids = _criar_bancas(api_client.db)
+
+    resp = api_client.get(
+        "/bancas/",
+        params={"ids": f"{ids[2]},{ids[0]}", "fields": "nome", "include": "address"},
+    )
+
+    assert [b["nome"] for b in resp.json()] == ["B2", "B0"]
+    assert [b["address"]["street"] for b in resp.json()] == ["Rua 2", "Rua 0"]
+    assert all(b.keys() == {"nome", "address"} for b in resp.json())
+
+
+def test_etag_muda_com_alteracao_no_relacionamento(api_client):
+    _, ids = _criar_bancas(api_client.db, quantidade=1)
+    url = f"/bancas/{ids[0]}"
+
+    simples = api_client.get(url).headers["ETag"]
+    incluido = api_client.get(url, params={"include": "produtos"}).headers["ETag"]
+    ProdutoRepository(api_client.db).create_produto(
+        banca_id=ids[0], nome="Novo", preco=2.0
+    )
+    api_client.db.commit()
+
+    revalidado = api_client.get(
+        url, params={"include": "produtos"}, headers={"If-None-Match": incluido}
+    )
+    sem_include = api_client.get(url, headers={"If-None-Match": simples})
+
+    assert revalidado.status_code == 200
+    assert len(revalidado.json()["produtos"]) == 3
+    assert sem_include.status_code == 304
+
+
+def test_include_invalido_retorna_400(api_client):
+    _, ids = _criar_bancas(api_client.db, quantidade=1)
+
+    assert api_client.get("/bancas/", params={"include": "dono"}).status_code == 400
+    assert (
+        api_client.get(f"/bancas/{ids[0]}", params={"include": "x"}).status_code == 400
+    )
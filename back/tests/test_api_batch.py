@@ -0,0 +1,92 @@
+"""
+Testes da leitura em lote por ids (`/produtos?ids=`, `/bancas?ids=`).
+"""
+
+from sqlalchemy import event
+
+from src.core.batch import MAX_BATCH_IDS
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_catalogo(db, quantidade=5):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca_repo = BancaRepository(db)
+    bancas = [
+        banca_repo.create_banca(
+            supplier_id=supplier.id, address_id=address.id, nome=f"B{i}"
+        ).id
+        for i in range(2)
+    ]
+    repo = ProdutoRepository(db)
+    produtos = [
+        repo.create_produto(banca_id=bancas[0], nome=f"P{i}", preco=1.0).id
+        for i in range(quantidade)
+    ]
+    db.commit()
+    return bancas, produtos
+
+
+def _contar_selects(api_client, tabela):
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and f"FROM {tabela}" in statement:
+            comandos.append(statement)
+
+    engine = api_client.db.get_bind()
+    event.listen(engine, "before_cursor_execute", registrar)
+    return comandos, lambda: event.remove(engine, "before_cursor_execute", registrar)
+
+
+def test_produtos_na_ordem_pedida_com_uma_consulta(api_client):
+    _, ids = _criar_catalogo(api_client.db)
+    pedidos = [ids[3], ids[0], ids[4]]
+    comandos, parar = _contar_selects(api_client, "produtos")
+
+    try:
+        resp = api_client.get("/produtos/", params={"ids": ",".join(map(str, pedidos))})
+    finally:
+        parar()
+
+    assert resp.status_code == 200
+    assert [p["id"] for p in resp.json()] == pedidos
+    assert "X-Missing-Ids" not in resp.headers
+    assert "X-Next-Cursor" not in resp.headers
+    assert len(comandos) == 1
+    assert " IN (" in comandos[0]
+
+
+def test_ids_inexistentes_informados_no_cabecalho(api_client):
+    _, ids = _criar_catalogo(api_client.db)
+
+    resp = api_client.get("/produtos/", params={"ids": f"999,{ids[1]},998,{ids[1]}"})
+
+    assert [p["id"] for p in resp.json()] == [ids[1]]
+    assert resp.headers["X-Missing-Ids"] == "999,998"
+
+
+def test_bancas_por_ids_com_fields(api_client):
+    bancas, _ = _criar_catalogo(api_client.db)
+
+    resp = api_client.get(
+        "/bancas/", params={"ids": f"{bancas[1]},{bancas[0]}", "fields": "id,nome"}
+    )
+
+    assert resp.json() == [
+        {"id": bancas[1], "nome": "B1"},
+        {"id": bancas[0], "nome": "B0"},
+    ]
+
+
+def test_ids_invalidos_retornam_400(api_client):
+    excesso = ",".join(str(i) for i in range(MAX_BATCH_IDS + 1))
+
+    assert api_client.get("/produtos/", params={"ids": "1,a"}).status_code == 400
+    assert api_client.get("/produtos/", params={"ids": ","}).status_code == 400
+    assert api_client.get("/bancas/", params={"ids": excesso}).status_code == 400
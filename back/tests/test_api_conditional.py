@@ -0,0 +1,123 @@
+"""
+Testes das requisições condicionais (`ETag` / `Last-Modified`).
+"""
+
+from sqlalchemy import event
+
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_dados(db):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Minha"
+    )
+    produto = ProdutoRepository(db).create_produto(
+        banca_id=banca.id, nome="Tomate", preco=5.0
+    )
+    db.commit()
+    return banca.id, produto.id
+
+
+def _capturar_selects(engine):
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    return comandos, lambda: event.remove(engine, "before_cursor_execute", registrar)
+
+
+def test_lista_responde_304_sem_consultar_as_linhas(api_client):
+    _criar_dados(api_client.db)
+    primeira = api_client.get("/produtos/")
+    etag = primeira.headers["ETag"]
+
+    comandos, parar = _capturar_selects(api_client.db.get_bind())
+    try:
+        segunda = api_client.get("/produtos/", headers={"If-None-Match": etag})
+    finally:
+        parar()
+
+    assert primeira.status_code == 200
+    assert primeira.headers["Cache-Control"] == "no-cache"
+    assert "Last-Modified" in primeira.headers
+    assert segunda.status_code == 304
+    assert segunda.content == b""
+    assert segunda.headers["ETag"] == etag
+    assert not any("FROM produtos" in c for c in comandos)
+
+
+def test_escrita_na_tabela_muda_o_etag_da_lista(api_client):
+    banca_id, _ = _criar_dados(api_client.db)
+    etag = api_client.get(f"/produtos/banca/{banca_id}").headers["ETag"]
+
+    api_client.post(
+        "/produtos/", json={"banca_id": banca_id, "nome": "Alface", "preco": 2.0}
+    )
+    resp = api_client.get(
+        f"/produtos/banca/{banca_id}", headers={"If-None-Match": etag}
+    )
+
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+    assert [p["nome"] for p in resp.json()] == ["Tomate", "Alface"]
+
+
+def test_parametros_diferentes_geram_etags_diferentes(api_client):
+    _criar_dados(api_client.db)
+
+    completo = api_client.get("/bancas/").headers["ETag"]
+    parcial = api_client.get("/bancas/", params={"fields": "id,nome"}).headers["ETag"]
+
+    assert completo != parcial
+
+
+def test_item_responde_304_para_if_modified_since(api_client):
+    _, produto_id = _criar_dados(api_client.db)
+    primeira = api_client.get(f"/produtos/{produto_id}")
+
+    segunda = api_client.get(
+        f"/produtos/{produto_id}",
+        headers={"If-Modified-Since": primeira.headers["Last-Modified"]},
+    )
+
+    assert segunda.status_code == 304
+
+
+def test_item_alterado_responde_200(api_client):
+    _, produto_id = _criar_dados(api_client.db)
+    etag = api_client.get(f"/produtos/{produto_id}").headers["ETag"]
+
+    api_client.patch(f"/produtos/{produto_id}", json={"preco": 6.0})
+    resp = api_client.get(f"/produtos/{produto_id}", headers={"If-None-Match": etag})
+
+    assert resp.status_code == 200
+    assert resp.json()["preco"] == 6.0
+
+
+def test_if_none_match_tem_precedencia_sobre_if_modified_since(api_client):
+    banca_id, _ = _criar_dados(api_client.db)
+    primeira = api_client.get(f"/bancas/{banca_id}")
+
+    resp = api_client.get(
+        f"/bancas/{banca_id}",
+        headers={
+            "If-None-Match": 'W/"outro"',
+            "If-Modified-Since": primeira.headers["Last-Modified"],
+        },
+    )
+
+    assert resp.status_code == 200
+
+
+def test_item_inexistente_retorna_404(api_client):
+    assert api_client.get("/bancas/999").status_code == 404
+    assert api_client.get("/produtos/999").status_code == 404
@@ -0,0 +1,92 @@
+"""
+Testes da instrumentação SQL exposta pela API (cabeçalhos e depuração).
+"""
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from src.core.config import get_settings
+from src.core.database import engine
+from src.core.middleware import QueryStatsMiddleware
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.user_repository import UserRepository
+from src.services.produto_import_service import ProdutoImportService
+
+
+def test_resposta_informa_consultas_e_tempo_de_banco(api_client):
+    response = api_client.get("/produtos/")
+
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Queries"]) >= 1
+    assert float(response.headers["X-DB-Time-ms"]) >= 0
+
+
+def test_resposta_sem_banco_informa_zero_consultas(api_client):
+    response = api_client.get("/health")
+
+    assert response.headers["X-DB-Queries"] == "0"
+
+
+def test_endpoint_de_depuracao_desabilitado_por_padrao(api_client):
+    assert api_client.get("/debug/queries").status_code == 404
+
+
+def test_endpoint_de_depuracao_lista_n_mais_um(api_client, monkeypatch, caplog):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "sql_debug", True)
+    monkeypatch.setattr(settings, "n_plus_one_threshold", 3)
+
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware)
+
+    @app.get("/itens")
+    def itens():
+        with engine.connect() as conn:
+            return [
+                conn.execute(text("SELECT :i"), {"i": i}).scalar() for i in range(3)
+            ]
+
+    with caplog.at_level(logging.WARNING, logger="src.core.middleware"):
+        response = TestClient(app).get("/itens")
+
+    assert response.headers["X-DB-Queries"] == "3"
+    assert "Possível N+1 em GET /itens: 3 execuções de SELECT ?" in caplog.text
+
+    reports = api_client.get("/debug/queries").json()
+    ultimo = next(r for r in reports if r["path"] == "/itens")
+    assert ultimo["n_plus_one"] == {"SELECT ?": 3}
+
+
+def test_importacao_em_blocos_nao_e_reportada_como_n_mais_um(
+    api_client, monkeypatch, caplog
+):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "n_plus_one_threshold", 3)
+    monkeypatch.setattr(ProdutoImportService, "chunk_size", 2)
+
+    db = api_client.db
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca"
+    )
+    db.commit()
+
+    corpo = "\n".join(
+        f'{{"banca_id": {banca.id}, "nome": "P{i}", "preco": 1}}' for i in range(8)
+    )
+    with caplog.at_level(logging.WARNING, logger="src.core.middleware"):
+        response = api_client.post(
+            "/produtos/bulk",
+            content=corpo.encode(),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+    assert response.json()["inseridos"] == 8
+    assert "Possível N+1" not in caplog.text
@@ -0,0 +1,104 @@
+"""
+Testes do parâmetro `fields=` (campos esparsos) nas leituras.
+"""
+
+from sqlalchemy import event
+
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_dados(db):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id,
+        address_id=address.id,
+        nome="Banca do Tomate",
+        descricao="Hortifruti",
+    )
+    produto = ProdutoRepository(db).create_produto(
+        banca_id=banca.id, nome="Tomate", preco=5.0, imagem="tomate.png"
+    )
+    db.commit()
+    return banca.id, produto.id
+
+
+def _capturar_selects(engine, tabela):
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        if statement.startswith("SELECT") and f"FROM {tabela}" in statement:
+            comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    return comandos, lambda: event.remove(engine, "before_cursor_execute", registrar)
+
+
+def test_lista_produtos_le_e_serializa_somente_campos_pedidos(api_client):
+    _criar_dados(api_client.db)
+    comandos, parar = _capturar_selects(api_client.db.get_bind(), "produtos")
+
+    try:
+        resp = api_client.get("/produtos/", params={"fields": "id,nome,preco"})
+    finally:
+        parar()
+
+    assert resp.status_code == 200
+    assert resp.json() == [{"id": 1, "nome": "Tomate", "preco": 5.0}]
+    assert len(comandos) == 1
+    assert "imagem" not in comandos[0]
+    assert "created_at" not in comandos[0]
+
+
+def test_obter_produto_e_banca_com_fields(api_client):
+    banca_id, produto_id = _criar_dados(api_client.db)
+
+    produto = api_client.get(f"/produtos/{produto_id}", params={"fields": "nome"})
+    banca = api_client.get(f"/bancas/{banca_id}", params={"fields": "id,nome"})
+
+    assert produto.json() == {"nome": "Tomate"}
+    assert banca.json() == {"id": banca_id, "nome": "Banca do Tomate"}
+
+
+def test_paginacao_por_updated_at_com_fields(api_client):
+    banca_id, _ = _criar_dados(api_client.db)
+    ProdutoRepository(api_client.db).create_produto(
+        banca_id=banca_id, nome="Alface", preco=2.0
+    )
+    api_client.db.commit()
+
+    params = {"fields": "nome", "limit": 1, "order_by": "updated_at"}
+    primeira = api_client.get(f"/produtos/banca/{banca_id}", params=params)
+    segunda = api_client.get(
+        f"/produtos/banca/{banca_id}",
+        params={**params, "cursor": primeira.headers["X-Next-Cursor"]},
+    )
+
+    assert primeira.json() == [{"nome": "Tomate"}]
+    assert segunda.json() == [{"nome": "Alface"}]
+
+
+def test_pesquisa_aplica_fields_em_cada_lista(api_client):
+    _criar_dados(api_client.db)
+
+    resp = api_client.get(
+        "/pesquisa/",
+        params={"termo": "tomate", "tipo": "all", "fields": "id,nome,preco"},
+    )
+
+    corpo = resp.json()
+    assert resp.status_code == 200
+    assert corpo["produtos"] == [{"id": 1, "nome": "Tomate", "preco": 5.0}]
+    assert corpo["bancas"] == [{"id": 1, "nome": "Banca do Tomate"}]
+
+
+def test_campo_desconhecido_retorna_400(api_client):
+    resp = api_client.get("/produtos/", params={"fields": "id,senha"})
+
+    assert resp.status_code == 400
+    assert "senha" in resp.json()["detail"]
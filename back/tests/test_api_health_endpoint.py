@@ -1,4 +1,11 @@
+import time
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.exc import OperationalError
+
+from src.core import health
+from src.core.config import get_settings
 from src.main import app
 
 client = TestClient(app)
@@ -19,3 +26,67 @@ def test_health_endpoint():
     assert data["status"] == "ok"
     assert "timestamp" in data
     assert "version" in data
+
+
+def _falha(engine):
+    raise OperationalError("SELECT 1", {}, Exception("banco indisponível"))
+
+
+@pytest.fixture
+def prontidao(api_client):
+    """
+    Cliente da API com a contagem de sobrecarga reiniciada.
+    """
+    health.overload.reset()
+    yield api_client
+    health.overload.reset()
+
+
+def test_liveness_nao_consulta_o_banco(prontidao, monkeypatch):
+    monkeypatch.setattr(health, "_ping", _falha)
+
+    response = prontidao.get("/health/live")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+
+def test_readiness_pronto(prontidao):
+    response = prontidao.get("/health/ready")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert set(data["checks"]) == {"database", "pool", "search_log", "event_loop"}
+    assert all(check["ok"] for check in data["checks"].values())
+
+
+def test_readiness_sem_banco_responde_503(prontidao, monkeypatch):
+    monkeypatch.setattr(health, "_ping", _falha)
+
+    response = prontidao.get("/health/ready")
+
+    assert response.status_code == 503
+    data = response.json()
+    assert data["status"] == "unready"
+    assert data["checks"]["database"] == {"ok": False, "error": "OperationalError"}
+
+
+def test_readiness_so_sai_de_circulacao_com_sobrecarga_sustentada(
+    prontidao, monkeypatch
+):
+    from src.services.search_log import search_log
+
+    monkeypatch.setattr(search_log, "pending", lambda: search_log.max_pending)
+    monkeypatch.setattr(get_settings(), "readiness_overload_seconds", 0.05)
+
+    primeira = prontidao.get("/health/ready")
+    assert primeira.status_code == 200
+    assert primeira.json()["status"] == "degraded"
+    assert not primeira.json()["checks"]["search_log"]["ok"]
+
+    time.sleep(0.06)
+    assert prontidao.get("/health/ready").status_code == 503
+
+    monkeypatch.undo()
+    assert prontidao.get("/health/ready").json()["status"] == "ready"
@@ -0,0 +1,222 @@
+"""
+Testes da paginação por cursor nas listagens (`/produtos`, `/bancas`,
+`/users`).
+"""
+
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import event, update
+
+from src.core.pagination import encode_cursor
+from src.models.produto_model import Produto
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_produtos(db, quantidade=5):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca_repo = BancaRepository(db)
+    banca = banca_repo.create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Minha"
+    )
+    outra = banca_repo.create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Outra"
+    )
+    repo = ProdutoRepository(db)
+    ids = [
+        repo.create_produto(banca_id=banca.id, nome=f"P{i}", preco=1.0).id
+        for i in range(quantidade)
+    ]
+    repo.create_produto(banca_id=outra.id, nome="X", preco=1.0)
+    db.commit()
+    return banca.id, ids
+
+
+def _percorrer(client, url, **params):
+    """
+    Segue os cursores até a última página, retornando ids e respostas.
+    """
+    ids, respostas = [], []
+    params = dict(params)
+    while True:
+        resp = client.get(url, params=params)
+        assert resp.status_code == 200
+        respostas.append(resp)
+        ids.extend(item["id"] for item in resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return ids, respostas
+        params["cursor"] = cursor
+
+
+def test_percorre_produtos_por_id(api_client):
+    _, ids = _criar_produtos(api_client.db)
+
+    vistos, respostas = _percorrer(api_client, "/produtos/", limit=2)
+
+    assert len(respostas) == 3
+    assert vistos == sorted(vistos)
+    assert len(vistos) == len(set(vistos)) == len(ids) + 1
+    assert 'rel="next"' in respostas[0].headers["Link"]
+    assert "Link" not in respostas[-1].headers
+
+
+def test_total_somente_quando_solicitado(api_client):
+    _criar_produtos(api_client.db)
+
+    sem_total = api_client.get("/produtos/", params={"limit": 2})
+    com_total = api_client.get(
+        "/produtos/", params={"limit": 2, "include_total": "true"}
+    )
+
+    assert "X-Total-Count" not in sem_total.headers
+    assert com_total.headers["X-Total-Count"] == "6"
+
+
+def test_insercao_entre_paginas_nao_repete_itens(api_client):
+    banca_id, _ = _criar_produtos(api_client.db)
+
+    primeira = api_client.get("/produtos/", params={"limit": 3})
+    ProdutoRepository(api_client.db).create_produto(
+        banca_id=banca_id, nome="Novo", preco=2.0
+    )
+    api_client.db.commit()
+
+    vistos, _ = _percorrer(
+        api_client,
+        "/produtos/",
+        limit=3,
+        cursor=primeira.headers["X-Next-Cursor"],
+    )
+
+    ids_primeira = [p["id"] for p in primeira.json()]
+    assert not set(ids_primeira) & set(vistos)
+    assert len(ids_primeira) + len(vistos) == 7
+
+
+def test_ordena_por_updated_at_com_desempate_por_id(api_client):
+    banca_id, ids = _criar_produtos(api_client.db)
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Dois produtos com o mesmo instante; o mais antigo é o último criado.
+    instantes = [base + timedelta(minutes=m) for m in (3, 1, 1, 4, 0)]
+    for produto_id, instante in zip(ids, instantes):
+        api_client.db.execute(
+            update(Produto).where(Produto.id == produto_id).values(updated_at=instante)
+        )
+    api_client.db.commit()
+
+    vistos, _ = _percorrer(
+        api_client, f"/produtos/banca/{banca_id}", limit=2, order_by="updated_at"
+    )
+
+    assert vistos == [ids[4], ids[1], ids[2], ids[0], ids[3]]
+
+
+def test_pagina_continua_pela_chave_sem_offset(api_client):
+    _criar_produtos(api_client.db)
+    comandos = []
+
+    def registrar(conn, cursor, statement, parameters, *args):
+        if "FROM produtos" in statement:
+            comandos.append((statement, parameters))
+
+    engine = api_client.db.get_bind()
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        primeira = api_client.get("/produtos/", params={"limit": 2})
+        api_client.get(
+            "/produtos/",
+            params={"limit": 2, "cursor": primeira.headers["X-Next-Cursor"]},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    # O dialeto do SQLite sempre emite `LIMIT ? OFFSET ?`; o deslocamento
+    # permanece 0 e a continuação vem da condição sobre a chave.
+    assert len(comandos) == 2
+    assert [params[-2:] for _, params in comandos] == [(3, 0), (3, 0)]
+    assert "produtos.id > ?" in comandos[1][0]
+
+
+def test_percorre_bancas_e_usuarios(api_client):
+    _criar_produtos(api_client.db)
+    users = UserRepository(api_client.db)
+    for i in range(4):
+        users.create_user(f"U{i}", f"u{i}@test.com", "1")
+    api_client.db.commit()
+
+    bancas, _ = _percorrer(api_client, "/bancas/", limit=1)
+    usuarios, _ = _percorrer(api_client, "/users/", limit=2, order_by="updated_at")
+
+    assert len(bancas) == len(set(bancas)) == 2
+    assert len(usuarios) == len(set(usuarios)) == 5
+
+
+def test_cursor_invalido_retorna_400(api_client):
+    cursor_de_outra_ordem = encode_cursor("id", [1])
+
+    malformado = api_client.get("/produtos/", params={"cursor": "@@@"})
+    outra_ordem = api_client.get(
+        "/produtos/",
+        params={"cursor": cursor_de_outra_ordem, "order_by": "updated_at"},
+    )
+
+    assert malformado.status_code == 400
+    assert outra_ordem.status_code == 400
+
+
+def _cursor(*valores) -> str:
+    """
+    Cursor montado à mão, como faria um cliente alterando o recebido.
+    """
+    return base64.urlsafe_b64encode(json.dumps(list(valores)).encode()).decode()
+
+
+def test_cursor_com_valores_de_outro_tipo_retorna_400(api_client):
+    _criar_produtos(api_client.db)
+
+    casos = [
+        ("/users/", {}, _cursor("id", "zzz")),
+        ("/users/", {}, _cursor("id", 5)),
+        ("/users/", {"order_by": "updated_at"}, _cursor("updated_at", "2020-01-01", 5)),
+        ("/produtos/", {}, _cursor("id", {"a": 1})),
+        ("/produtos/", {}, _cursor("id", [1, 2])),
+        ("/produtos/", {}, _cursor("id", True)),
+        ("/produtos/", {}, _cursor("id", 2**70)),
+        ("/produtos/", {}, _cursor("id", "1")),
+        (
+            "/bancas/",
+            {"order_by": "updated_at"},
+            _cursor("updated_at", "2020-01-01", {"x": 1}),
+        ),
+    ]
+    for url, params, cursor in casos:
+        resp = api_client.get(url, params={**params, "cursor": cursor})
+        assert resp.status_code == 400, (url, cursor)
+
+
+def test_cursor_de_usuarios_aceita_uuid(api_client):
+    users = UserRepository(api_client.db)
+    for i in range(3):
+        users.create_user(f"U{i}", f"u{i}@test.com", "1")
+    api_client.db.commit()
+
+    primeira = api_client.get("/users/", params={"limit": 1})
+    segunda = api_client.get(
+        "/users/", params={"limit": 1, "cursor": primeira.headers["X-Next-Cursor"]}
+    )
+
+    assert segunda.status_code == 200
+    assert segunda.json()[0]["id"] > primeira.json()[0]["id"]
+
+
+def test_limit_fora_do_intervalo_retorna_422(api_client):
+    assert api_client.get("/produtos/", params={"limit": 0}).status_code == 422
+    assert api_client.get("/produtos/", params={"limit": 100000}).status_code == 422
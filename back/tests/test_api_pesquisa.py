@@ -0,0 +1,96 @@
+"""
+Testes da coalescência de buscas idênticas simultâneas em `/pesquisa`.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select
+
+from src.models.pesquisa import Pesquisa
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+from src.services import pesquisa_service
+from src.services.pesquisa_service import PesquisaService
+from src.services.search_log import search_log
+
+
+def _criar_catalogo(db):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca do Tomate"
+    )
+    repo = ProdutoRepository(db)
+    repo.create_produto(banca_id=banca.id, nome="Tomate Italiano", preco=8.5)
+    repo.create_produto(banca_id=banca.id, nome="Alface", preco=3.0)
+    db.commit()
+
+
+def _aguardar(condicao):
+    for _ in range(500):
+        if condicao():
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("buscas simultâneas não chegaram a tempo")
+
+
+def _seguidores():
+    with pesquisa_service._buscas._lock:
+        calls = list(pesquisa_service._buscas._calls.values())
+    return calls[0].waiters if calls else 0
+
+
+def test_buscas_identicas_simultaneas_calculam_uma_vez(api_client, monkeypatch):
+    _criar_catalogo(api_client.db)
+    liberar = threading.Event()
+    execucoes = []
+    executar = PesquisaService._executar_busca
+
+    def executar_bloqueado(self, *args):
+        execucoes.append(args)
+        liberar.wait(timeout=5)
+        return executar(self, *args)
+
+    monkeypatch.setattr(PesquisaService, "_executar_busca", executar_bloqueado)
+
+    def buscar(termo):
+        return api_client.get("/pesquisa/", params={"termo": termo, "tipo": "all"})
+
+    termos = ["tomate", "TOMATE", "Tomate", "tomate", "tomate"]
+    with ThreadPoolExecutor(max_workers=len(termos)) as pool:
+        respostas = [pool.submit(buscar, termos[0])]
+        _aguardar(lambda: execucoes)
+        respostas += [pool.submit(buscar, termo) for termo in termos[1:]]
+        _aguardar(lambda: _seguidores() == len(termos) - 1)
+        liberar.set()
+        respostas = [r.result() for r in respostas]
+
+    assert len(execucoes) == 1
+    assert [r.status_code for r in respostas] == [200] * len(termos)
+    # Cada chamada recebe o próprio termo; as listas são compartilhadas.
+    assert [r.json()["query"] for r in respostas] == termos
+    assert {len(r.json()["produtos"]) for r in respostas} == {1}
+    assert {len(r.json()["bancas"]) for r in respostas} == {1}
+
+    # Cada busca continua registrada individualmente.
+    search_log.flush()
+    registrados = api_client.db.scalars(select(Pesquisa.termo)).all()
+    assert sorted(registrados) == sorted(termos)
+
+
+def test_parametros_diferentes_nao_sao_coalescidos(api_client):
+    _criar_catalogo(api_client.db)
+
+    barato = api_client.get(
+        "/pesquisa/", params={"termo": "a", "tipo": "produto", "preco_max": 5}
+    )
+    todos = api_client.get("/pesquisa/", params={"termo": "a", "tipo": "produto"})
+
+    assert [p["nome"] for p in barato.json()["produtos"]] == ["Alface"]
+    assert len(todos.json()["produtos"]) == 2
+    assert pesquisa_service._buscas.in_flight() == 0
@@ -0,0 +1,186 @@
+"""
+Testes do endpoint de importação em lote de produtos (`POST /produtos/bulk`).
+"""
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+
+from src.models.produto_model import Produto
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_banca(db) -> int:
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Banca"
+    )
+    db.commit()
+    return banca.id
+
+
+def test_bulk_ndjson_insere_e_reporta_erros(api_client):
+    banca_id = _criar_banca(api_client.db)
+
+    corpo = "\n".join(
+        [
+            f'{{"banca_id": {banca_id}, "nome": "Tomate", "preco": 8.5}}',
+            "",
+            f'{{"banca_id": {banca_id}, "nome": "Alface"}}',
+            "nao e json",
+            '{"banca_id": 999, "nome": "Banana", "preco": 6}',
+            f'{{"banca_id": {banca_id}, "nome": "Cenoura", "preco": 4}}',
+        ]
+    )
+
+    response = api_client.post(
+        "/produtos/bulk",
+        content=corpo.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inseridos"] == 2
+    assert [e["linha"] for e in data["erros"]] == [3, 4, 5]
+    assert "preco" in data["erros"][0]["erro"]
+    assert api_client.db.query(Produto).count() == 2
+
+
+def test_bulk_csv(api_client):
+    banca_id = _criar_banca(api_client.db)
+
+    corpo = (
+        "banca_id,nome,preco,imagem\r\n"
+        f"{banca_id},Tomate,8.5,\r\n"
+        f'{banca_id},"Queijo, meia cura",30,/img/queijo.png\r\n'
+        f"{banca_id},Sem preco\r\n"
+    )
+
+    response = api_client.post(
+        "/produtos/bulk",
+        content=corpo.encode(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+    data = response.json()
+    assert data["inseridos"] == 2
+    assert [e["linha"] for e in data["erros"]] == [4]
+
+    nomes = {p.nome for p in api_client.db.query(Produto).all()}
+    assert nomes == {"Tomate", "Queijo, meia cura"}
+
+
+def test_bulk_valida_cada_banca_uma_unica_vez(api_client):
+    banca_id = _criar_banca(api_client.db)
+    comandos = []
+    event.listen(
+        api_client.db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: comandos.append(statement),
+    )
+
+    linhas = [
+        f'{{"banca_id": {banca_id}, "nome": "P{i}", "preco": {i}}}' for i in range(50)
+    ]
+    response = api_client.post(
+        "/produtos/bulk",
+        content="\n".join(linhas).encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.json()["inseridos"] == 50
+    assert sum(1 for c in comandos if c.startswith("SELECT bancas.id")) == 1
+    assert sum(1 for c in comandos if c.startswith("INSERT INTO produtos")) == 1
+
+
+def test_bulk_content_type_nao_suportado(api_client):
+    response = api_client.post(
+        "/produtos/bulk",
+        content=b"[]",
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 415
+
+
+def test_bulk_linha_fora_de_utf8_e_reportada(api_client):
+    banca_id = _criar_banca(api_client.db)
+
+    corpo = b"\n".join(
+        [
+            f'{{"banca_id": {banca_id}, "nome": "Tomate", "preco": 8.5}}'.encode(),
+            b'{"banca_id": 1, "nome": "Ma\xe7\xe3", "preco": 3}',
+            f'{{"banca_id": {banca_id}, "nome": "Maçã", "preco": 3}}'.encode(),
+        ]
+    )
+
+    response = api_client.post(
+        "/produtos/bulk",
+        content=corpo,
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inseridos"] == 2
+    assert data["erros"] == [
+        {"linha": 2, "erro": "A linha não está codificada em UTF-8."}
+    ]
+
+
+def test_bulk_valores_fora_do_intervalo_sao_reportados(api_client):
+    banca_id = _criar_banca(api_client.db)
+
+    corpo = "\n".join(
+        [
+            '{"banca_id": 99999999999999999999999, "nome": "Tomate", "preco": 1}',
+            f'{{"banca_id": {banca_id}, "nome": "Alface", "preco": 1e400}}',
+            f'{{"banca_id": {banca_id}, "nome": "Cenoura", "preco": 4}}',
+        ]
+    )
+
+    response = api_client.post(
+        "/produtos/bulk",
+        content=corpo.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["inseridos"] == 1
+    assert [e["linha"] for e in data["erros"]] == [1, 2]
+    assert "banca_id" in data["erros"][0]["erro"]
+    assert "preco" in data["erros"][1]["erro"]
+
+
+def test_bulk_falha_de_gravacao_nao_expoe_sql(api_client, monkeypatch):
+    banca_id = _criar_banca(api_client.db)
+
+    def falhar(self, rows):
+        raise OperationalError("INSERT INTO produtos ...", rows, Exception("x"))
+
+    monkeypatch.setattr(ProdutoRepository, "bulk_create_produtos", falhar)
+
+    corpo = "\n".join(
+        f'{{"banca_id": {banca_id}, "nome": "P{i}", "preco": 1}}' for i in range(3)
+    )
+    response = api_client.post(
+        "/produtos/bulk",
+        content=corpo.encode(),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+
+    data = response.json()
+    assert data["inseridos"] == 0
+    assert [e["linha"] for e in data["erros"]] == [1, 2, 3]
+    for erro in data["erros"]:
+        assert erro["erro"] == (
+            "Falha ao gravar o bloco das linhas 1 a 3; "
+            "nenhuma linha do bloco foi gravada."
+        )
@@ -0,0 +1,102 @@
+"""
+Testes da atualização de preços em lote (`PATCH /produtos/banca/{id}/precos`).
+"""
+
+from sqlalchemy import event
+
+from src.core.versioning import get_version
+from src.models.produto_model import Produto
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_bancas(db):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca_repo = BancaRepository(db)
+    produto_repo = ProdutoRepository(db)
+
+    banca = banca_repo.create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Minha"
+    )
+    outra = banca_repo.create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Outra"
+    )
+    meus = [
+        produto_repo.create_produto(banca_id=banca.id, nome=f"P{i}", preco=1.0).id
+        for i in range(3)
+    ]
+    alheio = produto_repo.create_produto(banca_id=outra.id, nome="X", preco=1.0).id
+    db.commit()
+    return banca.id, meus, alheio
+
+
+def _precos(db):
+    db.expire_all()
+    return {p.id: p.preco for p in db.query(Produto).all()}
+
+
+def test_atualiza_precos_em_um_unico_update(api_client):
+    banca_id, meus, alheio = _criar_bancas(api_client.db)
+    versao = get_version(api_client.db, "produtos")
+
+    comandos = []
+    event.listen(
+        api_client.db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: comandos.append(statement),
+    )
+
+    response = api_client.patch(
+        f"/produtos/banca/{banca_id}/precos",
+        json={"itens": [{"produto_id": pid, "preco": 9.5} for pid in meus]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"atualizados": 3}
+    assert sum(1 for c in comandos if c.startswith("UPDATE produtos")) == 1
+
+    precos = _precos(api_client.db)
+    assert all(precos[pid] == 9.5 for pid in meus)
+    assert precos[alheio] == 1.0
+    assert get_version(api_client.db, "produtos") == versao + 1
+
+
+def test_produto_de_outra_banca_cancela_o_lote(api_client):
+    banca_id, meus, alheio = _criar_bancas(api_client.db)
+    versao = get_version(api_client.db, "produtos")
+
+    response = api_client.patch(
+        f"/produtos/banca/{banca_id}/precos",
+        json={
+            "itens": [
+                {"produto_id": meus[0], "preco": 5.0},
+                {"produto_id": alheio, "preco": 5.0},
+            ]
+        },
+    )
+
+    assert response.status_code == 404
+    assert str(alheio) in response.json()["detail"]
+    assert set(_precos(api_client.db).values()) == {1.0}
+    assert get_version(api_client.db, "produtos") == versao
+
+
+def test_produto_repetido_e_rejeitado(api_client):
+    banca_id, meus, _ = _criar_bancas(api_client.db)
+
+    response = api_client.patch(
+        f"/produtos/banca/{banca_id}/precos",
+        json={
+            "itens": [
+                {"produto_id": meus[0], "preco": 5.0},
+                {"produto_id": meus[0], "preco": 6.0},
+            ]
+        },
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,100 @@
+"""
+Testes do cache de respostas serializadas (`src.api.response_cache`).
+"""
+
+from fastapi import Response
+from sqlalchemy import event
+
+from src.api.response_cache import ResponseCache, response_cache
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _criar_banca(db, produtos=1):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    banca = BancaRepository(db).create_banca(
+        supplier_id=supplier.id, address_id=address.id, nome="Minha"
+    )
+    repo = ProdutoRepository(db)
+    for i in range(produtos):
+        repo.create_produto(banca_id=banca.id, nome=f"Produto {i}", preco=1.0)
+    db.commit()
+    return banca.id
+
+
+def test_acerto_nao_consulta_as_linhas(api_client):
+    _criar_banca(api_client.db)
+    primeira = api_client.get("/bancas/")
+
+    comandos = []
+
+    def registrar(conn, cursor, statement, *args):
+        comandos.append(statement)
+
+    engine = api_client.db.get_bind()
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        segunda = api_client.get("/bancas/")
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+
+    assert segunda.status_code == 200
+    assert segunda.content == primeira.content
+    assert segunda.headers["ETag"] == primeira.headers["ETag"]
+    assert response_cache.stats()["hits"] == 1
+    assert len(comandos) == 1
+    assert "FROM table_versions" in comandos[0]
+
+
+def test_escrita_invalida_a_entrada(api_client):
+    banca_id = _criar_banca(api_client.db)
+    antes = api_client.get(f"/produtos/banca/{banca_id}").json()
+
+    api_client.post(
+        "/produtos/", json={"banca_id": banca_id, "nome": "Novo", "preco": 3.0}
+    )
+    depois = api_client.get(f"/produtos/banca/{banca_id}").json()
+
+    assert len(depois) == len(antes) + 1
+    assert response_cache.stats()["hits"] == 0
+
+
+def test_entrega_versao_comprimida_quando_aceita(api_client):
+    banca_id = _criar_banca(api_client.db, produtos=30)
+    url = f"/produtos/banca/{banca_id}"
+
+    comprimida = api_client.get(url, headers={"Accept-Encoding": "gzip"})
+    identidade = api_client.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert comprimida.headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in identidade.headers
+    assert comprimida.headers["Vary"] == "Accept-Encoding"
+    assert comprimida.json() == identidade.json()
+    assert len(comprimida.json()) == 30
+
+
+def test_lru_respeita_limite_de_bytes():
+    cache = ResponseCache(max_bytes=10)
+
+    cache.put("a", Response(b"aaaa"))
+    cache.put("b", Response(b"bbbb"))
+    assert cache.get("a") is not None
+    cache.put("c", Response(b"cccc"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_cache_desativado_nao_guarda():
+    cache = ResponseCache(max_bytes=0)
+
+    cache.put("a", Response(b"aaaa"))
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
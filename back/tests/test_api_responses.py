@@ -0,0 +1,50 @@
+"""
+Testes das classes de resposta da API (`DTOResponse`).
+"""
+
+import json
+
+from src.api.responses import DTOResponse
+from src.dto.produto_dto import ProdutoRead
+
+
+def _produto(i: int) -> ProdutoRead:
+    return ProdutoRead(
+        id=i,
+        nome=f"P{i}",
+        preco=1.5,
+        imagem=None,
+        banca_id=1,
+        created_at="2025-01-01T00:00:00+00:00",
+        updated_at="2025-01-01T00:00:00+00:00",
+    )
+
+
+def test_dto_response_serializa_um_dto():
+    response = DTOResponse(_produto(1), status_code=201)
+
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    assert json.loads(bytes(response.body)) == _produto(1).model_dump()
+
+
+def test_dto_response_serializa_lista():
+    produtos = [_produto(i) for i in range(3)]
+
+    response = DTOResponse(produtos)
+
+    assert json.loads(bytes(response.body)) == [p.model_dump() for p in produtos]
+
+
+def test_dto_response_lista_vazia():
+    assert DTOResponse([]).body == b"[]"
+
+
+def test_endpoint_de_criacao_mantem_status(api_client):
+    response = api_client.post(
+        "/users/",
+        json={"name": "A", "email": "a@test.com", "password": "x", "type": "user"},
+    )
+
+    assert response.status_code == 201
+    assert response.json()["email"] == "a@test.com"
@@ -1,3 +1,4 @@
+import uuid
 from unittest.mock import MagicMock
 
 from src.services.banca_service import BancaService
@@ -30,7 +31,7 @@ def test_criar_banca_deve_retornar_banca_read():
         state="ST",
         zip_code="00000-000",
         latitude=None,
-        longitude=None
+        longitude=None,
     )
     address.id = "1"
     address_repo.create_address.return_value = address
@@ -40,7 +41,7 @@ def test_criar_banca_deve_retornar_banca_read():
         nome="Banca TDD",
         descricao="Banca criada",
         horario_funcionamento="08h - 18h",
-        supplier_id="SUP-123",
+        supplier_id="9f1c2b7e-3d4a-4b8e-9c1d-2e3f4a5b6c7d",
         address_id="1",
     )
     banca.id = 1
@@ -50,7 +51,7 @@ def test_criar_banca_deve_retornar_banca_read():
         nome="Banca TDD",
         descricao="Banca criada",
         horario_funcionamento="08h - 18h",
-        supplier_id="SUP-123",
+        supplier_id=uuid.UUID("9f1c2b7e-3d4a-4b8e-9c1d-2e3f4a5b6c7d"),
         address=AddressCreate(
             street="Rua Teste",
             number="123",
@@ -61,7 +62,7 @@ def test_criar_banca_deve_retornar_banca_read():
             zip_code="00000-000",
             latitude=None,
             longitude=None,
-        )
+        ),
     )
 
     result = service.create_banca(dto)
@@ -114,6 +115,7 @@ def test_deletar_banca():
     b = Banca(nome="Teste", supplier_id="S", address_id="ADDR1")
     b.id = 1
     banca_repo.get_by_id.return_value = b
+    banca_repo.delete_banca.return_value = True
 
     result = service.delete_banca(1)
 
@@ -0,0 +1,108 @@
+"""
+Testes da compressão de respostas (`src.core.compression` e
+`CompressionMiddleware`).
+"""
+
+import threading
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.core import compression
+from src.core.config import get_settings
+from src.core.middleware import CompressionMiddleware
+
+
+def _app(tamanho: int) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/dados")
+    def dados():
+        return JSONResponse({"texto": "a" * tamanho})
+
+    @app.get("/vazio")
+    def vazio():
+        return JSONResponse(None, status_code=204)
+
+    return app
+
+
+def test_negotiate_respeita_pesos_e_preferencia_do_servidor():
+    disponiveis = ("br", "gzip")
+
+    assert compression.negotiate("gzip, br", disponiveis) == "br"
+    assert compression.negotiate("gzip;q=1.0, br;q=0.5", disponiveis) == "gzip"
+    assert compression.negotiate("br;q=0, *", disponiveis) == "gzip"
+    assert compression.negotiate("identity", disponiveis) is None
+    assert compression.negotiate("gzip;q=0", disponiveis) is None
+    assert compression.negotiate("*", ("gzip",)) == "gzip"
+
+
+def test_comprime_corpo_acima_do_limite():
+    with TestClient(_app(5000)) as client:
+        resp = client.get("/dados", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert resp.headers["Vary"] == "Accept-Encoding"
+    assert int(resp.headers["Content-Length"]) < 5000
+    assert resp.json() == {"texto": "a" * 5000}
+
+
+def test_nao_comprime_corpo_pequeno_nem_sem_aceite():
+    with TestClient(_app(10)) as client:
+        pequeno = client.get("/dados", headers={"Accept-Encoding": "gzip"})
+    with TestClient(_app(5000)) as client:
+        sem_aceite = client.get("/dados", headers={"Accept-Encoding": "identity"})
+        vazio = client.get("/vazio", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in pequeno.headers
+    assert "Vary" not in pequeno.headers
+    assert "Content-Encoding" not in sem_aceite.headers
+    assert sem_aceite.headers["Vary"] == "Accept-Encoding"
+    assert vazio.status_code == 204
+    assert "Content-Encoding" not in vazio.headers
+
+
+def test_corpo_grande_e_comprimido_fora_do_event_loop(monkeypatch):
+    monkeypatch.setattr(get_settings(), "compression_offload_bytes", 1024)
+    threads = []
+    original = compression.compress
+
+    def registrar(data, encoding):
+        threads.append(threading.current_thread())
+        return original(data, encoding)
+
+    monkeypatch.setattr(compression, "compress", registrar)
+
+    with TestClient(_app(5000)) as client:
+        resp = client.get("/dados", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+    assert threads[0].name.startswith("AnyIO worker thread")
+
+
+def test_resposta_ja_codificada_nao_e_recomprimida(api_client):
+    from src.repositories.address_repository import AddressRepository
+    from src.repositories.banca_repository import BancaRepository
+    from src.repositories.user_repository import UserRepository
+
+    db = api_client.db
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    for i in range(30):
+        BancaRepository(db).create_banca(
+            supplier_id=supplier.id, address_id=address.id, nome=f"Banca {i}"
+        )
+    db.commit()
+
+    resp = api_client.get("/bancas/", headers={"Accept-Encoding": "gzip"})
+
+    assert resp.headers["Content-Encoding"] == "gzip"
+    # Uma segunda compressão tornaria o corpo decodificado inválido.
+    assert len(resp.json()) == 30
@@ -4,9 +4,22 @@ Teste do módulo de configuração de banco de dados.
 Este teste garante que o engine e a sessão sejam criados corretamente.
 """
 
+import logging
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from sqlalchemy import text
-from src.core.database import engine, SessionLocal
+from src.core.config import get_settings
+from src.core.database import (
+    engine,
+    SessionLocal,
+    LazySession,
+    check_uuid_storage,
+    get_db,
+    track_queries,
+)
 
 
 def test_engine_deve_existir():
@@ -44,3 +57,138 @@ def test_sessao_deve_criar_conexao():
 
     finally:
         db.close()
+
+
+def test_lazy_session_nao_abre_sessao_sem_uso():
+    """
+    Cenário:
+    - Obter uma sessão do provedor e encerrá-la sem consultas.
+
+    Expectativa:
+    - A fábrica de sessões nunca deve ser chamada.
+    """
+    chamadas = []
+
+    def fabrica():
+        chamadas.append(1)
+        return SessionLocal()
+
+    db = LazySession(fabrica)
+    assert db.started is False
+
+    db.close()
+    assert chamadas == []
+
+
+def test_lazy_session_abre_sessao_no_primeiro_uso():
+    """
+    Cenário:
+    - Executar uma consulta através da sessão preguiçosa.
+
+    Expectativa:
+    - A sessão real é criada uma única vez e fechada no `close`.
+    """
+    db = LazySession(SessionLocal)
+
+    assert db.execute(text("SELECT 1")).scalar() == 1
+    assert db.started is True
+
+    db.close()
+    assert db.started is False
+
+
+def test_get_db_fornece_sessao_preguicosa():
+    """
+    Cenário:
+    - Consumir a dependência `get_db` como o FastAPI faz.
+
+    Expectativa:
+    - A sessão fornecida só é iniciada quando utilizada.
+    """
+    gen = get_db()
+    db = next(gen)
+
+    assert isinstance(db, LazySession)
+    assert db.started is False
+
+    gen.close()
+
+
+def test_track_queries_contabiliza_consultas():
+    """
+    Cenário:
+    - Executar consultas dentro de um escopo de contabilização.
+
+    Expectativa:
+    - Número de consultas e tempo de banco devem ser registrados.
+    - Consultas fora do escopo não devem ser contabilizadas.
+    """
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 3"))
+
+    assert stats.queries == 2
+    assert stats.db_time > 0
+
+
+def test_track_queries_sinaliza_comandos_repetidos():
+    """
+    Cenário:
+    - Executar o mesmo comando várias vezes no mesmo escopo.
+
+    Expectativa:
+    - O comando repetido aparece em `repeated`; o executado uma vez não.
+    """
+    with track_queries() as stats:
+        with engine.connect() as conn:
+            for i in range(3):
+                conn.execute(text("SELECT :n"), {"n": i})
+            conn.execute(text("SELECT 1"))
+
+    assert stats.repeated(3) == {"SELECT ?": 3}
+    assert stats.repeated(4) == {}
+
+
+def test_consulta_lenta_e_registrada_em_log(monkeypatch, caplog):
+    """
+    Cenário:
+    - Limite de consulta lenta igual a zero.
+
+    Expectativa:
+    - A consulta é registrada em log com seus parâmetros.
+    """
+    monkeypatch.setattr(get_settings(), "slow_query_ms", 0)
+
+    with caplog.at_level(logging.WARNING, logger="src.core.database"):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :valor"), {"valor": 42})
+
+    assert "Consulta lenta" in caplog.text
+    assert "42" in caplog.text
+
+
+def test_check_uuid_storage_recusa_chaves_gravadas_como_texto():
+    """
+    Cenário:
+    - Banco criado antes de `BinaryUUID`, com o id do usuário em texto.
+
+    Expectativa:
+    - A verificação falha antes de a aplicação usar o banco; com o id em
+      16 bytes, ela passa.
+    """
+    antigo = create_engine("sqlite://")
+    with antigo.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id VARCHAR PRIMARY KEY)"))
+        conn.execute(text("INSERT INTO users VALUES (:id)"), {"id": str(uuid.uuid4())})
+
+    with pytest.raises(RuntimeError, match="users"):
+        check_uuid_storage(antigo)
+
+    with antigo.begin() as conn:
+        conn.execute(text("UPDATE users SET id = :id"), {"id": uuid.uuid4().bytes})
+
+    check_uuid_storage(antigo)
@@ -0,0 +1,122 @@
+"""
+Testes das verificações de saúde usadas na prontidão.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine
+
+from src.core import health
+from src.core.health import (
+    LoopLagMonitor,
+    OverloadTracker,
+    check_database,
+    check_loop_lag,
+    check_pool,
+    check_queue,
+)
+from src.core.metrics import InstrumentedQueuePool
+
+
+def test_sobrecarga_sustentada_conta_desde_o_primeiro_sinal():
+    agora = [100.0]
+    tracker = OverloadTracker(clock=lambda: agora[0])
+
+    assert tracker.update(True) == 0.0
+    agora[0] = 104.0
+    assert tracker.update(True) == 4.0
+    assert tracker.update(False) == 0.0
+    agora[0] = 110.0
+    assert tracker.update(True) == 0.0
+
+
+def test_fila_acima_do_limite_falha():
+    assert check_queue(79, 100, 0.8).ok
+    resultado = check_queue(80, 100, 0.8)
+    assert not resultado.ok
+    assert resultado.detail["saturation"] == 0.8
+
+
+def test_pool_saturado_falha(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=1,
+    )
+
+    with engine.connect():
+        assert check_pool(engine, 0.9).detail["saturation"] == 0.5
+        assert check_pool(engine, 0.5).ok is False
+    assert check_pool(engine, 0.5).ok
+    engine.dispose()
+
+
+def test_banco_lento_expira(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'ping.db'}")
+
+    assert asyncio.run(check_database(engine, 1.0)).ok
+
+    monkeypatch.setattr(health, "_ping", lambda engine: time.sleep(0.5))
+    resultado = asyncio.run(check_database(engine, 0.05))
+    assert not resultado.ok
+    assert "timeout" in resultado.detail["error"]
+    _aguardar_verificacao()
+    engine.dispose()
+
+
+def _aguardar_verificacao():
+    """
+    Espera a thread da última verificação de banco terminar.
+    """
+    for _ in range(500):
+        if not health._database_busy.is_set():
+            return
+        time.sleep(0.01)
+    raise AssertionError("verificação não terminou a tempo")
+
+
+def test_banco_travado_nao_acumula_threads(monkeypatch):
+    liberar = threading.Event()
+    monkeypatch.setattr(health, "_ping", lambda engine: liberar.wait(timeout=5))
+    engine = create_engine("sqlite://")
+    threads = threading.active_count()
+
+    async def verificar_varias_vezes():
+        resultados = []
+        for _ in range(5):
+            resultados.append(await check_database(engine, 0.02))
+        return resultados, threading.active_count()
+
+    resultados, threads_durante = asyncio.run(verificar_varias_vezes())
+
+    assert threads_durante <= threads + 1
+    assert "timeout" in resultados[0].detail["error"]
+    assert all(
+        r.detail == {"error": "verificação anterior em andamento"}
+        for r in resultados[1:]
+    )
+
+    liberar.set()
+    _aguardar_verificacao()
+    assert asyncio.run(check_database(engine, 1.0)).ok
+
+
+def test_atraso_do_event_loop_bloqueado():
+    async def medir():
+        monitor = LoopLagMonitor(interval=0.01)
+        assert check_loop_lag(monitor, 100).detail["lag_ms"] is None
+
+        monitor.start()
+        await asyncio.sleep(0.03)
+        time.sleep(0.2)  # bloqueia o loop
+        resultado = check_loop_lag(monitor, 100)
+        await monitor.stop()
+        return resultado
+
+    resultado = asyncio.run(medir())
+    assert not resultado.ok
+    assert resultado.detail["lag_ms"] == pytest.approx(200, abs=60)
@@ -0,0 +1,57 @@
+"""
+Testes das métricas de pool de conexões e threadpool.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc, text
+
+from src.core.metrics import Histogram, InstrumentedQueuePool, pool_stats
+
+
+def test_histograma_cumulativo():
+    hist = Histogram(buckets=(0.01, 0.1, 1.0))
+
+    for valor in (0.005, 0.05, 0.5, 5.0):
+        hist.observe(valor)
+
+    snapshot = hist.snapshot()
+    assert snapshot["buckets"] == {"0.01": 1, "0.1": 2, "1.0": 3, "+Inf": 4}
+    assert snapshot["count"] == 4
+    assert snapshot["sum"] == pytest.approx(5.555)
+
+
+def test_pool_instrumentado_conta_checkouts_expirados(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+        stats = pool_stats(engine)
+        assert stats["checked_out"] == 1
+
+        with pytest.raises(exc.TimeoutError):
+            engine.connect()
+
+    stats = pool_stats(engine)
+    assert stats["checked_out"] == 0
+    assert stats["checkout_timeouts"] == 1
+    assert stats["checkout_wait_seconds"]["count"] == 2
+    assert stats["checkout_wait_seconds"]["sum"] >= 0.05
+    engine.dispose()
+
+
+def test_endpoint_de_metricas_do_pool():
+    from src.main import app
+
+    data = TestClient(app).get("/metrics/pool").json()
+
+    assert data["database_pool"]["class"] == "InstrumentedQueuePool"
+    assert "checkout_wait_seconds" in data["database_pool"]
+    assert data["threadpool"]["total_tokens"] > 0
@@ -0,0 +1,175 @@
+"""
+Testes das métricas no formato Prometheus (`/metrics`).
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.core import prometheus
+from src.core.config import get_settings
+from src.core.prometheus import Registry, merge, read_snapshots, render
+
+
+@pytest.fixture
+def registro_limpo():
+    prometheus.registry.clear()
+    yield prometheus.registry
+    prometheus.registry.clear()
+
+
+def _amostras(texto):
+    """
+    Converte o texto exposto em {série: valor}, ignorando comentários.
+    """
+    amostras = {}
+    for linha in texto.splitlines():
+        if linha and not linha.startswith("#"):
+            serie, valor = linha.rsplit(" ", 1)
+            amostras[serie] = float(valor)
+    return amostras
+
+
+def test_requisicoes_por_rota_status_e_consultas(api_client, registro_limpo):
+    api_client.get("/bancas/1")
+    api_client.get("/bancas/2")
+    api_client.get("/rota/inexistente")
+
+    resp = api_client.get("/metrics")
+    amostras = _amostras(resp.text)
+
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    rota = 'method="GET",route="/bancas/{banca_id}"'
+    assert amostras[f'http_requests_total{{{rota},status="404"}}'] == 2
+    assert amostras[f"http_request_duration_seconds_count{{{rota}}}"] == 2
+    assert amostras[f'http_request_duration_seconds_bucket{{{rota},le="+Inf"}}'] == 2
+    assert 'route="<unmatched>"' in resp.text
+    assert amostras['db_queries_total{route="/bancas/{banca_id}"}'] >= 2
+    # A própria coleta está em andamento enquanto as métricas são lidas.
+    assert amostras['http_requests_in_progress{method="GET"}'] == 1
+
+
+def test_histograma_renderizado_em_ordem_cumulativa():
+    registro = Registry()
+    for valor in (0.002, 0.02, 3.0):
+        registro.observe("http_request_duration_seconds", {"route": "/x"}, valor)
+
+    texto = render(merge([registro.snapshot()]))
+    buckets = [
+        linha for linha in texto.splitlines() if linha.startswith("http_request_dur")
+    ]
+
+    assert "# TYPE http_request_duration_seconds histogram" in texto
+    assert buckets[0] == 'http_request_duration_seconds_bucket{route="/x",le="0.001"} 0'
+    assert 'http_request_duration_seconds_bucket{route="/x",le="0.025"} 2' in buckets
+    assert 'http_request_duration_seconds_bucket{route="/x",le="+Inf"} 3' in buckets
+    assert buckets.index(
+        'http_request_duration_seconds_bucket{route="/x",le="+Inf"} 3'
+    ) < buckets.index('http_request_duration_seconds_count{route="/x"} 3')
+
+
+def test_soma_processos_e_ignora_medidores_de_encerrados(
+    tmp_path, monkeypatch, registro_limpo
+):
+    monkeypatch.setattr(get_settings(), "metrics_dir", str(tmp_path))
+    # Outro processo registra métricas, grava o retrato e termina.
+    script = (
+        "from src.core import prometheus as p\n"
+        "labels = {'method': 'GET', 'route': '/x', 'status': '200'}\n"
+        "p.registry.inc('http_requests_total', labels, 3)\n"
+        "p.registry.add('http_requests_in_progress', {'method': 'GET'}, 5)\n"
+        "p.registry.observe('http_request_duration_seconds', "
+        "{'method': 'GET', 'route': '/x'}, 0.2)\n"
+        "p.flush()\n"
+    )
+    env = {**os.environ, "APP_METRICS_DIR": str(tmp_path)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
+
+    labels = {"method": "GET", "route": "/x", "status": "200"}
+    registro_limpo.inc("http_requests_total", labels, 2)
+    registro_limpo.add("http_requests_in_progress", {"method": "GET"}, 1)
+    registro_limpo.observe(
+        "http_request_duration_seconds", {"method": "GET", "route": "/x"}, 0.2
+    )
+
+    amostras = _amostras(prometheus.exposition())
+
+    assert len(read_snapshots(str(tmp_path))) == 2
+    assert amostras['http_requests_total{method="GET",route="/x",status="200"}'] == 5
+    assert amostras['http_request_duration_seconds_count{method="GET",route="/x"}'] == 2
+    assert amostras['http_requests_in_progress{method="GET"}'] == 1
+
+
+def _worker_encerrado(diretorio, requisicoes):
+    """
+    Simula um worker que registra requisições, grava o retrato e termina.
+
+    Retorna o pid do processo.
+    """
+    script = (
+        "import os\n"
+        "from src.core import prometheus as p\n"
+        "labels = {'method': 'GET', 'route': '/x', 'status': '200'}\n"
+        f"p.registry.inc('http_requests_total', labels, {requisicoes})\n"
+        "p.registry.add('http_requests_in_progress', {'method': 'GET'}, 1)\n"
+        "p.flush()\n"
+        "print(os.getpid())\n"
+    )
+    env = {**os.environ, "APP_METRICS_DIR": str(diretorio)}
+    saida = subprocess.run(
+        [sys.executable, "-c", script], check=True, env=env, capture_output=True
+    )
+    return int(saida.stdout)
+
+
+def test_workers_encerrados_sao_acumulados_em_um_arquivo(
+    tmp_path, monkeypatch, registro_limpo
+):
+    monkeypatch.setattr(get_settings(), "metrics_dir", str(tmp_path))
+    serie = 'http_requests_total{method="GET",route="/x",status="200"}'
+
+    primeiro = _worker_encerrado(tmp_path, 3)
+    prometheus.archive_process(str(tmp_path), primeiro)
+    segundo = _worker_encerrado(tmp_path, 4)
+
+    # Coleta entre a gravação do acumulado e a remoção do arquivo do
+    # worker: o worker não é contado duas vezes.
+    arquivo = tmp_path / f"metrics-{segundo}.json"
+    conteudo = arquivo.read_text()
+    prometheus.archive_process(str(tmp_path), segundo)
+    arquivo.write_text(conteudo)
+    assert _amostras(prometheus.exposition())[serie] == 7
+
+    arquivo.unlink()
+    nomes = {p.name for p in tmp_path.glob("metrics-*.json")}
+    assert nomes == {"metrics-archive.json", f"metrics-{os.getpid()}.json"}
+
+    amostras = _amostras(prometheus.exposition())
+    assert amostras[serie] == 7
+    assert 'http_requests_in_progress{method="GET"}' not in amostras
+
+
+def test_medidores_de_retrato_sem_pid_sao_ignorados():
+    arquivado = {
+        "pid": None,
+        "counters": [["http_requests_total", {"status": "200"}, 2]],
+        "gauges": [["http_requests_in_progress", {"method": "GET"}, 1]],
+    }
+
+    merged = merge([arquivado])
+
+    assert sum(merged["counters"].values()) == 2
+    assert not merged["gauges"]
+
+
+def test_limpeza_do_diretorio(tmp_path):
+    (tmp_path / "metrics-123.json").write_text("{}")
+    (tmp_path / "outro.txt").write_text("")
+
+    prometheus.clear_directory(str(tmp_path / "novo"))
+    prometheus.clear_directory(str(tmp_path))
+
+    assert (tmp_path / "novo").is_dir()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["novo", "outro.txt"]
@@ -0,0 +1,92 @@
+"""
+Testes da coalescência de cálculos simultâneos (`SingleFlight`).
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+
+import pytest
+
+from src.core.singleflight import SingleFlight
+
+
+def _calculo_bloqueado(
+    liberar: threading.Event, resultado: Union[str, Exception] = "ok"
+):
+    """
+    Inicia um cálculo que só termina quando `liberar` é sinalizado.
+    """
+    iniciado = threading.Event()
+
+    def calcular():
+        iniciado.set()
+        liberar.wait(timeout=5)
+        if isinstance(resultado, Exception):
+            raise resultado
+        return resultado
+
+    return calcular, iniciado
+
+
+def _aguardar_seguidores(flight, quantidade):
+    """
+    Espera até que `quantidade` chamadas estejam aguardando o líder.
+    """
+    for _ in range(500):
+        with flight._lock:
+            calls = list(flight._calls.values())
+        if calls and calls[0].waiters >= quantidade:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("seguidores não chegaram a tempo")
+
+
+def test_chamadas_simultaneas_compartilham_um_calculo():
+    flight = SingleFlight()
+    liberar = threading.Event()
+    calcular, iniciado = _calculo_bloqueado(liberar)
+    execucoes = []
+
+    def seguidor():
+        return flight.do("k", lambda: execucoes.append(1) or "outro")
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        lider = pool.submit(flight.do, "k", calcular)
+        iniciado.wait(timeout=5)
+        seguidores = [pool.submit(seguidor) for _ in range(5)]
+        _aguardar_seguidores(flight, 5)
+        liberar.set()
+
+        assert lider.result() == ("ok", True)
+        assert [f.result() for f in seguidores] == [("ok", True)] * 5
+
+    assert execucoes == []
+    assert flight.in_flight() == 0
+
+
+def test_chave_liberada_apos_o_calculo():
+    flight = SingleFlight()
+
+    assert flight.do("k", lambda: 1) == (1, False)
+    assert flight.do("k", lambda: 2) == (2, False)
+
+
+def test_erro_propagado_para_todos():
+    flight = SingleFlight()
+    liberar = threading.Event()
+    calcular, iniciado = _calculo_bloqueado(liberar, resultado=ValueError("falhou"))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        lider = pool.submit(flight.do, "k", calcular)
+        iniciado.wait(timeout=5)
+        seguidor = pool.submit(flight.do, "k", lambda: "nunca")
+        _aguardar_seguidores(flight, 1)
+        liberar.set()
+
+        with pytest.raises(ValueError):
+            lider.result()
+        with pytest.raises(ValueError):
+            seguidor.result()
+
+    assert flight.in_flight() == 0
@@ -0,0 +1,73 @@
+"""
+Testes do perfil de inicialização e do tempo até a primeira requisição.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from src.core.startup import StartupProfile
+
+# Tempo máximo entre o início do import da aplicação e a resposta da
+# primeira requisição (hoje em torno de 1 s).
+STARTUP_BUDGET_SECONDS = 3.0
+
+BACK_DIR = Path(__file__).resolve().parents[1]
+
+_SCRIPT = """
+import json, os, sys, time
+
+start = time.perf_counter()
+import src.main
+
+imported_without_db = not os.path.exists(sys.argv[1])
+
+from fastapi.testclient import TestClient
+
+with TestClient(src.main.app) as client:
+    response = client.get("/produtos/")
+    elapsed = time.perf_counter() - start
+
+print(json.dumps({
+    "elapsed": elapsed,
+    "status": response.status_code,
+    "imported_without_db": imported_without_db,
+    "profile": src.main.profile.summary(),
+}))
+"""
+
+
+def test_perfil_mede_etapas_em_sequencia():
+    agora = [10.0]
+    profile = StartupProfile(clock=lambda: agora[0])
+
+    agora[0] = 10.5
+    profile.mark("imports")
+    agora[0] = 10.75
+    profile.mark("schema")
+
+    assert profile.phases == {"imports": 0.5, "schema": 0.25}
+    assert profile.summary() == {"imports": 500.0, "schema": 250.0, "total": 750.0}
+
+
+def test_primeira_requisicao_dentro_do_orcamento(tmp_path):
+    database = tmp_path / "startup.db"
+    env = {**os.environ, "APP_DATABASE_URL": f"sqlite:///{database}"}
+
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT, str(database)],
+        cwd=BACK_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    data = json.loads(result.stdout.strip().splitlines()[-1])
+
+    # O import não cria o banco; as tabelas surgem no lifespan.
+    assert data["imported_without_db"]
+    assert data["status"] == 200
+    assert database.exists()
+    assert data["elapsed"] < STARTUP_BUDGET_SECONDS, data["profile"]
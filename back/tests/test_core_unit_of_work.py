@@ -0,0 +1,94 @@
+"""
+Testes da unidade de trabalho (fronteira transacional dos serviços).
+
+Utiliza banco de dados isolado em memória.
+"""
+
+import uuid
+
+import pytest
+
+from src.core.unit_of_work import UnitOfWork
+from src.models.address import Address
+from src.models.banca import Banca
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.user_repository import UserRepository
+from src.services.banca_service import BancaService
+from src.dto.banca_dto import BancaCreate
+from src.dto.address_dto import AddressCreate
+
+
+def _banca_dto(supplier_id: str) -> BancaCreate:
+    return BancaCreate(
+        nome="Banca UoW",
+        supplier_id=uuid.UUID(supplier_id),
+        address=AddressCreate(
+            street="Rua X",
+            number=None,
+            complement=None,
+            district=None,
+            city="Cidade",
+            state="UF",
+            zip_code="00000-000",
+            latitude=None,
+            longitude=None,
+        ),
+    )
+
+
+def test_uow_confirma_ao_sair_sem_erro(test_db):
+    repo = AddressRepository(test_db)
+
+    with UnitOfWork(test_db):
+        address = repo.create_address(
+            street="Rua A", city="C", state="UF", zip_code="000"
+        )
+
+    test_db.rollback()
+    assert test_db.get(Address, address.id) is not None
+
+
+def test_uow_desfaz_ao_ocorrer_erro(test_db):
+    repo = AddressRepository(test_db)
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(test_db):
+            repo.create_address(street="Rua A", city="C", state="UF", zip_code="000")
+            raise RuntimeError("falha no segundo passo")
+
+    assert test_db.query(Address).count() == 0
+
+
+def test_create_banca_usa_um_unico_commit(test_db, monkeypatch):
+    commits = []
+    original = test_db.commit
+
+    def contar_commit():
+        commits.append(1)
+        original()
+
+    supplier = UserRepository(test_db).create_user("F", "f@test.com", "1", "supplier")
+    monkeypatch.setattr(test_db, "commit", contar_commit)
+
+    service = BancaService(BancaRepository(test_db), AddressRepository(test_db))
+    service.create_banca(_banca_dto(supplier.id))
+
+    assert len(commits) == 1
+    assert test_db.query(Banca).count() == 1
+
+
+def test_create_banca_nao_deixa_endereco_orfao(test_db, monkeypatch):
+    supplier = UserRepository(test_db).create_user("F", "f@test.com", "1", "supplier")
+    banca_repo = BancaRepository(test_db)
+    service = BancaService(banca_repo, AddressRepository(test_db))
+
+    def falhar(**_):
+        raise RuntimeError("falha ao gravar banca")
+
+    monkeypatch.setattr(banca_repo, "create_banca", falhar)
+
+    with pytest.raises(RuntimeError):
+        service.create_banca(_banca_dto(supplier.id))
+
+    assert test_db.query(Address).count() == 0
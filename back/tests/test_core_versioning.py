@@ -0,0 +1,45 @@
+"""
+Testes do versionamento de tabelas (contador de geração por tabela).
+"""
+
+import pytest
+
+from src.core.unit_of_work import UnitOfWork
+from src.core.versioning import get_version, get_versions
+from src.repositories.address_repository import AddressRepository
+
+
+def test_versao_inicial_e_zero(test_db):
+    assert get_versions(test_db, ["produtos", "bancas"]) == {
+        "produtos": 0,
+        "bancas": 0,
+    }
+
+
+def test_commit_incrementa_uma_vez_por_transacao(test_db):
+    repo = AddressRepository(test_db)
+
+    with UnitOfWork(test_db):
+        for i in range(3):
+            repo.create_address(street=f"Rua {i}", city="C", state="UF", zip_code="0")
+
+    assert get_version(test_db, "addresses") == 1
+
+    with UnitOfWork(test_db):
+        repo.create_address(street="Rua X", city="C", state="UF", zip_code="0")
+
+    assert get_version(test_db, "addresses") == 2
+
+
+def test_rollback_nao_incrementa(test_db):
+    repo = AddressRepository(test_db)
+
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(test_db):
+            repo.create_address(street="Rua A", city="C", state="UF", zip_code="0")
+            raise RuntimeError("falha")
+
+    with UnitOfWork(test_db):
+        pass
+
+    assert get_version(test_db, "addresses") == 0
@@ -0,0 +1,60 @@
+"""
+Testes da conversão ORM → DTO (`src.dto.mapper`).
+"""
+
+from datetime import datetime, timezone
+
+from src.dto.mapper import fieldset_model, to_dto, to_dto_list
+from src.dto.produto_dto import ProdutoRead
+from src.models.address import Address  # noqa: F401
+from src.models.banca import Banca  # noqa: F401
+from src.models.produto_model import Produto
+from src.models.user import User  # noqa: F401
+
+
+def _produto(i: int) -> Produto:
+    produto = Produto(banca_id=1, nome=f"P{i}", preco=float(i))
+    produto.id = i
+    produto.created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    produto.updated_at = datetime(2025, 1, 2, tzinfo=timezone.utc)
+    return produto
+
+
+def test_to_dto_le_atributos_do_orm():
+    dto = to_dto(ProdutoRead, _produto(1))
+
+    assert dto == ProdutoRead(
+        id=1,
+        nome="P1",
+        preco=1.0,
+        imagem=None,
+        banca_id=1,
+        created_at="2025-01-01T00:00:00+00:00",
+        updated_at="2025-01-02T00:00:00+00:00",
+    )
+
+
+def test_to_dto_list_preserva_ordem():
+    dtos = to_dto_list(ProdutoRead, [_produto(i) for i in (3, 1, 2)])
+
+    assert [d.id for d in dtos] == [3, 1, 2]
+    assert all(isinstance(d, ProdutoRead) for d in dtos)
+
+
+def test_to_dto_list_vazia():
+    assert to_dto_list(ProdutoRead, []) == []
+
+
+def test_fieldset_model_mantem_apenas_campos_pedidos():
+    model = fieldset_model(ProdutoRead, ["preco", "id", "updated_at"])
+
+    dto = to_dto(model, _produto(2))
+
+    assert list(dto.model_dump()) == ["preco", "id", "updated_at"]
+    assert dto.updated_at == "2025-01-02T00:00:00+00:00"
+    assert fieldset_model(ProdutoRead, {"id", "preco", "updated_at"}) is model
+
+
+def test_fieldset_model_sem_recorte_retorna_dto_original():
+    assert fieldset_model(ProdutoRead, None) is ProdutoRead
+    assert fieldset_model(ProdutoRead, ProdutoRead.model_fields) is ProdutoRead
@@ -7,6 +7,7 @@ from src.services.pesquisa_service import PesquisaService
 from src.models.address import Address
 from src.models.banca import Banca
 from src.models.produto_model import Produto
+from src.models.user import User
 
 
 # ============================================================
@@ -30,11 +31,19 @@ def db_session():
 def setup_data(db_session):
     """
     Cria dados completos para testes:
+    - 2 fornecedores
     - 2 endereços
     - 2 bancas
     - 3 produtos
     """
 
+    # Fornecedores
+    user1 = User(name="João", email="joao@test.com", password="1", type="supplier")
+    user2 = User(name="Maria", email="maria@test.com", password="2", type="supplier")
+
+    db_session.add_all([user1, user2])
+    db_session.commit()
+
     # Endereços
     addr1 = Address(
         street="Rua A",
@@ -65,14 +74,14 @@ def setup_data(db_session):
 
     # Bancas
     banca1 = Banca(
-        supplier_id="user1",
+        supplier_id=user1.id,
         address_id=addr1.id,
         nome="Banca do João",
         descricao="Frutas frescas",
     )
 
     banca2 = Banca(
-        supplier_id="user2",
+        supplier_id=user2.id,
         address_id=addr2.id,
         nome="Banca da Maria",
         descricao="Hortaliças",
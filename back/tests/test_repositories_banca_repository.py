@@ -0,0 +1,89 @@
+"""
+Testes de remoção em cascata de bancas e fornecedores.
+
+Utiliza banco de dados isolado em memória, com chaves estrangeiras
+habilitadas.
+"""
+
+from sqlalchemy import event
+
+from src.core.unit_of_work import UnitOfWork
+from src.core.versioning import get_version
+from src.models.banca import Banca
+from src.models.produto_model import Produto
+from src.repositories.address_repository import AddressRepository
+from src.repositories.banca_repository import BancaRepository
+from src.repositories.produto_repository import ProdutoRepository
+from src.repositories.user_repository import UserRepository
+
+
+def _popular(db, bancas: int = 2, produtos: int = 50):
+    supplier = UserRepository(db).create_user("F", "f@test.com", "1", "supplier")
+    address = AddressRepository(db).create_address(
+        street="Rua A", city="C", state="UF", zip_code="000"
+    )
+    ids = []
+    for i in range(bancas):
+        banca = BancaRepository(db).create_banca(
+            supplier_id=supplier.id, address_id=address.id, nome=f"B{i}"
+        )
+        ProdutoRepository(db).bulk_create_produtos(
+            [
+                {"banca_id": banca.id, "nome": f"P{j}", "preco": 1.0}
+                for j in range(produtos)
+            ]
+        )
+        ids.append(banca.id)
+    db.commit()
+    return supplier.id, ids
+
+
+def _capturar_comandos(db):
+    comandos = []
+    event.listen(
+        db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: comandos.append(statement),
+    )
+    return comandos
+
+
+def test_delete_banca_remove_produtos_em_um_unico_comando(test_db):
+    _, (banca_id, outra_id) = _popular(test_db)
+    comandos = _capturar_comandos(test_db)
+
+    assert BancaRepository(test_db).delete_banca(banca_id) is True
+    test_db.commit()
+
+    assert [c for c in comandos if c.startswith("DELETE")] == [
+        "DELETE FROM bancas WHERE bancas.id = ? RETURNING id"
+    ]
+    assert not any(c.startswith("SELECT produtos") for c in comandos)
+    assert test_db.query(Produto).filter_by(banca_id=banca_id).count() == 0
+    assert test_db.query(Produto).filter_by(banca_id=outra_id).count() == 50
+
+
+def test_delete_banca_inexistente(test_db):
+    assert BancaRepository(test_db).delete_banca(999) is False
+
+
+def test_delete_fornecedor_remove_bancas_e_produtos(test_db):
+    supplier_id, _ = _popular(test_db)
+    comandos = _capturar_comandos(test_db)
+
+    assert UserRepository(test_db).delete_user(supplier_id) is True
+    test_db.commit()
+
+    assert len([c for c in comandos if c.startswith("DELETE")]) == 1
+    assert test_db.query(Banca).count() == 0
+    assert test_db.query(Produto).count() == 0
+
+
+def test_delete_banca_invalida_tabela_de_produtos(test_db):
+    _, (banca_id, _) = _popular(test_db)
+    versao = get_version(test_db, "produtos")
+
+    with UnitOfWork(test_db):
+        BancaRepository(test_db).delete_banca(banca_id)
+
+    assert get_version(test_db, "produtos") == versao + 1
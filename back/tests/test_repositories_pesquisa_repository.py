@@ -0,0 +1,47 @@
+"""
+Testes do repositório de pesquisas.
+
+Utiliza banco de dados isolado em memória.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from src.models.pesquisa import Pesquisa
+from src.repositories.pesquisa_repository import PesquisaRepository
+
+
+def test_registrar_pesquisa_com_timestamp_nativo(test_db):
+    repo = PesquisaRepository(test_db)
+
+    pesquisa = repo.registrar("tomate", latitude=-15.7, longitude=-47.8)
+
+    assert isinstance(pesquisa, Pesquisa)
+    assert isinstance(pesquisa.created_at, datetime)
+    assert pesquisa.created_at.tzinfo is not None
+
+
+def test_listar_periodo_filtra_por_intervalo(test_db):
+    repo = PesquisaRepository(test_db)
+    agora = datetime.now(timezone.utc)
+
+    antiga = Pesquisa(termo="antiga")
+    antiga.created_at = agora - timedelta(hours=3)
+    test_db.add(antiga)
+    test_db.flush()
+
+    repo.registrar("recente")
+
+    ultima_hora = repo.listar_periodo(agora - timedelta(hours=1))
+
+    assert [p.termo for p in ultima_hora] == ["recente"]
+    assert repo.contar_desde(agora - timedelta(hours=1)) == 1
+    assert repo.contar_desde(agora - timedelta(hours=4)) == 2
+
+
+def test_listar_periodo_com_fim(test_db):
+    repo = PesquisaRepository(test_db)
+    agora = datetime.now(timezone.utc)
+
+    repo.registrar("tomate")
+
+    assert repo.listar_periodo(agora - timedelta(hours=1), agora) == []
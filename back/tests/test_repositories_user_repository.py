@@ -5,6 +5,10 @@ Utiliza banco de dados isolado em memória.
 """
 
 import uuid
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import StatementError
 from src.models.user import User
 from src.repositories.user_repository import UserRepository
 
@@ -122,7 +126,7 @@ def test_update_user(test_db):
 def test_update_user_inexistente(test_db):
     repo = UserRepository(test_db)
 
-    resultado = repo.update_user("id_invalido", name="Teste")
+    resultado = repo.update_user(str(uuid.uuid4()), name="Teste")
     assert resultado is None
 
 
@@ -145,4 +149,63 @@ def test_delete_user(test_db):
 def test_delete_user_inexistente(test_db):
     repo = UserRepository(test_db)
 
-    repo.delete_user("id_que_nao_existe")
+    repo.delete_user(str(uuid.uuid4()))
+
+
+# --------------------------------------------------------------------
+# ROUND TRIPS
+# --------------------------------------------------------------------
+
+
+def _contar_comandos(test_db):
+    comandos = []
+    event.listen(
+        test_db.get_bind(),
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: comandos.append(statement),
+    )
+    return comandos
+
+
+def test_create_user_executa_um_unico_comando(test_db):
+    repo = UserRepository(test_db)
+    comandos = _contar_comandos(test_db)
+
+    repo.create_user("Eva", "eva@test.com", "123")
+
+    assert len(comandos) == 1
+    assert "RETURNING" in comandos[0]
+
+
+def test_update_user_executa_um_unico_comando(test_db):
+    repo = UserRepository(test_db)
+    user = repo.create_user("Fabio", "fabio@test.com", "123")
+    comandos = _contar_comandos(test_db)
+
+    repo.update_user(getattr(user, "id"), name="Fabio Souza")
+
+    assert len(comandos) == 1
+    assert comandos[0].startswith("UPDATE")
+
+
+# --------------------------------------------------------------------
+# ARMAZENAMENTO DO ID
+# --------------------------------------------------------------------
+
+
+def test_id_armazenado_em_16_bytes(test_db):
+    repo = UserRepository(test_db)
+    user = repo.create_user("Gil", "gil@test.com", "123")
+
+    tamanho = test_db.execute(text("SELECT length(id) FROM users")).scalar()
+
+    assert tamanho == 16
+    assert repo.get_by_id(getattr(user, "id").upper()) is not None
+
+
+def test_id_invalido_falha_em_vez_de_virar_null(test_db):
+    repo = UserRepository(test_db)
+    repo.create_user("Hugo", "hugo@test.com", "123")
+
+    with pytest.raises(StatementError):
+        repo.get_by_id("nao-e-um-uuid")
@@ -0,0 +1,94 @@
+"""
+Testes da fila de registros de pesquisa gravada em lotes (`SearchLog`).
+"""
+
+import threading
+
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.core.database import Base
+from src.models.pesquisa import Pesquisa
+from src.services.search_log import SearchLog
+
+
+def _fabrica(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'log.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def test_registros_acumulados_sao_gravados_em_lote(tmp_path):
+    engine, fabrica = _fabrica(tmp_path)
+    liberar = threading.Event()
+    inserts = []
+
+    def fabrica_lenta():
+        # Segura a primeira gravação até que todos estejam na fila.
+        liberar.wait(timeout=5)
+        return fabrica()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def contar(conn, cursor, statement, *args):
+        if statement.startswith("INSERT INTO pesquisas"):
+            inserts.append(statement)
+
+    log = SearchLog(fabrica_lenta, batch_size=50)
+    for i in range(20):
+        log.record(f"termo {i}", -25.4, -49.2)
+    liberar.set()
+    log.flush()
+
+    with fabrica() as db:
+        termos = db.scalars(select(Pesquisa.termo).order_by(Pesquisa.id)).all()
+
+    assert termos == [f"termo {i}" for i in range(20)]
+    assert log.pending() == 0
+    assert log.written == 20
+    # O primeiro registro pode seguir sozinho; os demais vão em um lote.
+    assert len(inserts) <= 2
+
+
+def test_lote_limitado_por_batch_size(tmp_path):
+    _, fabrica = _fabrica(tmp_path)
+    liberar = threading.Event()
+    lotes = []
+
+    def fabrica_lenta():
+        liberar.wait(timeout=5)
+        return fabrica()
+
+    log = SearchLog(fabrica_lenta, batch_size=3)
+    escrever = log._write
+    log._write = lambda batch: lotes.append(len(batch)) or escrever(batch)
+    for i in range(7):
+        log.record(f"t{i}")
+    liberar.set()
+    log.flush()
+
+    with fabrica() as db:
+        assert db.scalar(select(func.count()).select_from(Pesquisa)) == 7
+    assert max(lotes) <= 3
+
+
+def test_falha_na_gravacao_nao_interrompe_a_fila(tmp_path):
+    _, fabrica = _fabrica(tmp_path)
+    chamadas = []
+
+    def fabrica_instavel():
+        chamadas.append(1)
+        if len(chamadas) == 1:
+            raise RuntimeError("banco indisponível")
+        return fabrica()
+
+    log = SearchLog(fabrica_instavel)
+    log.record("perdido")
+    log.flush()
+    log.record("gravado")
+    log.flush()
+
+    with fabrica() as db:
+        assert db.scalars(select(Pesquisa.termo)).all() == ["gravado"]
+    assert log.failed == 1
@@ -5,6 +5,8 @@ Valida operações básicas de CRUD, tipos de usuário
 e impede criação de usuários com e-mail duplicado.
 """
 
+import uuid
+
 import pytest
 from src.services.user_service import UserService
 from src.repositories.user_repository import UserRepository
@@ -88,7 +90,7 @@ def test_service_get_user_inexistente(test_db):
     repo = UserRepository(test_db)
     service = UserService(repo)
 
-    result = service.get_user("nao-existe")
+    result = service.get_user(str(uuid.uuid4()))
     assert result is None
 
 
@@ -153,7 +155,7 @@ def test_service_update_user_inexistente(test_db):
     repo = UserRepository(test_db)
     service = UserService(repo)
 
-    result = service.update_user("nao-existe", UserUpdateDTO(name="X"))
+    result = service.update_user(str(uuid.uuid4()), UserUpdateDTO(name="X"))
     assert result is None
 
 
@@ -185,4 +187,4 @@ def test_service_delete_user_inexistente(test_db):
     repo = UserRepository(test_db)
     service = UserService(repo)
 
-    service.delete_user("nao-existe")
+    service.delete_user(str(uuid.uuid4()))